@@ -0,0 +1,56 @@
+"""
+Generate a synthetic social graph CSV in the layout of data/sample_medium.csv.
+
+Usage:
+    python benchmarks/generate_graph.py ba out.csv --nodes 1000000 --degree 10
+    python benchmarks/generate_graph.py er out.csv --nodes 1000000 --edges 10000000
+    python benchmarks/generate_graph.py sbm out.csv --nodes 1000000 --blocks 20 --p-in 1e-4 --p-out 1e-6
+    python benchmarks/generate_graph.py ws out.csv --nodes 1000000 --degree 20 --rewire 0.1
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from models import generators
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("model", choices=sorted(generators.GENERATORS))
+    parser.add_argument("output")
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000, help="er: number of edges")
+    parser.add_argument("--degree", type=int, default=10, help="ba: edges per node, ws: ring degree k")
+    parser.add_argument("--blocks", type=int, default=10, help="sbm: number of equal-sized blocks")
+    parser.add_argument("--p-in", type=float, default=1e-3, help="sbm: edge probability inside blocks")
+    parser.add_argument("--p-out", type=float, default=1e-5, help="sbm: edge probability between blocks")
+    parser.add_argument("--rewire", type=float, default=0.1, help="ws: rewiring probability")
+    parser.add_argument("--seed", type=int, default=37)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    if args.model == "er":
+        edges = generators.erdos_renyi(args.nodes, args.edges, args.seed)
+    elif args.model == "ba":
+        edges = generators.barabasi_albert(args.nodes, args.degree, args.seed)
+    elif args.model == "sbm":
+        sizes = [args.nodes // args.blocks] * args.blocks
+        sizes[-1] += args.nodes - sum(sizes)
+        edges = generators.stochastic_block(sizes, args.p_in, args.p_out, args.seed)
+    else:
+        edges = generators.watts_strogatz(args.nodes, args.degree, args.rewire, args.seed)
+    attributes = generators.node_attributes(args.nodes, edges, args.seed)
+    generated = time.perf_counter()
+
+    generators.write_csv(args.output, args.nodes, edges, attributes)
+    written = time.perf_counter()
+
+    print(f"Nodes: {args.nodes:,}  Edges: {len(edges):,}")
+    print(f"Generated in {generated - started:.2f}s, written in {written - generated:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
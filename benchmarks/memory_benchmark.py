@@ -0,0 +1,144 @@
+"""
+Memory benchmark: the original Graph layout vs the current slotted Graph
+and the compact FrozenGraph columns.
+
+Usage:
+    python benchmarks/memory_benchmark.py --nodes 100000 --edges 1000000
+"""
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from models.graph import Graph
+
+
+def random_edges(num_nodes: int, num_edges: int, seed: int) -> np.ndarray:
+    """Return unique undirected (u, v) pairs with u < v over IDs 1..num_nodes."""
+    rng = np.random.default_rng(seed)
+    pairs = rng.integers(1, num_nodes + 1, size=(int(num_edges * 1.1) + 16, 2))
+    pairs = pairs[pairs[:, 0] != pairs[:, 1]]
+    pairs.sort(axis=1)
+    pairs = np.unique(pairs, axis=0)
+    rng.shuffle(pairs)
+    return pairs[:num_edges]
+
+
+def measure(build):
+    """Run build() and return (result, bytes still allocated by it)."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, after - before
+
+
+class LegacyNode:
+    """Node as originally stored: instance __dict__, name string and own neighbor set."""
+
+    def __init__(self, node_id, name=None, activity=0.0, interaction=0, connection_count=0):
+        self.id = int(node_id)
+        self.name = name or f"User {self.id}"
+        self.activity = float(activity)
+        self.interaction = int(interaction)
+        self.connection_count = int(connection_count)
+        self.neighbors = set()
+
+
+class LegacyEdge:
+    """Edge as originally stored, with an instance __dict__."""
+
+    def __init__(self, u, v, weight=1.0):
+        self.u = int(u)
+        self.v = int(v)
+        self.weight = float(weight)
+
+
+def node_columns(num_nodes: int, seed: int):
+    rng = np.random.default_rng(seed)
+    return (
+        rng.random(num_nodes).tolist(),
+        rng.integers(0, 50, num_nodes).tolist(),
+        rng.integers(0, 20, num_nodes).tolist(),
+    )
+
+
+def build_legacy_graph(num_nodes: int, pairs: np.ndarray, seed: int) -> dict:
+    """
+    Rebuild the pre-change layout: nodes and edges dicts of __dict__
+    objects, adjacency as node_id -> set, and each neighbor set kept twice
+    (in adjacency and on the Node).
+    """
+    activity, interaction, connection_count = node_columns(num_nodes, seed)
+
+    nodes, edges, adjacency = {}, {}, {}
+    for i in range(num_nodes):
+        nodes[i + 1] = LegacyNode(
+            i + 1,
+            activity=activity[i],
+            interaction=interaction[i],
+            connection_count=connection_count[i],
+        )
+        adjacency[i + 1] = set()
+    for u, v in pairs.tolist():
+        edges[(u, v)] = LegacyEdge(u, v, 1.0 / (1.0 + abs(u - v)))
+        adjacency[u].add(v)
+        adjacency[v].add(u)
+        nodes[u].neighbors.add(v)
+        nodes[v].neighbors.add(u)
+    return {"nodes": nodes, "edges": edges, "adjacency": adjacency}
+
+
+def build_graph(num_nodes: int, pairs: np.ndarray, seed: int) -> Graph:
+    activity, interaction, connection_count = node_columns(num_nodes, seed)
+
+    graph = Graph()
+    for i in range(num_nodes):
+        graph.add_node(
+            i + 1,
+            activity=activity[i],
+            interaction=interaction[i],
+            connection_count=connection_count[i],
+        )
+    for u, v in pairs.tolist():
+        graph.add_edge(u, v, 1.0 / (1.0 + abs(u - v)))
+    return graph
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--edges", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=37)
+    args = parser.parse_args()
+
+    pairs = random_edges(args.nodes, args.edges, args.seed)
+
+    legacy, legacy_bytes = measure(lambda: build_legacy_graph(args.nodes, pairs, args.seed))
+    del legacy
+    graph, graph_bytes = measure(lambda: build_graph(args.nodes, pairs, args.seed))
+    frozen, frozen_bytes = measure(graph.freeze)
+
+    print(f"Nodes: {len(graph.nodes):,}  Edges: {len(graph.edges):,}")
+    print(f"{'layout':<34}{'total MiB':>12}{'bytes/edge':>14}{'vs original':>14}")
+    for label, size in (
+        ("Original Graph (dicts + objects)", legacy_bytes),
+        ("Graph (slotted objects)", graph_bytes),
+        ("FrozenGraph (CSR columns)", frozen_bytes),
+    ):
+        print(
+            f"{label:<34}{size / 2**20:>12.1f}{size / max(1, len(graph.edges)):>14.1f}"
+            f"{legacy_bytes / max(1, size):>13.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
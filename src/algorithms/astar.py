@@ -1,4 +1,4 @@
-import heapq
+from algorithms.priority_queue import IndexedHeap
 
 def heuristic(u, v):
     """
@@ -9,9 +9,15 @@ def heuristic(u, v):
     return 0.0
 
 
-def astar(graph, start_id, target_id):
+_zero_heuristic = heuristic
+
+
+def astar(graph, start_id, target_id, heuristic=None):
     """
     A* shortest path algorithm.
+    heuristic: optional h(node_id, target_id) lower bound on the remaining
+    distance, or a LandmarkIndex (checked against the graph first, raises
+    ValueError if stale). Defaults to the zero heuristic.
     Returns:
     - distances: dict[node -> cost]
     - previous: dict[node -> parent]
@@ -24,27 +30,39 @@ def astar(graph, start_id, target_id):
     if start_id not in graph.nodes or target_id not in graph.nodes:
         raise ValueError("Start or target node does not exist.")
 
+    if heuristic is None:
+        heuristic = _zero_heuristic
+    elif hasattr(heuristic, "heuristic_for"):
+        heuristic = heuristic.heuristic_for(graph)
+
     distances = {nid: float("inf") for nid in graph.nodes}
     previous = {nid: None for nid in graph.nodes}
     distances[start_id] = 0.0
 
-    pq = [(0.0, start_id)]
+    # Each node's estimate is computed once per search
+    estimates = {}
+    # Keyed by f-cost, one entry per queued node (decrease-key on improvement)
+    pq = IndexedHeap()
+    pq.push(start_id, 0.0)
 
     while pq:
-        current_f, u = heapq.heappop(pq)
+        current_f, u = pq.pop()
 
         if u == target_id:
             break
 
-        for v in graph.get_neighbors(u):
-            g_cost = distances[u] + graph.get_edge_weight(u, v)
-            h_cost = heuristic(v, target_id)
-            f_cost = g_cost + h_cost
+        for v, weight in graph.weighted_neighbors(u):
+            g_cost = distances[u] + weight
 
             if g_cost < distances[v]:
                 distances[v] = g_cost
                 previous[v] = u
-                heapq.heappush(pq, (f_cost, v))
+                h_cost = estimates.get(v)
+                if h_cost is None:
+                    h_cost = estimates[v] = heuristic(v, target_id)
+                # inf: the heuristic proves the target unreachable from v
+                if h_cost != float("inf"):
+                    pq.push(v, g_cost + h_cost)
 
     # reconstruct path
     return distances, previous, reconstruct_path(previous, start_id, target_id)
@@ -19,7 +19,7 @@ def bfs(graph, start_id):
         visited.append(current)
 
         # Process neighbors in sorted order for consistent output
-        for neighbor in sorted(graph.get_neighbors(current)):
+        for neighbor in sorted(graph.neighbors(current)):
             if neighbor not in seen:
                 seen.add(neighbor)
                 queue.append(neighbor)
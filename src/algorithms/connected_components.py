@@ -21,7 +21,7 @@ def connected_components(graph):
                 visited.add(u)
                 component.append(u)
 
-                for neighbor in graph.get_neighbors(u):
+                for neighbor in graph.neighbors(u):
                     if neighbor not in visited:
                         stack.append(neighbor)
 
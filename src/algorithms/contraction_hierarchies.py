@@ -0,0 +1,241 @@
+import heapq
+
+from algorithms.distance_index import DistanceIndex, graph_fingerprint
+from algorithms.priority_queue import IndexedHeap
+
+
+def _witness_search(overlay, source, skipped, targets, max_cost, settle_limit):
+    """
+    Local Dijkstra from source in the remaining graph, ignoring `skipped`.
+    Stops beyond max_cost, after settle_limit nodes, or once every target
+    is settled. Returns the distances found (upper bounds for unsettled nodes).
+    """
+    distances = {source: 0.0}
+    # Plain heapq with lazy deletion: these searches are tiny and numerous,
+    # and C-level heap pushes beat decrease-key here
+    pq = [(0.0, source)]
+    remaining = len(targets)
+    settled = 0
+    inf = float("inf")
+
+    while pq:
+        current_dist, u = heapq.heappop(pq)
+        if current_dist > distances[u]:
+            continue
+        if settled >= settle_limit:
+            break
+        settled += 1
+        if u in targets:
+            remaining -= 1
+            if not remaining:
+                break
+
+        for v, weight in overlay[u].items():
+            if v == skipped:
+                continue
+            new_dist = current_dist + weight
+            # Paths longer than max_cost cannot be witnesses
+            if new_dist <= max_cost and new_dist < distances.get(v, inf):
+                distances[v] = new_dist
+                heapq.heappush(pq, (new_dist, v))
+
+    return distances
+
+
+def _shortcuts(overlay, node, settle_limit):
+    """
+    Shortcuts needed to contract `node`: (u, w, cost) for every pair of
+    its neighbors whose shortest connection runs through it.
+    """
+    neighbors = list(overlay[node].items())
+    shortcuts = []
+    inf = float("inf")
+
+    for i, (u, to_u) in enumerate(neighbors):
+        targets = {w: to_u + to_w for w, to_w in neighbors[i + 1:]}
+        if not targets:
+            continue
+        witnesses = _witness_search(overlay, u, node, targets, max(targets.values()), settle_limit)
+        for w, cost in targets.items():
+            if witnesses.get(w, inf) > cost:
+                shortcuts.append((u, w, cost))
+
+    return shortcuts
+
+
+class ContractionHierarchy(DistanceIndex):
+    """
+    Contraction hierarchy for fast repeated shortest-path queries.
+
+    Preprocessing contracts nodes one by one in importance order (edge
+    difference plus contracted neighbors plus hierarchy level, updated
+    lazily).
+    Contracting a node adds a shortcut between two of its neighbors
+    whenever the only shortest connection between them runs through it,
+    which a bounded witness search checks. A query is then a
+    bidirectional Dijkstra that only follows edges towards more
+    important nodes, so it settles a handful of nodes however large the
+    graph is. Shortcuts remember the node they bypass, so paths unpack
+    to the original edges.
+
+    Validity against graph changes works as for LandmarkIndex (see
+    DistanceIndex.is_valid()); rebuild after edge or weight changes.
+    """
+
+    def __init__(self, rank, upward, middles, fingerprint):
+        super().__init__(fingerprint)
+        self.rank = rank        # node ID -> contraction order (higher = more important)
+        self.upward = upward    # node ID -> [(more important neighbor, weight)]
+        self.middles = middles  # (min, max) shortcut key -> bypassed node
+
+    @classmethod
+    def build(cls, graph, settle_limit=64):
+        """
+        Contract every node of the graph.
+        settle_limit bounds each witness search; lower values build faster
+        but add more (harmless) shortcuts.
+        """
+        # Remaining graph: original edges plus shortcuts between uncontracted nodes
+        overlay = {
+            u: {v: weight for v, weight in graph.weighted_neighbors(u) if v != u}
+            for u in graph.nodes
+        }
+        contracted_neighbors = dict.fromkeys(overlay, 0)
+        # Depth of a node in the hierarchy built so far
+        level = dict.fromkeys(overlay, 0)
+
+        def importance(node, shortcuts):
+            return len(shortcuts) - len(overlay[node]) + contracted_neighbors[node] + level[node]
+
+        # Start from the worst case (every neighbor pair needs a shortcut);
+        # the lazy update below replaces it with the real value before contracting
+        order = IndexedHeap()
+        for node in sorted(overlay):
+            degree = len(overlay[node])
+            order.push(node, degree * (degree - 1) // 2 - degree)
+
+        rank = {}
+        upward = {}
+        middles = {}
+
+        while order:
+            _, node = order.pop()
+
+            # Lazy update: contract only if the node is still the least important
+            shortcuts = _shortcuts(overlay, node, settle_limit)
+            priority = importance(node, shortcuts)
+            if order and priority > order.peek()[0]:
+                order.push(node, priority)
+                continue
+
+            rank[node] = len(rank)
+            neighbors = overlay.pop(node)
+            upward[node] = list(neighbors.items())
+            for u in neighbors:
+                del overlay[u][node]
+                contracted_neighbors[u] += 1
+                level[u] = max(level[u], level[node] + 1)
+
+            for u, w, cost in shortcuts:
+                if cost < overlay[u].get(w, float("inf")):
+                    overlay[u][w] = cost
+                    overlay[w][u] = cost
+                    middles[(u, w) if u < w else (w, u)] = node
+
+        hierarchy = cls(rank, upward, middles, graph_fingerprint(graph))
+        hierarchy._bind(graph)
+        return hierarchy
+
+    @property
+    def num_shortcuts(self):
+        return len(self.middles)
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def query(self, start_id, target_id):
+        """
+        Shortest path between two nodes.
+        Nodes unknown to the hierarchy (e.g. added after build()) are
+        treated as unreachable.
+        Returns:
+        - distance: shortest distance (inf if the target is unreachable)
+        - path: list of node IDs from start to target ([] if unreachable),
+          with shortcuts unpacked to original edges
+        """
+        start_id = int(start_id)
+        target_id = int(target_id)
+        inf = float("inf")
+        if start_id not in self.rank or target_id not in self.rank:
+            return (0.0, [start_id]) if start_id == target_id else (inf, [])
+
+        upward = self.upward
+        distances = ({start_id: 0.0}, {target_id: 0.0})  # forward, backward
+        previous = ({start_id: None}, {target_id: None})
+        queues = (IndexedHeap(), IndexedHeap())
+        queues[0].push(start_id, 0.0)
+        queues[1].push(target_id, 0.0)
+        best = inf
+        meeting = None
+
+        while queues[0] or queues[1]:
+            # Expand the side with the smaller frontier; stop once neither can improve best
+            forward_top = queues[0].peek()[0] if queues[0] else inf
+            backward_top = queues[1].peek()[0] if queues[1] else inf
+            side = 0 if forward_top <= backward_top else 1
+            if min(forward_top, backward_top) >= best:
+                break
+
+            current_dist, u = queues[side].pop()
+            own, other = distances[side], distances[1 - side]
+            if u in other and current_dist + other[u] < best:
+                best = current_dist + other[u]
+                meeting = u
+
+            for v, weight in upward[u]:
+                new_dist = current_dist + weight
+                if new_dist < own.get(v, inf):
+                    own[v] = new_dist
+                    previous[side][v] = u
+                    queues[side].push(v, new_dist)
+
+        if meeting is None:
+            return inf, []
+
+        # Hierarchy path: start ... meeting ... target
+        hops = []
+        current = meeting
+        while current is not None:
+            hops.append(current)
+            current = previous[0][current]
+        hops.reverse()
+        current = previous[1][meeting]
+        while current is not None:
+            hops.append(current)
+            current = previous[1][current]
+
+        path = [start_id]
+        for u, v in zip(hops, hops[1:]):
+            self._unpack(u, v, path)
+        return best, path
+
+    def distance(self, start_id, target_id):
+        """Shortest distance between two nodes (inf if unreachable)."""
+        return self.query(start_id, target_id)[0]
+
+    def _unpack(self, u, v, path):
+        """Append the original nodes after u on the edge u -> v to path."""
+        middles = self.middles
+        stack = [(u, v)]
+        while stack:
+            a, b = stack.pop()
+            middle = middles.get((a, b) if a < b else (b, a))
+            if middle is None:
+                path.append(b)
+            else:
+                stack.append((middle, b))
+                stack.append((a, middle))
+
+    def __repr__(self):
+        return f"ContractionHierarchy(nodes={len(self.rank)}, shortcuts={self.num_shortcuts})"
@@ -7,7 +7,7 @@ def degree_centrality(graph, top_n=5):
     degrees = []
 
     for node_id, node in graph.nodes.items():
-        degree = len(graph.get_neighbors(node_id))
+        degree = graph.degree(node_id)
         degrees.append((node_id, degree))
 
     # Sort by degree (descending), then by node ID (ascending)
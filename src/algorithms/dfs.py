@@ -22,7 +22,7 @@ def dfs(graph, start_id):
 
         # Add neighbors in reverse sorted order 
         # so that the smallest neighbor is processed first
-        for neighbor in sorted(graph.get_neighbors(current), reverse=True):
+        for neighbor in sorted(graph.neighbors(current), reverse=True):
             if neighbor not in seen:
                 stack.append(neighbor)
 
@@ -1,8 +1,11 @@
-import heapq
+from algorithms.priority_queue import IndexedHeap, make_queue
 
-def dijkstra(graph, start_id):
+def dijkstra(graph, start_id, bucket_width=None):
     """
     Dijkstra shortest path algorithm.
+    bucket_width: use a BucketQueue with this width instead of the default
+    IndexedHeap; must not exceed the smallest edge weight (see
+    priority_queue.min_edge_weight).
     Returns:
     - distances: dict[node_id -> shortest distance]
     - previous: dict[node_id -> previous node for path reconstruction]
@@ -17,29 +20,123 @@ def dijkstra(graph, start_id):
     previous = {node_id: None for node_id in graph.nodes}
     distances[start_id] = 0.0
 
-    # Min-heap priority queue
-    pq = [(0.0, start_id)]
+    # Priority queue with decrease-key: one entry per queued node
+    pq = make_queue(bucket_width)
+    pq.push(start_id, 0.0)
 
     while pq:
-        current_dist, u = heapq.heappop(pq)
-
-        # Skip outdated entries
-        if current_dist > distances[u]:
-            continue
+        current_dist, u = pq.pop()
 
         # Relaxation step
-        for v in graph.get_neighbors(u):
-            weight = graph.get_edge_weight(u, v)
+        for v, weight in graph.weighted_neighbors(u):
             new_dist = current_dist + weight
 
             if new_dist < distances[v]:
                 distances[v] = new_dist
                 previous[v] = u
-                heapq.heappush(pq, (new_dist, v))
+                pq.push(v, new_dist)
 
     return distances, previous
 
 
+def dijkstra_to(graph, start_id, target_id, bucket_width=None):
+    """
+    Point-to-point Dijkstra: stops as soon as the target is settled.
+    Only nodes the search reached get an entry, so the cost depends on
+    how far the target is rather than on the size of the graph.
+    bucket_width: as in dijkstra().
+    Returns:
+    - distances: dict[node_id -> distance] for reached nodes (final for
+      settled nodes, including the target; missing means not reached)
+    - previous: dict[node_id -> previous node] for reached nodes
+    """
+
+    start_id = int(start_id)
+    target_id = int(target_id)
+    if start_id not in graph.nodes or target_id not in graph.nodes:
+        raise ValueError("Start or target node does not exist.")
+
+    distances = {start_id: 0.0}
+    previous = {start_id: None}
+    pq = make_queue(bucket_width)
+    pq.push(start_id, 0.0)
+    inf = float("inf")
+
+    while pq:
+        current_dist, u = pq.pop()
+
+        if u == target_id:
+            break
+
+        for v, weight in graph.weighted_neighbors(u):
+            new_dist = current_dist + weight
+
+            if new_dist < distances.get(v, inf):
+                distances[v] = new_dist
+                previous[v] = u
+                pq.push(v, new_dist)
+
+    return distances, previous
+
+
+def bidirectional_dijkstra(graph, start_id, target_id):
+    """
+    Point-to-point Dijkstra searching from both ends until they meet.
+    Each step expands the side whose frontier is closer; the search stops
+    once the two frontier distances add up to the best path found, so
+    only nodes around the two balls are touched.
+    Returns:
+    - distance: shortest distance (inf if the target is unreachable)
+    - path: list of node IDs from start to target ([] if unreachable)
+    """
+
+    start_id = int(start_id)
+    target_id = int(target_id)
+    if start_id not in graph.nodes or target_id not in graph.nodes:
+        raise ValueError("Start or target node does not exist.")
+    if start_id == target_id:
+        return 0.0, [start_id]
+
+    inf = float("inf")
+    distances = ({start_id: 0.0}, {target_id: 0.0})  # forward, backward
+    previous = ({start_id: None}, {target_id: None})
+    queues = (IndexedHeap(), IndexedHeap())
+    queues[0].push(start_id, 0.0)
+    queues[1].push(target_id, 0.0)
+    best = inf
+    meeting = None
+
+    while queues[0] and queues[1]:
+        forward_top = queues[0].peek()[0]
+        backward_top = queues[1].peek()[0]
+        if forward_top + backward_top >= best:
+            break
+
+        side = 0 if forward_top <= backward_top else 1
+        current_dist, u = queues[side].pop()
+        own, other = distances[side], distances[1 - side]
+
+        for v, weight in graph.weighted_neighbors(u):
+            new_dist = current_dist + weight
+
+            if new_dist < own.get(v, inf):
+                own[v] = new_dist
+                previous[side][v] = u
+                queues[side].push(v, new_dist)
+
+                # A path through v exists if the other side reached it too
+                if v in other and new_dist + other[v] < best:
+                    best = new_dist + other[v]
+                    meeting = v
+
+    if meeting is None:
+        return inf, []
+
+    forward = reconstruct_path(previous[0], start_id, meeting)
+    backward = reconstruct_path(previous[1], target_id, meeting)
+    return best, forward + backward[-2::-1]
+
+
 def reconstruct_path(previous, start_id, target_id):
     """
     Reconstruct the shortest path using the 'previous' dictionary.
@@ -51,7 +148,7 @@ def reconstruct_path(previous, start_id, target_id):
 
     while current is not None:
         path.append(current)
-        current = previous[current]
+        current = previous.get(current)  # sparse maps may lack unreached nodes
 
     path.reverse()
 
@@ -0,0 +1,80 @@
+import hashlib
+import weakref
+
+import numpy as np
+
+from models.frozen_graph import FrozenGraph
+from models.journal import NODE_ADDED, NODE_UPDATED
+
+# Journal kinds that never change a shortest path distance: new nodes start
+# isolated, and weight changes caused by attribute updates are journaled separately
+_DISTANCE_PRESERVING = (NODE_ADDED, NODE_UPDATED)
+
+
+def graph_fingerprint(graph):
+    """
+    SHA-256 of a graph's edge structure (sorted edges and their weights).
+    Two graphs with the same fingerprint have the same distances; isolated
+    nodes do not count.
+    """
+    digest = hashlib.sha256()
+    for u in sorted(graph.nodes):
+        edges = sorted((v, w) for v, w in graph.weighted_neighbors(u) if v > u)
+        if edges:
+            digest.update(np.array([u, len(edges)], dtype=np.int64).tobytes())
+            digest.update(np.array([v for v, _ in edges], dtype=np.int64).tobytes())
+            digest.update(np.array([w for _, w in edges], dtype=np.float64).tobytes())
+    return digest.hexdigest()
+
+
+class DistanceIndex:
+    """
+    Base class of shortest-path preprocessing tied to one graph state
+    (LandmarkIndex, ContractionHierarchy).
+
+    An index stays valid while the graph only gains nodes or gets node
+    attribute changes that leave weights alone; any edge or weight change
+    invalidates it. Subclasses call __init__ with the graph's fingerprint
+    and _bind() the graph they were built from.
+    """
+
+    def __init__(self, fingerprint):
+        self.fingerprint = fingerprint
+        self._graph = None
+        self._version = None
+
+    def _bind(self, graph):
+        """Remember the graph state this index was checked against."""
+        self._graph = weakref.ref(graph)
+        self._version = getattr(graph, "version", None)
+
+    # ------------------------------------------------------------------
+    # Validity
+    # ------------------------------------------------------------------
+
+    def is_valid(self, graph):
+        """
+        Return True if the stored distances still hold for the graph.
+        For the graph the index was built or checked against this uses
+        graph.version and the change journal; otherwise (or when the
+        journal no longer covers the changes) the edge fingerprint is
+        recomputed and compared. Views report the version of the graph they
+        follow; graphs with no version at all take the fingerprint path.
+        """
+        if self._graph is not None and self._graph() is graph:
+            if isinstance(graph, FrozenGraph):
+                return True  # never changes
+            version = getattr(graph, "version", None)
+            if version is not None and version == self._version:
+                return True
+            changes = graph.changes_since(self._version) if hasattr(graph, "changes_since") else None
+            if changes is not None:
+                if all(change.kind in _DISTANCE_PRESERVING for change in changes):
+                    self._version = version
+                    return True
+                return False
+
+        if graph_fingerprint(graph) != self.fingerprint:
+            return False
+        self._bind(graph)
+        return True
@@ -0,0 +1,184 @@
+import numpy as np
+
+from algorithms.dijkstra import dijkstra
+from algorithms.distance_index import DistanceIndex, graph_fingerprint
+
+LANDMARK_METHODS = ("farthest", "degree")
+
+
+def _distance_row(graph, ids, landmark):
+    """Distances from one landmark to every node, in the order of ids."""
+    distances, _ = dijkstra(graph, landmark)
+    return np.fromiter((distances[nid] for nid in ids.tolist()), dtype=np.float64, count=len(ids))
+
+
+def select_landmarks(graph, k=8, method="farthest"):
+    """
+    Pick up to k landmark nodes.
+    - "farthest": start from the highest-degree node, then repeatedly take
+      the node farthest from every landmark chosen so far (unreachable
+      nodes first, so every component gets a landmark)
+    - "degree": the k highest-degree nodes
+    Returns:
+    - landmarks: list[node_id]
+    - rows: list of distance arrays (sorted node ID order) for "farthest",
+      None for "degree"
+    """
+    if method not in LANDMARK_METHODS:
+        raise ValueError(f"Unknown landmark method: {method!r}")
+    # Highest degree first, ties broken by the smaller ID
+    by_degree = sorted(graph.nodes, key=lambda nid: (-graph.degree(nid), nid))
+    if method == "degree":
+        return by_degree[:k], None
+    if not by_degree or k < 1:
+        return [], []
+
+    ids = np.array(sorted(graph.nodes), dtype=np.int64)
+    landmarks, rows = [], []
+    nearest = _distance_row(graph, ids, by_degree[0])
+
+    while len(landmarks) < k:
+        if landmarks:
+            nearest = np.minimum(nearest, rows[-1])
+        position = int(np.argmax(nearest))
+        if landmarks and nearest[position] == 0.0:
+            break  # every node is already a landmark
+        landmarks.append(int(ids[position]))
+        rows.append(_distance_row(graph, ids, landmarks[-1]))
+
+    return landmarks, rows
+
+
+class LandmarkIndex(DistanceIndex):
+    """
+    ALT (A*, landmarks, triangle inequality) preprocessing for astar().
+
+    Stores the distances from a few landmark nodes to every node. For an
+    undirected graph d(u, t) >= |d(L, t) - d(L, u)| for every landmark L,
+    so the largest such difference is an admissible (and consistent)
+    A* heuristic.
+
+    The index belongs to one graph state. It stays valid while the graph
+    only gains nodes or node attribute changes that leave weights alone;
+    any edge or weight change invalidates it (see is_valid()). An index
+    can be saved next to the graph file and reloaded; loaded indexes are
+    checked against the graph's edge fingerprint.
+    """
+
+    def __init__(self, ids, landmarks, distances, fingerprint, method="farthest", k=None):
+        super().__init__(fingerprint)
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.landmarks = [int(nid) for nid in landmarks]
+        # (num_nodes, k): one contiguous row of landmark distances per node
+        self.distances = np.ascontiguousarray(distances, dtype=np.float64)
+        # Same with NaN for unreachable, so differences never compute inf - inf
+        self._finite = np.where(np.isinf(self.distances), np.nan, self.distances)
+        self.method = method
+        self.k = len(self.landmarks) if k is None else int(k)
+        self._position = {nid: i for i, nid in enumerate(self.ids.tolist())}
+
+    @classmethod
+    def build(cls, graph, k=8, method="farthest"):
+        """Select landmarks and compute their distance arrays."""
+        landmarks, rows = select_landmarks(graph, k, method)
+        ids = np.array(sorted(graph.nodes), dtype=np.int64)
+        if rows is None:
+            rows = [_distance_row(graph, ids, landmark) for landmark in landmarks]
+        distances = np.column_stack(rows) if rows else np.empty((len(ids), 0))
+        index = cls(ids, landmarks, distances, graph_fingerprint(graph), method, k)
+        index._bind(graph)
+        return index
+
+    # ------------------------------------------------------------------
+    # Heuristic
+    # ------------------------------------------------------------------
+
+    def lower_bound(self, u, v):
+        """
+        Triangle-inequality lower bound on the distance between u and v.
+        inf means the landmarks prove v unreachable from u; nodes unknown
+        to the index get 0.0.
+        """
+        i = self._position.get(u)
+        j = self._position.get(v)
+        if i is None or j is None or not self.landmarks:
+            return 0.0
+        a = self._finite[i]
+        b = self._finite[j]
+        # A landmark reaching exactly one of the two separates their components
+        if (np.isnan(a) != np.isnan(b)).any():
+            return float("inf")
+        # Landmarks reaching neither give NaN, which fmax ignores
+        bound = float(np.fmax.reduce(np.abs(b - a)))
+        return bound if bound == bound else 0.0
+
+    def heuristic(self, u, v):
+        """A* heuristic with the signature of algorithms.astar.heuristic."""
+        return self.lower_bound(u, v)
+
+    def heuristic_for(self, graph):
+        """
+        Return the heuristic for astar() on this graph.
+        Raises ValueError if the graph changed in a way that invalidates it.
+        """
+        if not self.is_valid(graph):
+            raise ValueError("Landmark index is stale; rebuild it for the current graph.")
+        return self.heuristic
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path):
+        """Write the index as an uncompressed .npz file."""
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                ids=self.ids,
+                landmarks=np.array(self.landmarks, dtype=np.int64),
+                distances=self.distances,
+                fingerprint=np.array(self.fingerprint),
+                method=np.array(self.method),
+                k=np.array(self.k, dtype=np.int64),
+            )
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["ids"],
+                data["landmarks"],
+                data["distances"],
+                str(data["fingerprint"]),
+                str(data["method"]),
+                int(data["k"]),
+            )
+
+    def __repr__(self):
+        return f"LandmarkIndex(landmarks={self.landmarks}, nodes={len(self.ids)})"
+
+
+def landmark_path(graph_path):
+    """Path of the landmark index stored alongside a graph file."""
+    return graph_path + ".landmarks.npz"
+
+
+def load_or_build_landmarks(graph, graph_path, k=8, method="farthest"):
+    """
+    Return the landmark index saved next to graph_path if it was built
+    with the same k and method and still matches the graph, otherwise
+    build a new one and save it there.
+    """
+    path = landmark_path(graph_path)
+    try:
+        index = LandmarkIndex.load(path)
+    except (OSError, ValueError, KeyError):
+        index = None
+
+    if index is not None and (index.k, index.method) == (k, method) and index.is_valid(graph):
+        return index
+
+    index = LandmarkIndex.build(graph, k, method)
+    index.save(path)
+    return index
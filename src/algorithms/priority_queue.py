@@ -0,0 +1,217 @@
+import heapq
+import math
+
+
+class IndexedHeap:
+    """
+    Binary min-heap of unique items with decrease-key.
+
+    Every item is in the heap at most once; push() on an item that is
+    already queued lowers its priority in place instead of adding a
+    duplicate entry. The heap therefore never grows beyond the number of
+    queued items (O(V) for Dijkstra rather than O(E)) and pop() never
+    returns outdated entries.
+    """
+
+    __slots__ = ("_priorities", "_items", "_position")
+
+    def __init__(self):
+        self._priorities = []
+        self._items = []
+        self._position = {}  # item -> index in the heap arrays
+
+    def __len__(self):
+        return len(self._items)
+
+    def __bool__(self):
+        return bool(self._items)
+
+    def __contains__(self, item):
+        return item in self._position
+
+    def priority(self, item):
+        """Return the queued priority of an item (KeyError if not queued)."""
+        return self._priorities[self._position[item]]
+
+    def peek(self):
+        """Return (priority, item) of the minimum without removing it."""
+        if not self._items:
+            raise IndexError("peek from an empty heap")
+        return self._priorities[0], self._items[0]
+
+    def push(self, item, priority):
+        """
+        Queue an item, or lower its priority if it is already queued.
+        Returns False (and changes nothing) if the item is queued with a
+        priority that is not higher.
+        """
+        priorities, items, position = self._priorities, self._items, self._position
+
+        i = position.get(item)
+        if i is None:
+            i = len(items)
+            priorities.append(priority)
+            items.append(item)
+        elif priority < priorities[i]:
+            pass
+        else:
+            return False
+
+        # Sift up
+        while i:
+            parent = (i - 1) >> 1
+            parent_priority = priorities[parent]
+            if parent_priority <= priority:
+                break
+            priorities[i] = parent_priority
+            parent_item = items[parent]
+            items[i] = parent_item
+            position[parent_item] = i
+            i = parent
+        priorities[i] = priority
+        items[i] = item
+        position[item] = i
+        return True
+
+    def pop(self):
+        """Remove and return (priority, item) with the smallest priority."""
+        priorities, items, position = self._priorities, self._items, self._position
+        if not items:
+            raise IndexError("pop from an empty heap")
+
+        top_priority, top_item = priorities[0], items[0]
+        del position[top_item]
+        priority = priorities.pop()
+        item = items.pop()
+        size = len(items)
+        if not size:
+            return top_priority, top_item
+
+        # Move the hole at the root down to a leaf along the smaller
+        # children, then sift the last entry up from there (as heapq does;
+        # fewer comparisons than a plain sift-down)
+        i = 0
+        child = 1
+        while child < size:
+            right = child + 1
+            if right < size and priorities[right] < priorities[child]:
+                child = right
+            priorities[i] = priorities[child]
+            child_item = items[child]
+            items[i] = child_item
+            position[child_item] = i
+            i = child
+            child = 2 * i + 1
+        while i:
+            parent = (i - 1) >> 1
+            parent_priority = priorities[parent]
+            if parent_priority <= priority:
+                break
+            priorities[i] = parent_priority
+            parent_item = items[parent]
+            items[i] = parent_item
+            position[parent_item] = i
+            i = parent
+        priorities[i] = priority
+        items[i] = item
+        position[item] = i
+        return top_priority, top_item
+
+
+class BucketQueue:
+    """
+    Monotone bucket queue (Dial's algorithm generalised to real weights).
+
+    Priorities are grouped into buckets of width `bucket_width`. When no
+    edge weight is smaller than the width, a node popped from the lowest
+    bucket can no longer be improved by any node still queued, so
+    Dijkstra stays exact although items within a bucket come out in
+    arbitrary order. Pushes and decrease-keys are O(1); only the indices
+    of non-empty buckets are kept in a small heap. Priorities must never
+    drop below the bucket being popped (true for Dijkstra with
+    non-negative weights).
+    """
+
+    __slots__ = ("bucket_width", "_buckets", "_bucket_heap", "_bucket_of", "_current", "_size")
+
+    def __init__(self, bucket_width):
+        if not bucket_width > 0 or math.isinf(bucket_width):
+            raise ValueError("bucket_width must be a positive finite number.")
+        self.bucket_width = float(bucket_width)
+        self._buckets = {}      # bucket index -> {item: priority}
+        self._bucket_heap = []  # indices of non-empty buckets
+        self._bucket_of = {}    # item -> bucket index
+        self._current = None    # bucket being drained
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return bool(self._size)
+
+    def __contains__(self, item):
+        return item in self._bucket_of
+
+    def priority(self, item):
+        """Return the queued priority of an item (KeyError if not queued)."""
+        return self._buckets[self._bucket_of[item]][item]
+
+    def push(self, item, priority):
+        """
+        Queue an item, or lower its priority if it is already queued.
+        Returns False (and changes nothing) if the item is queued with a
+        priority that is not higher.
+        """
+        old = self._bucket_of.get(item)
+        if old is not None:
+            if priority >= self._buckets[old][item]:
+                return False
+            del self._buckets[old][item]
+        else:
+            self._size += 1
+
+        index = int(priority / self.bucket_width)
+        bucket = self._buckets.get(index)
+        if bucket is None:
+            bucket = self._buckets[index] = {}
+            heapq.heappush(self._bucket_heap, index)
+        bucket[item] = priority
+        self._bucket_of[item] = index
+        return True
+
+    def pop(self):
+        """Remove and return (priority, item) from the lowest non-empty bucket."""
+        if not self._size:
+            raise IndexError("pop from an empty queue")
+
+        buckets = self._buckets
+        while True:
+            index = self._current
+            if index is None:
+                index = self._current = self._bucket_heap[0]
+            bucket = buckets[index]
+            if bucket:
+                break
+            # Drained: forget it and move to the next non-empty bucket
+            heapq.heappop(self._bucket_heap)
+            del buckets[index]
+            self._current = None
+
+        item, priority = bucket.popitem()
+        del self._bucket_of[item]
+        self._size -= 1
+        return priority, item
+
+
+def min_edge_weight(graph):
+    """Smallest edge weight of a graph (inf if it has no edges)."""
+    return min(
+        (weight for u in graph.nodes for _, weight in graph.weighted_neighbors(u)),
+        default=float("inf"),
+    )
+
+
+def make_queue(bucket_width=None):
+    """IndexedHeap by default, or a BucketQueue when a bucket width is given."""
+    return IndexedHeap() if bucket_width is None else BucketQueue(bucket_width)
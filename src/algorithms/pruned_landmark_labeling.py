@@ -0,0 +1,216 @@
+import heapq
+from collections import deque
+
+import numpy as np
+
+from algorithms.distance_index import DistanceIndex, graph_fingerprint
+
+
+def _pruned_search(adjacency, root, labels, weighted):
+    """
+    BFS (or Dijkstra if weighted) from root that skips every node whose
+    distance the existing labels already answer, adding (root, distance,
+    parent) to the label of each node it does settle.
+    """
+    hubs, dists, parents = labels
+    inf = float("inf")
+
+    # Distances from root to its own hubs, for the pruning test
+    root_hub = {hub: dist for hub, dist in zip(hubs[root], dists[root])}
+    root_hub[root] = 0
+
+    distances = {root: 0}
+    previous = {root: -1}
+    if weighted:
+        pq = [(0.0, root)]
+        pop = heapq.heappop
+    else:
+        queue = deque([root])
+
+    while pq if weighted else queue:
+        if weighted:
+            d, u = pop(pq)
+            if d > distances[u]:
+                continue
+        else:
+            u = queue.popleft()
+            d = distances[u]
+
+        # Prune: a hub processed earlier already gives a path this short
+        if u != root and any(
+            dist + root_hub.get(hub, inf) <= d for hub, dist in zip(hubs[u], dists[u])
+        ):
+            continue
+        hubs[u].append(root)
+        dists[u].append(d)
+        parents[u].append(previous[u])
+
+        for v, weight in adjacency[u]:
+            # Nodes ranked before root were hubs of earlier searches
+            if v < root:
+                continue
+            if weighted:
+                new_dist = d + weight
+                if new_dist < distances.get(v, inf):
+                    distances[v] = new_dist
+                    previous[v] = u
+                    heapq.heappush(pq, (new_dist, v))
+            elif v not in distances:
+                distances[v] = d + 1
+                previous[v] = u
+                queue.append(v)
+
+
+class PrunedLandmarkLabeling(DistanceIndex):
+    """
+    Exact distance oracle built with pruned landmark labeling.
+
+    Nodes are ranked by degree (highest first) and every node gets a
+    label: a list of (hub, distance, parent) entries. Searches run from
+    each node in rank order and stop expanding wherever the labels built
+    so far already give the exact distance, so on low-diameter
+    small-world graphs labels stay short. Then for any two nodes
+    d(u, v) = min over common hubs h of d(u, h) + d(h, v).
+
+    distance() and path() read only the labels, never the graph; parent
+    entries lead from a node back to each of its hubs. weighted=False
+    counts hops (BFS), weighted=True uses the edge weights. The index is
+    stored as flat arrays and can be saved and loaded per snapshot;
+    validity against graph changes works as for LandmarkIndex (see
+    DistanceIndex.is_valid()).
+    """
+
+    def __init__(self, ids, offsets, hubs, distances, parents, weighted, fingerprint):
+        super().__init__(fingerprint)
+        self.ids = np.asarray(ids, dtype=np.int64)  # rank -> node ID
+        self.offsets = np.asarray(offsets, dtype=np.int64)  # rank -> start of its label
+        self.hubs = np.asarray(hubs, dtype=np.int64)  # hub ranks, sorted within a label
+        self.distances = np.asarray(distances, dtype=np.float64)
+        self.parents = np.asarray(parents, dtype=np.int64)  # previous rank towards the hub, -1 at the hub
+        self.weighted = bool(weighted)
+        self._rank = {nid: i for i, nid in enumerate(self.ids.tolist())}
+
+    @classmethod
+    def build(cls, graph, weighted=False):
+        """Rank nodes by degree and run the pruned searches."""
+        ids = sorted(graph.nodes, key=lambda nid: (-graph.degree(nid), nid))
+        rank = {nid: i for i, nid in enumerate(ids)}
+        adjacency = [
+            [(rank[v], weight) for v, weight in graph.weighted_neighbors(u)]
+            for u in ids
+        ]
+
+        labels = ([[] for _ in ids], [[] for _ in ids], [[] for _ in ids])
+        for root in range(len(ids)):
+            _pruned_search(adjacency, root, labels, weighted)
+
+        hubs, dists, parents = labels
+        offsets = np.zeros(len(ids) + 1, dtype=np.int64)
+        np.cumsum([len(label) for label in hubs], out=offsets[1:])
+        index = cls(
+            ids,
+            offsets,
+            [hub for label in hubs for hub in label],
+            [dist for label in dists for dist in label],
+            [parent for label in parents for parent in label],
+            weighted,
+            graph_fingerprint(graph),
+        )
+        index._bind(graph)
+        return index
+
+    @property
+    def average_label_size(self):
+        return len(self.hubs) / len(self.ids) if len(self.ids) else 0.0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _label(self, i):
+        start, end = self.offsets[i], self.offsets[i + 1]
+        return self.hubs[start:end], self.distances[start:end], start
+
+    def _best_hub(self, u, v):
+        """Return (distance, hub, entry of u, entry of v); hub is -1 if unreachable."""
+        hubs_u, dists_u, start_u = self._label(u)
+        hubs_v, dists_v, start_v = self._label(v)
+        _, at_u, at_v = np.intersect1d(hubs_u, hubs_v, assume_unique=True, return_indices=True)
+        if not len(at_u):
+            return float("inf"), -1, -1, -1
+        totals = dists_u[at_u] + dists_v[at_v]
+        best = int(np.argmin(totals))
+        return float(totals[best]), int(hubs_u[at_u[best]]), start_u + at_u[best], start_v + at_v[best]
+
+    def _ranks(self, u, v):
+        try:
+            return self._rank[int(u)], self._rank[int(v)]
+        except KeyError:
+            raise ValueError("Node is not in the index.") from None
+
+    def distance(self, u, v):
+        """Shortest distance between u and v (hops if unweighted, inf if unreachable)."""
+        i, j = self._ranks(u, v)
+        distance = self._best_hub(i, j)[0]
+        return distance if self.weighted or distance == float("inf") else int(distance)
+
+    def path(self, u, v):
+        """
+        Shortest path from u to v as a list of node IDs ([] if unreachable),
+        rebuilt from the parent entries of the labels.
+        """
+        i, j = self._ranks(u, v)
+        _, hub, entry_u, entry_v = self._best_hub(i, j)
+        if hub < 0:
+            return []
+        to_hub = self._walk_to_hub(i, hub, entry_u)
+        from_hub = self._walk_to_hub(j, hub, entry_v)
+        ranks = to_hub + from_hub[-2::-1]
+        return self.ids[ranks].tolist()
+
+    def _walk_to_hub(self, i, hub, entry):
+        """Ranks from i to hub, following parent entries of the hub."""
+        walk = [i]
+        parent = int(self.parents[entry])
+        while parent >= 0:
+            walk.append(parent)
+            hubs, _, start = self._label(parent)
+            entry = start + int(np.searchsorted(hubs, hub))
+            parent = int(self.parents[entry])
+        return walk
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, path):
+        """Write the index as an uncompressed .npz file."""
+        with open(path, "wb") as f:
+            np.savez(
+                f,
+                ids=self.ids,
+                offsets=self.offsets,
+                hubs=self.hubs,
+                distances=self.distances,
+                parents=self.parents,
+                weighted=np.array(self.weighted),
+                fingerprint=np.array(self.fingerprint),
+            )
+
+    @classmethod
+    def load(cls, path):
+        """Read an index written by save()."""
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data["ids"],
+                data["offsets"],
+                data["hubs"],
+                data["distances"],
+                data["parents"],
+                bool(data["weighted"]),
+                str(data["fingerprint"]),
+            )
+
+    def __repr__(self):
+        kind = "weighted" if self.weighted else "unweighted"
+        return f"PrunedLandmarkLabeling({kind}, nodes={len(self.ids)}, average_label_size={self.average_label_size:.1f})"
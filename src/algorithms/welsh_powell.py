@@ -7,7 +7,7 @@ def welsh_powell(graph):
     # Step 1: sort nodes by degree (descending)
     nodes_sorted = sorted(
         graph.nodes.keys(),
-        key=lambda nid: len(graph.get_neighbors(nid)),
+        key=graph.degree,
         reverse=True
     )
 
@@ -16,7 +16,7 @@ def welsh_powell(graph):
     # Step 2: assign colors
     for node in nodes_sorted:
         # find used colors among neighbors
-        neighbor_colors = {color_of[n] for n in graph.get_neighbors(node) if n in color_of}
+        neighbor_colors = {color_of[n] for n in graph.neighbors(node) if n in color_of}
 
         # find the lowest available color
         color = 0
@@ -0,0 +1,45 @@
+from dataclasses import dataclass, field
+from typing import List, Set, Tuple
+
+from .journal import EDGE_ADDED, EDGE_REMOVED, NODE_ADDED, NODE_REMOVED, NODE_UPDATED
+
+
+# Operations accepted in the op column of a delta file (same names as the journal kinds)
+DELTA_OPERATIONS = (NODE_ADDED, NODE_UPDATED, NODE_REMOVED, EDGE_ADDED, EDGE_REMOVED)
+
+
+@dataclass
+class DeltaReport:
+    """
+    Summary of one GraphLoader.apply_delta() call.
+    - nodes_added / nodes_updated / nodes_removed: node IDs
+    - edges_added / edges_removed: (min, max) edge keys; edges_added also
+      lists existing edges whose weight was set explicitly
+    - edges_reweighted: existing edges whose weight was recomputed because
+      an endpoint's attributes changed; edges in edges_added are left out
+    - version_before / version_after: graph versions around the update
+    """
+
+    nodes_added: List[int] = field(default_factory=list)
+    nodes_updated: List[int] = field(default_factory=list)
+    nodes_removed: List[int] = field(default_factory=list)
+    edges_added: List[Tuple[int, int]] = field(default_factory=list)
+    edges_removed: List[Tuple[int, int]] = field(default_factory=list)
+    edges_reweighted: List[Tuple[int, int]] = field(default_factory=list)
+    version_before: int = 0
+    version_after: int = 0
+
+    @property
+    def affected_nodes(self) -> Set[int]:
+        """IDs of every node whose attributes, edges or edge weights changed."""
+        affected = set(self.nodes_added) | set(self.nodes_updated) | set(self.nodes_removed)
+        for edges in (self.edges_added, self.edges_removed, self.edges_reweighted):
+            for u, v in edges:
+                affected.add(u)
+                affected.add(v)
+        return affected
+
+    @property
+    def changed(self) -> bool:
+        """True if the delta modified the graph."""
+        return self.version_after != self.version_before
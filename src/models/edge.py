@@ -6,6 +6,8 @@ class Edge:
     - weight: numeric weight calculated from node features
     """
 
+    __slots__ = ("u", "v", "weight")
+
     def __init__(self, u: int, v: int, weight: float = 1.0):
         if u == v:
             raise ValueError("Self-loops are not allowed (u and v cannot be equal).")
@@ -0,0 +1,358 @@
+from collections.abc import Mapping
+from typing import Iterator
+
+import numpy as np
+
+
+class NodeView:
+    """
+    Lightweight read-only proxy for one node of a FrozenGraph.
+    Attribute values are read from the snapshot's columns on access,
+    so no per-node object exists until one is requested.
+    """
+
+    __slots__ = ("_graph", "_index")
+
+    def __init__(self, graph: "FrozenGraph", index: int):
+        self._graph = graph
+        self._index = index
+
+    @property
+    def id(self) -> int:
+        return int(self._graph.ids[self._index])
+
+    @property
+    def name(self) -> str:
+        return self._graph.names.get(self._index) or f"User {self.id}"
+
+    @property
+    def activity(self) -> float:
+        return float(self._graph.activity[self._index])
+
+    @property
+    def interaction(self) -> int:
+        return int(self._graph.interaction[self._index])
+
+    @property
+    def connection_count(self) -> int:
+        return int(self._graph.connection_count[self._index])
+
+    @property
+    def neighbors(self) -> frozenset[int]:
+        return frozenset(self._graph.neighbors(self.id))
+
+    def __repr__(self) -> str:
+        return f"Node(id={self.id}, name={self.name})"
+
+
+class EdgeView:
+    """
+    Lightweight read-only proxy for one undirected edge of a FrozenGraph.
+    - pos: position of the (u, v) entry in the CSR indices/weights arrays
+    """
+
+    __slots__ = ("_graph", "_row", "_pos")
+
+    def __init__(self, graph: "FrozenGraph", row: int, pos: int):
+        self._graph = graph
+        self._row = row
+        self._pos = pos
+
+    @property
+    def u(self) -> int:
+        return int(self._graph.ids[self._row])
+
+    @property
+    def v(self) -> int:
+        return int(self._graph.ids[self._graph.indices[self._pos]])
+
+    @property
+    def weight(self) -> float:
+        return float(self._graph.weights[self._pos])
+
+    def key(self):
+        """Return the canonical (min, max) key of this edge."""
+        return tuple(sorted((self.u, self.v)))
+
+    def __repr__(self) -> str:
+        return f"Edge({self.u} -- {self.v}, weight={self.weight})"
+
+
+class _NodeColumns(Mapping):
+    """Read-only node_id -> NodeView mapping over a FrozenGraph."""
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, graph: "FrozenGraph"):
+        self._graph = graph
+
+    def __getitem__(self, node_id) -> NodeView:
+        i = self._graph._position(node_id)
+        if i < 0:
+            raise KeyError(node_id)
+        return NodeView(self._graph, i)
+
+    def __contains__(self, node_id) -> bool:
+        return self._graph._position(node_id) >= 0
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._graph.ids.tolist())
+
+    def __len__(self) -> int:
+        return len(self._graph.ids)
+
+
+class FrozenGraph:
+    """
+    Immutable, array-backed compressed-sparse-row (CSR) view of a Graph.
+
+    Internal structure:
+    - ids: int64 array                # dense index -> node ID (sorted ascending)
+    - indptr: int64 array             # row offsets, length len(ids) + 1
+    - indices: int64 array            # neighbor indices, sorted inside each row
+    - weights: float64 array          # edge weights aligned with indices
+    - activity: float64 array         # node attribute columns, indexed by
+    - interaction: int64 array        #   dense index
+    - connection_count: int64 array
+    - names: dict[int, str]           # dense index -> name, custom names only
+
+    Every undirected edge is stored twice (once per endpoint), so the
+    neighbors of the node at index i are indices[indptr[i]:indptr[i + 1]].
+    Consecutive IDs map to indices by subtraction, otherwise through a
+    dict built on first use. `nodes` is a read-only mapping that iterates
+    in ascending ID order and hands out NodeView proxies on demand;
+    get_edges() does the same with EdgeView proxies.
+    """
+
+    def __init__(
+        self,
+        ids,
+        indptr,
+        indices,
+        weights,
+        activity=None,
+        interaction=None,
+        connection_count=None,
+        names: dict[int, str] | None = None,
+        validate: bool = True,
+    ):
+        self.ids = np.asarray(ids, dtype=np.int64)
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int64)
+        self.weights = np.asarray(weights, dtype=np.float64)
+
+        n = len(self.ids)
+        self.activity = self._column(activity, np.float64, n)
+        self.interaction = self._column(interaction, np.int64, n)
+        self.connection_count = self._column(connection_count, np.int64, n)
+        self.names = dict(names or {})
+
+        if len(self.indptr) != n + 1:
+            raise ValueError("indptr must have exactly len(ids) + 1 entries.")
+        if len(self.indices) != len(self.weights):
+            raise ValueError("indices and weights must have the same length.")
+        # O(V) scan; validate=False is for arrays already known to be sorted
+        # (e.g. written by save_binary()), so a memory-mapped file stays unread
+        if validate and n > 1 and not np.all(self.ids[1:] > self.ids[:-1]):
+            raise ValueError("ids must be unique and sorted ascending.")
+
+        for array in (
+            self.ids, self.indptr, self.indices, self.weights,
+            self.activity, self.interaction, self.connection_count,
+        ):
+            if array.flags.writeable:
+                array.flags.writeable = False
+
+        # IDs first..first+n-1 (the common case) map to indices by
+        # subtraction, so no Python dict is needed for id -> index
+        self._first = int(self.ids[0]) if n else 0
+        self._contiguous = n == 0 or int(self.ids[-1]) - self._first == n - 1
+        self._index: dict[int, int] | None = None
+
+        self.nodes = _NodeColumns(self)
+
+    @staticmethod
+    def _column(values, dtype, n: int) -> np.ndarray:
+        """Return an attribute column, zero-filled when not provided."""
+        if values is None:
+            return np.zeros(n, dtype=dtype)
+        column = np.asarray(values, dtype=dtype)
+        if len(column) != n:
+            raise ValueError("Attribute columns must have one entry per node.")
+        return column
+
+    @classmethod
+    def from_graph(cls, graph) -> "FrozenGraph":
+        """Build a CSR snapshot from a Graph or anything with the same surface."""
+        n = len(graph.nodes)
+        edges = graph.get_edges()
+        m = len(edges)
+
+        ordered = sorted(graph.nodes)
+        ids = np.array(ordered, dtype=np.int64)
+        nodes = [graph.nodes[nid] for nid in ordered]
+
+        activity = np.fromiter((node.activity for node in nodes), dtype=np.float64, count=n)
+        interaction = np.fromiter((node.interaction for node in nodes), dtype=np.int64, count=n)
+        connection_count = np.fromiter(
+            (node.connection_count for node in nodes), dtype=np.int64, count=n
+        )
+        names = {
+            i: node.name for i, node in enumerate(nodes) if node.name != f"User {node.id}"
+        }
+
+        endpoints = np.fromiter(
+            (nid for edge in edges for nid in (edge.u, edge.v)), dtype=np.int64, count=2 * m
+        ).reshape(m, 2)
+        edge_weights = np.fromiter((edge.weight for edge in edges), dtype=np.float64, count=m)
+
+        return cls.from_edge_arrays(
+            ids, endpoints[:, 0], endpoints[:, 1], edge_weights,
+            activity=activity,
+            interaction=interaction,
+            connection_count=connection_count,
+            names=names,
+        )
+
+    @classmethod
+    def from_edge_arrays(
+        cls,
+        ids,
+        u,
+        v,
+        weights,
+        activity=None,
+        interaction=None,
+        connection_count=None,
+        names: dict[int, str] | None = None,
+    ) -> "FrozenGraph":
+        """
+        Build a CSR graph from one entry per undirected edge (u[i], v[i],
+        weights[i]) without creating any per-node or per-edge objects.
+
+        ids must be sorted ascending with the attribute columns aligned to
+        them, and every endpoint must be one of ids.
+        """
+        ids = np.asarray(ids, dtype=np.int64)
+        n = len(ids)
+        iu = np.searchsorted(ids, np.asarray(u, dtype=np.int64))
+        iv = np.searchsorted(ids, np.asarray(v, dtype=np.int64))
+        weights = np.asarray(weights, dtype=np.float64)
+
+        # Store both directions, then order by (row, neighbor)
+        src = np.concatenate((iu, iv))
+        dst = np.concatenate((iv, iu))
+        weights = np.concatenate((weights, weights))
+        order = np.lexsort((dst, src))
+
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(src, minlength=n), out=indptr[1:])
+
+        return cls(
+            ids, indptr, dst[order], weights[order],
+            activity=activity,
+            interaction=interaction,
+            connection_count=connection_count,
+            names=names,
+        )
+
+    # ------------------------------------------------------------------
+    # Dense index helpers
+    # ------------------------------------------------------------------
+
+    def _position(self, node_id) -> int:
+        """Return the dense index of a node ID, or -1 if it is unknown."""
+        node_id = int(node_id)
+        if self._contiguous:
+            i = node_id - self._first
+            return i if 0 <= i < len(self.ids) else -1
+        if self._index is None:
+            self._index = {nid: i for i, nid in enumerate(self.ids.tolist())}
+        return self._index.get(node_id, -1)
+
+    def index_of(self, node_id: int) -> int:
+        """Return the dense index of a node ID. Raises ValueError if unknown."""
+        i = self._position(node_id)
+        if i < 0:
+            raise ValueError(f"Node with ID {node_id} does not exist.")
+        return i
+
+    def id_of(self, index: int) -> int:
+        """Return the node ID stored at a dense index."""
+        return int(self.ids[index])
+
+    def edge_arrays(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return parallel (u, v, weight) arrays with one entry per undirected edge."""
+        rows = np.repeat(np.arange(len(self.ids)), np.diff(self.indptr))
+        upper = rows < self.indices
+        return self.ids[rows[upper]], self.ids[self.indices[upper]], self.weights[upper]
+
+    # ------------------------------------------------------------------
+    # Query helpers (same surface as Graph)
+    # ------------------------------------------------------------------
+
+    @property
+    def num_edges(self) -> int:
+        """Number of undirected edges in the snapshot."""
+        return len(self.indices) // 2
+
+    def get_neighbors(self, node_id: int) -> set[int]:
+        """Return the neighbor IDs of a given node."""
+        return set(self.neighbors(node_id))
+
+    def neighbors(self, node_id: int) -> Iterator[int]:
+        """Iterate over the neighbor IDs of a given node."""
+        i = self._position(node_id)
+        if i < 0:
+            return iter(())
+        return iter(self.ids[self.indices[self.indptr[i]:self.indptr[i + 1]]].tolist())
+
+    def weighted_neighbors(self, node_id: int) -> Iterator[tuple[int, float]]:
+        """Iterate over (neighbor ID, weight) pairs of a given node."""
+        i = self._position(node_id)
+        if i < 0:
+            return iter(())
+        row = slice(self.indptr[i], self.indptr[i + 1])
+        return zip(self.ids[self.indices[row]].tolist(), self.weights[row].tolist())
+
+    def degree(self, node_id: int) -> int:
+        """Return the number of neighbors of a given node (0 if unknown)."""
+        i = self._position(node_id)
+        if i < 0:
+            return 0
+        return int(self.indptr[i + 1] - self.indptr[i])
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """Check if there is an edge between u and v."""
+        return self.get_edge_weight(u, v) is not None
+
+    def get_edge_weight(self, u: int, v: int) -> float | None:
+        """Return the weight of edge (u, v), or None if no edge exists."""
+        if int(u) == int(v):
+            raise ValueError("Self-loops are not allowed.")
+        i = self._position(u)
+        j = self._position(v)
+        if i < 0 or j < 0:
+            return None
+
+        start, end = self.indptr[i], self.indptr[i + 1]
+        pos = start + int(np.searchsorted(self.indices[start:end], j))
+        if pos < end and self.indices[pos] == j:
+            return float(self.weights[pos])
+        return None
+
+    def get_nodes(self) -> list[NodeView]:
+        """Return all nodes as a list of NodeView proxies."""
+        return [NodeView(self, i) for i in range(len(self.ids))]
+
+    def get_edges(self) -> list[EdgeView]:
+        """Return all edges as a list of EdgeView proxies."""
+        rows = np.repeat(np.arange(len(self.ids)), np.diff(self.indptr))
+        positions = np.flatnonzero(rows < self.indices)
+        return [
+            EdgeView(self, row, pos)
+            for row, pos in zip(rows[positions].tolist(), positions.tolist())
+        ]
+
+    def __repr__(self) -> str:
+        return f"FrozenGraph(nodes={len(self.ids)}, edges={self.num_edges})"
@@ -0,0 +1,266 @@
+"""
+Seeded, vectorized synthetic social graphs for load and scale testing.
+
+Every model returns an (m, 2) int64 array of unique undirected edges
+(u < v, sorted) over node IDs 1..num_nodes, the ID scheme of the sample
+CSV files. node_attributes() derives Aktiflik / Etkilesim / Baglanti
+style columns from the degrees, and to_graph() / write_csv() turn the
+result into a Graph or a CSV in the exact layout of data/sample_medium.csv.
+"""
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+from .graph import Graph
+from .graph_loader import GraphLoader
+from .weight_formula import DEFAULT_WEIGHT_FORMULA, edge_weights
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _edge_keys(u: np.ndarray, v: np.ndarray, num_nodes: int) -> np.ndarray:
+    """Encode pairs as unique int64 keys lo * (n + 1) + hi, dropping self-loops."""
+    keep = u != v
+    lo = np.minimum(u[keep], v[keep])
+    hi = np.maximum(u[keep], v[keep])
+    return lo * (num_nodes + 1) + hi
+
+
+def _unique(keys: np.ndarray) -> np.ndarray:
+    """Sorted distinct keys (sort + neighbor compare, much faster than np.unique at 10^7)."""
+    keys = np.sort(keys)
+    if len(keys):
+        keys = keys[np.concatenate(([True], keys[1:] != keys[:-1]))]
+    return keys
+
+
+def _decode(keys: np.ndarray, num_nodes: int) -> np.ndarray:
+    """Turn sorted edge keys back into an (m, 2) array of 1-based IDs."""
+    keys = np.asarray(keys, dtype=np.int64)
+    return np.column_stack((keys // (num_nodes + 1), keys % (num_nodes + 1))) + 1
+
+
+def _sample_keys(
+    rng: np.random.Generator,
+    count: int,
+    draw: Callable[[int], tuple],
+    num_nodes: int,
+) -> np.ndarray:
+    """Draw random pairs until `count` distinct edges exist, then keep exactly `count`."""
+    keys = np.empty(0, dtype=np.int64)
+    while len(keys) < count:
+        missing = count - len(keys)
+        u, v = draw(int(missing * 1.1) + 16)
+        keys = _unique(np.concatenate((keys, _edge_keys(u, v, num_nodes))))
+    if len(keys) > count:
+        keys = np.sort(rng.choice(keys, size=count, replace=False))
+    return keys
+
+
+# ----------------------------------------------------------------------
+# Models
+# ----------------------------------------------------------------------
+
+def erdos_renyi(num_nodes: int, num_edges: int, seed: Optional[int] = None) -> np.ndarray:
+    """Erdős–Rényi G(n, m): num_edges edges chosen uniformly at random."""
+    if num_edges > num_nodes * (num_nodes - 1) // 2:
+        raise ValueError("num_edges exceeds the number of possible edges.")
+    rng = np.random.default_rng(seed)
+
+    def draw(size):
+        return rng.integers(0, num_nodes, size), rng.integers(0, num_nodes, size)
+
+    return _decode(_sample_keys(rng, num_edges, draw, num_nodes), num_nodes)
+
+
+def barabasi_albert(num_nodes: int, edges_per_node: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Barabási–Albert preferential attachment, vectorized form of the
+    Batagelj–Brandes algorithm: every node adds `edges_per_node` edges to
+    targets picked proportionally to degree. Repeated targets and
+    self-loops are dropped, so a few nodes get slightly fewer edges.
+    """
+    if edges_per_node < 1:
+        raise ValueError("edges_per_node must be at least 1.")
+    rng = np.random.default_rng(seed)
+    total = num_nodes * edges_per_node
+    source = np.arange(total, dtype=np.int64) // edges_per_node
+
+    # Endpoint list M: M[2i] = source of edge i, M[2i + 1] = M[r_i], r_i in [0, 2i]
+    r = rng.integers(0, 2 * np.arange(total, dtype=np.int64) + 1)
+
+    # Resolve M[r_i] by pointer jumping: odd positions refer to an earlier edge's target
+    pointer = r.copy()
+    active = np.flatnonzero(pointer & 1)
+    while len(active):
+        pointer[active] = r[(pointer[active] - 1) // 2]
+        active = active[(pointer[active] & 1) == 1]
+    target = source[pointer // 2]
+
+    keys = _unique(_edge_keys(source, target, num_nodes))
+    return _decode(keys, num_nodes)
+
+
+def stochastic_block(
+    block_sizes: List[int],
+    p_in: float,
+    p_out: float,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Stochastic block model: communities of the given sizes (consecutive
+    ID ranges), with edge probability p_in inside and p_out between blocks.
+    """
+    rng = np.random.default_rng(seed)
+    num_nodes = int(sum(block_sizes))
+    starts = np.concatenate(([0], np.cumsum(block_sizes)[:-1])).astype(np.int64)
+    keys = []
+
+    for a, size_a in enumerate(block_sizes):
+        for b in range(a, len(block_sizes)):
+            size_b = block_sizes[b]
+            possible = size_a * (size_a - 1) // 2 if a == b else size_a * size_b
+            count = rng.binomial(possible, p_in if a == b else p_out) if possible else 0
+            if count == 0:
+                continue
+
+            def draw(size, a=a, b=b, size_a=size_a, size_b=size_b):
+                return (
+                    starts[a] + rng.integers(0, size_a, size),
+                    starts[b] + rng.integers(0, size_b, size),
+                )
+
+            keys.append(_sample_keys(rng, count, draw, num_nodes))
+
+    if not keys:
+        return np.empty((0, 2), dtype=np.int64)
+    return _decode(np.sort(np.concatenate(keys)), num_nodes)
+
+
+def watts_strogatz(
+    num_nodes: int,
+    k: int,
+    rewire_prob: float,
+    seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Watts–Strogatz small world: a ring where every node links to its k
+    nearest neighbors (k even), then each edge's far end is rewired to a
+    random node with probability rewire_prob. Rewired duplicates and
+    self-loops are dropped.
+    """
+    if k % 2 or k >= num_nodes:
+        raise ValueError("k must be even and smaller than num_nodes.")
+    rng = np.random.default_rng(seed)
+    half = k // 2
+    u = np.repeat(np.arange(num_nodes, dtype=np.int64), half)
+    v = (u + np.tile(np.arange(1, half + 1, dtype=np.int64), num_nodes)) % num_nodes
+
+    rewire = rng.random(len(u)) < rewire_prob
+    v[rewire] = rng.integers(0, num_nodes, int(rewire.sum()))
+
+    keys = _unique(_edge_keys(u, v, num_nodes))
+    return _decode(keys, num_nodes)
+
+
+# Model name -> generator, e.g. for command-line tools
+GENERATORS = {
+    "er": erdos_renyi,
+    "ba": barabasi_albert,
+    "sbm": stochastic_block,
+    "ws": watts_strogatz,
+}
+
+
+# ----------------------------------------------------------------------
+# Attributes and output
+# ----------------------------------------------------------------------
+
+def node_attributes(num_nodes: int, edges: np.ndarray, seed: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """
+    Return activity / interaction / connection_count columns for nodes 1..n.
+
+    As in the sample data, activity (0.01-0.99, two decimals) grows with a
+    node's degree rank, interaction tracks activity (about 50 * activity)
+    and connection_count is the degree.
+    """
+    rng = np.random.default_rng(seed)
+    degrees = np.bincount(edges.ravel() - 1, minlength=num_nodes).astype(np.int64)
+
+    # Degree percentile with random tie-breaking
+    order = np.lexsort((rng.random(num_nodes), degrees))
+    percentile = np.empty(num_nodes)
+    percentile[order] = np.arange(num_nodes) / max(num_nodes - 1, 1)
+
+    activity = np.clip(0.3 + 0.6 * percentile + rng.normal(0.0, 0.05, num_nodes), 0.01, 0.99)
+    activity = np.round(activity, 2)
+    interaction = np.maximum(np.rint(50 * activity - 5 + rng.normal(0.0, 3.0, num_nodes)), 0)
+
+    return {
+        "activity": activity,
+        "interaction": interaction.astype(np.int64),
+        "connection_count": degrees,
+    }
+
+
+def to_graph(
+    num_nodes: int,
+    edges: np.ndarray,
+    attributes: Optional[Dict[str, np.ndarray]] = None,
+    weight_formula: Optional[Callable] = None,
+) -> Graph:
+    """Build a Graph with nodes 1..num_nodes through the bulk insertion APIs."""
+    attributes = attributes if attributes is not None else node_attributes(num_nodes, edges)
+    weight_fn = weight_formula or DEFAULT_WEIGHT_FORMULA
+
+    graph = Graph()
+    graph.add_nodes_from(np.arange(1, num_nodes + 1), **attributes)
+    if hasattr(weight_fn, "compute"):
+        # Node IDs are 1..n, so column positions are ID - 1
+        weights = weight_fn.compute(attributes, edges[:, 0] - 1, edges[:, 1] - 1)
+    else:
+        weights = edge_weights(weight_fn, graph.nodes, edges[:, 0], edges[:, 1])
+    graph.add_edges_from(edges, weights=weights)
+    graph.weight_formula = weight_fn
+    return graph
+
+
+def write_csv(
+    path: str,
+    num_nodes: int,
+    edges: np.ndarray,
+    attributes: Optional[Dict[str, np.ndarray]] = None,
+    chunk_nodes: int = 100_000,
+) -> None:
+    """
+    Write the graph in the layout of data/sample_medium.csv: one row per
+    node with its attributes and the quoted, sorted neighbor list.
+    """
+    attributes = attributes if attributes is not None else node_attributes(num_nodes, edges)
+    columns = GraphLoader.DEFAULT_CSV_COLUMNS
+
+    # Adjacency in CSR form, both directions, neighbors sorted
+    src = np.concatenate((edges[:, 0], edges[:, 1])) - 1
+    dst = np.concatenate((edges[:, 1], edges[:, 0]))
+    order = np.lexsort((dst, src))
+    dst = dst[order]
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(src, minlength=num_nodes), out=indptr[1:])
+
+    header = [columns[key] for key in ("node_id", "activity", "interaction", "connection_count", "neighbors")]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write(",".join(header) + "\n")
+        for start in range(0, num_nodes, chunk_nodes):
+            end = min(start + chunk_nodes, num_nodes)
+            neighbors = dst[indptr[start]:indptr[end]].astype(str).tolist()
+            offsets = (indptr[start:end + 1] - indptr[start]).tolist()
+            activity = attributes["activity"][start:end].tolist()
+            interaction = attributes["interaction"][start:end].tolist()
+            connections = attributes["connection_count"][start:end].tolist()
+            f.write("".join(
+                f'{start + i + 1},{activity[i]},{interaction[i]},{connections[i]},'
+                f'"{",".join(neighbors[offsets[i]:offsets[i + 1]])}"\n'
+                for i in range(end - start)
+            ))
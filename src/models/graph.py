@@ -1,5 +1,37 @@
+import copy
+import functools
+import threading
+import weakref
+from typing import ItemsView, Iterator
+
+import numpy as np
+
 from .node import Node
 from .edge import Edge
+from .frozen_graph import FrozenGraph
+from .journal import (
+    EDGE_ADDED,
+    EDGE_REMOVED,
+    EDGE_WEIGHT_UPDATED,
+    GRAPH_CLEARED,
+    NODE_ADDED,
+    NODE_REMOVED,
+    NODE_UPDATED,
+    ChangeJournal,
+    GraphChange,
+)
+from .graph_views import EdgeThresholdView, InducedSubgraphView, NodePredicateView
+from .snapshot import _MISSING, GraphSnapshot
+from .weight_formula import DEFAULT_WEIGHT_FORMULA, edge_weights
+
+
+def _synchronized(method):
+    """Run a Graph method while holding the graph's lock (see Graph.snapshot())."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
 
 
 class Graph:
@@ -9,18 +41,157 @@ class Graph:
     Internal structure:
     - nodes: dict[int, Node]
     - edges: dict[tuple[int, int], Edge]   # key is (min(u, v), max(u, v))
-    - adjacency: dict[int, set[int]]       # node_id -> neighbor IDs
+    - adjacency: dict[int, dict[int, float]]  # node_id -> {neighbor ID: weight}
+
+    adjacency is the only neighbor store: Node.neighbors of every node in
+    the graph is a live keys() view of its adjacency entry.
+    The weight stored in adjacency mirrors Edge.weight, so shortest-path
+    code can read neighbors and weights in one pass. Change weights through
+    add_edge() or update_edge_weight() so both stay in sync.
+
+    Every mutation increments `version`. With journal_size > 0 the most
+    recent changes are also kept in `journal` (see changes_since()), so
+    result caches can tell whether they are still valid.
+
+    GraphSnapshot, FrozenGraph and the GraphView classes expose the same
+    query surface (nodes, neighbors(), weighted_neighbors(), degree(),
+    has_edge(), get_edge_weight(), get_nodes(), get_edges()), so every
+    function in algorithms/ runs on any of them unchanged.
+
+    snapshot() returns an O(1) read-only view for concurrent readers.
+    While a snapshot is alive the graph works copy-on-write per entry:
+    before the first change to a Node, adjacency entry or Edge it hands
+    the old one to the live snapshots and writes to a private copy, so
+    each mutation copies only what it touches. snapshot(), snapshot
+    lookups and every mutation hold one re-entrant lock, so a snapshot
+    taken from any thread never shares a half-applied change.
     """
 
-    def __init__(self):
+    def __init__(self, journal_size: int = 0):
         self.nodes: dict[int, Node] = {}
         self.edges: dict[tuple[int, int], Edge] = {}
-        self.adjacency: dict[int, set[int]] = {}
+        self.adjacency: dict[int, dict[int, float]] = {}
+        self.version: int = 0
+        self.journal: ChangeJournal | None = None
+        # Callable(node1, node2) -> float used by recompute_edge_weights()
+        self.weight_formula = DEFAULT_WEIGHT_FORMULA
+        if journal_size:
+            self.enable_journal(journal_size)
+
+        # Copy-on-write bookkeeping, see snapshot(); _lock guards it together
+        # with every mutation
+        self._lock = threading.RLock()
+        self._snapshots: weakref.WeakSet[GraphSnapshot] = weakref.WeakSet()
+        self._private_nodes: set[int] | None = None
+        self._private_edges: set[tuple[int, int]] | None = None
+
+    # ------------------------------------------------------------------
+    # Change tracking
+    # ------------------------------------------------------------------
+
+    def enable_journal(self, maxlen: int) -> None:
+        """Start recording the most recent `maxlen` changes."""
+        self.journal = ChangeJournal(maxlen, start_version=self.version)
+
+    def changes_since(self, version: int) -> list[GraphChange] | None:
+        """
+        Return the changes made after `version`, oldest first.
+        Returns None if the journal is disabled or no longer covers them.
+        """
+        if version == self.version:
+            return []
+        if self.journal is None:
+            return None
+        return self.journal.since(version)
+
+    def _record(self, kind: str, u: int | None = None, v: int | None = None,
+                weight: float | None = None) -> None:
+        """Bump the version and journal the change."""
+        self.version += 1
+        if self.journal is not None:
+            self.journal.record(GraphChange(self.version, kind, u, v, weight))
+
+    def _record_batch(self, kind: str, us, vs=None, weights=None) -> None:
+        """
+        Bump the version once for a bulk change and journal each element.
+        A batch longer than the journal would evict itself, so it only
+        moves the journal past this version.
+        """
+        self.version += 1
+        if self.journal is not None:
+            count = len(us)
+            if count > self.journal.maxlen:
+                self.journal.skip(self.version)
+                return
+            vs = vs if vs is not None else [None] * count
+            weights = weights if weights is not None else [None] * count
+            for u, v, weight in zip(us, vs, weights):
+                self.journal.record(GraphChange(self.version, kind, u, v, weight))
+
+    # ------------------------------------------------------------------
+    # Snapshots
+    # ------------------------------------------------------------------
+
+    @_synchronized
+    def snapshot(self) -> GraphSnapshot:
+        """
+        Return a read-only snapshot of the current graph in O(1).
+        Later mutations of the graph are not visible through it.
+        """
+        snap = GraphSnapshot(self.nodes, self.edges, self.adjacency, self.version, self._lock)
+        self._snapshots.add(snap)
+        # Entries owned since an older snapshot are shared again
+        self._private_nodes = set()
+        self._private_edges = set()
+        return snap
+
+    def _prepare_write(self) -> None:
+        """Drop the copy-on-write bookkeeping once every snapshot is gone."""
+        if self._private_nodes is not None and not self._snapshots:
+            self._private_nodes = None
+            self._private_edges = None
+
+    def _save_entry(self, table: str, key) -> None:
+        """Hand the current entry of nodes, edges or adjacency to the live snapshots."""
+        value = getattr(self, table).get(key, _MISSING)
+        for snap in self._snapshots:
+            # Snapshots that already hold the key saved an older state
+            snap._saved[table].setdefault(key, value)
+
+    def _own_node(self, node_id: int) -> None:
+        """
+        Give the graph private copies of a node and its adjacency entry
+        (or note that it is about to be added) before changing them.
+        """
+        private = self._private_nodes
+        if private is None or node_id in private:
+            return
+        self._save_entry("nodes", node_id)
+        self._save_entry("adjacency", node_id)
+        if node_id in self.nodes:
+            node = copy.copy(self.nodes[node_id])
+            adjacent = dict(self.adjacency[node_id])
+            node.neighbors = adjacent.keys()
+            self.nodes[node_id] = node
+            self.adjacency[node_id] = adjacent
+        private.add(node_id)
+
+    def _own_edge(self, key: tuple[int, int]) -> None:
+        """Give the graph a private copy of an edge (or note that it is about to be added)."""
+        private = self._private_edges
+        if private is None or key in private:
+            return
+        self._save_entry("edges", key)
+        edge = self.edges.get(key)
+        if edge is not None:
+            self.edges[key] = Edge(edge.u, edge.v, edge.weight)
+        private.add(key)
 
     # ------------------------------------------------------------------
     # Node operations
     # ------------------------------------------------------------------
 
+    @_synchronized
     def add_node(
         self,
         node_id: int,
@@ -45,10 +216,12 @@ class Graph:
             connection_count=connection_count,
         )
 
-        self.nodes[node_id] = node
-        self.adjacency[node_id] = set()
+        self._prepare_write()
+        self._attach(node)
+        self._record(NODE_ADDED, node_id)
         return node
 
+    @_synchronized
     def add_node_object(self, node: Node) -> None:
         """
         Add an existing Node instance to the graph.
@@ -57,9 +230,19 @@ class Graph:
         if node.id in self.nodes:
             raise ValueError(f"Node with ID {node.id} already exists.")
 
+        self._prepare_write()
+        self._attach(node)
+        self._record(NODE_ADDED, node.id)
+
+    def _attach(self, node: Node) -> None:
+        """Register a node and bind its neighbors to the adjacency entry."""
+        self._own_node(node.id)
+        adjacent: dict[int, float] = {}
         self.nodes[node.id] = node
-        self.adjacency[node.id] = set()
+        self.adjacency[node.id] = adjacent
+        node.neighbors = adjacent.keys()
 
+    @_synchronized
     def update_node(
         self,
         node_id: int,
@@ -73,6 +256,8 @@ class Graph:
         if node_id not in self.nodes:
             raise ValueError("Node not found.")
 
+        self._prepare_write()
+        self._own_node(node_id)
         node = self.nodes[node_id]
         if name is not None:
             node.name = name
@@ -82,7 +267,9 @@ class Graph:
             node.interaction = int(interaction)
         if connection_count is not None:
             node.connection_count = int(connection_count)
+        self._record(NODE_UPDATED, node_id)
 
+    @_synchronized
     def remove_node(self, node_id: int) -> None:
         """
         Remove a node and all its incident edges from the graph.
@@ -97,8 +284,11 @@ class Graph:
             self.remove_edge(node_id, neighbor)
 
         # Remove node itself
+        self._prepare_write()
+        self._own_node(node_id)
         del self.nodes[node_id]
         del self.adjacency[node_id]
+        self._record(NODE_REMOVED, node_id)
 
     # ------------------------------------------------------------------
     # Edge operations
@@ -112,6 +302,7 @@ class Graph:
             raise ValueError("Self-loops are not allowed.")
         return (u, v) if u < v else (v, u)
 
+    @_synchronized
     def add_edge(self, u: int, v: int, weight: float = 1.0) -> Edge:
         """
         Add an undirected edge between nodes u and v.
@@ -126,27 +317,43 @@ class Graph:
         key = self._edge_key(u, v)
         if key in self.edges:
             # If edge already exists, just update the weight
-            self.edges[key].weight = float(weight)
+            self.update_edge_weight(u, v, weight)
             return self.edges[key]
 
+        self._prepare_write()
+        self._own_node(u)
+        self._own_node(v)
+
+        self._own_edge(key)
+
         edge = Edge(u, v, weight)
         self.edges[key] = edge
 
-        # Update adjacency and neighbors
-        self.adjacency[u].add(v)
-        self.adjacency[v].add(u)
-        self.nodes[u].add_neighbor(v)
-        self.nodes[v].add_neighbor(u)
+        # Node.neighbors are views of these entries
+        self.adjacency[u][v] = edge.weight
+        self.adjacency[v][u] = edge.weight
+        self._record(EDGE_ADDED, key[0], key[1], edge.weight)
 
         return edge
 
+    @_synchronized
     def update_edge_weight(self, u: int, v: int, weight: float) -> None:
         """Update the weight of an existing edge."""
         key = self._edge_key(u, v)
         if key not in self.edges:
             raise ValueError("Edge does not exist.")
-        self.edges[key].weight = float(weight)
-
+        weight = float(weight)
+        u, v = key
+        self._prepare_write()
+        self._own_node(u)
+        self._own_node(v)
+        self._own_edge(key)
+        self.edges[key].weight = weight
+        self.adjacency[u][v] = weight
+        self.adjacency[v][u] = weight
+        self._record(EDGE_WEIGHT_UPDATED, u, v, weight)
+
+    @_synchronized
     def remove_edge(self, u: int, v: int) -> None:
         """Remove an edge between u and v, if it exists."""
         u = int(u)
@@ -155,36 +362,286 @@ class Graph:
         if key not in self.edges:
             return  # silently ignore if edge does not exist
 
+        self._prepare_write()
+        self._own_node(u)
+        self._own_node(v)
+        self._own_edge(key)
         del self.edges[key]
 
-        # Update adjacency and neighbors
+        # Node.neighbors are views of these entries
         if u in self.adjacency:
-            self.adjacency[u].discard(v)
+            self.adjacency[u].pop(v, None)
         if v in self.adjacency:
-            self.adjacency[v].discard(u)
+            self.adjacency[v].pop(u, None)
+        self._record(EDGE_REMOVED, key[0], key[1])
+
+    # ------------------------------------------------------------------
+    # Bulk operations
+    # ------------------------------------------------------------------
 
-        if u in self.nodes:
-            self.nodes[u].remove_neighbor(v)
-        if v in self.nodes:
-            self.nodes[v].remove_neighbor(u)
+    @_synchronized
+    def add_nodes_from(
+        self,
+        nodes,
+        activity=None,
+        interaction=None,
+        connection_count=None,
+        names=None,
+    ) -> None:
+        """
+        Add many nodes with a single validation pass.
+
+        `nodes` is either an iterable of Node objects, or an array-like of
+        node IDs; in the latter case activity, interaction,
+        connection_count and names may be given as parallel sequences.
+        Raises ValueError (and adds nothing) if any ID is duplicated or
+        already present in the graph.
+        """
+        nodes = list(nodes)
+        if nodes and isinstance(nodes[0], Node):
+            objects = nodes
+        else:
+            ids = np.asarray(nodes, dtype=np.int64).tolist()
+            count = len(ids)
+            activity = self._bulk_column(activity, count, 0.0)
+            interaction = self._bulk_column(interaction, count, 0)
+            connection_count = self._bulk_column(connection_count, count, 0)
+            names = list(names) if names is not None else [None] * count
+            if len(names) != count:
+                raise ValueError("Attribute columns must have one entry per node.")
+            objects = [
+                Node(nid, name, a, i, c)
+                for nid, name, a, i, c in zip(ids, names, activity, interaction, connection_count)
+            ]
+
+        ids = [node.id for node in objects]
+        unique = set(ids)
+        if len(unique) != len(ids):
+            raise ValueError("Duplicate node IDs in bulk insert.")
+        existing = unique.intersection(self.nodes)
+        if existing:
+            raise ValueError(f"Node with ID {min(existing)} already exists.")
+
+        self._prepare_write()
+        for node in objects:
+            self._attach(node)
+        if objects:
+            self._record_batch(NODE_ADDED, ids)
+
+    @staticmethod
+    def _bulk_column(values, count: int, default) -> list:
+        """Return a per-node attribute column as a Python list."""
+        if values is None:
+            return [default] * count
+        values = np.asarray(values).tolist()
+        if len(values) != count:
+            raise ValueError("Attribute columns must have one entry per node.")
+        return values
+
+    @_synchronized
+    def add_edges_from(self, edges, weights=None) -> None:
+        """
+        Add many undirected edges with a single validation pass.
+
+        `edges` is an iterable of (u, v) pairs or (u, v, weight) triples,
+        or an equivalent (m, 2) / (m, 3) NumPy array. `weights` may supply
+        the weights as a separate sequence; missing weights default to 1.0.
+        Repeated pairs are collapsed (the last weight wins) and existing
+        edges get their weight updated, as with add_edge(); the whole batch
+        is journaled as add_edge changes under one version. Raises
+        ValueError (and adds nothing) on self-loops or unknown endpoints.
+        """
+        if not isinstance(edges, np.ndarray):
+            # Keep IDs as exact integers rather than going through float64
+            edges = list(edges)
+            width = len(edges[0]) if edges else 2
+            if width not in (2, 3) or any(len(edge) != width for edge in edges):
+                raise ValueError("edges must all be (u, v) pairs or all be (u, v, weight) triples.")
+            columns = [[edge[i] for edge in edges] for i in range(width)]
+            u = np.array(columns[0], dtype=np.int64)
+            v = np.array(columns[1], dtype=np.int64)
+            given = np.array(columns[2], dtype=np.float64) if width == 3 else None
+        else:
+            if edges.ndim != 2 or edges.shape[1] not in (2, 3):
+                raise ValueError("edges must be (u, v) pairs or (u, v, weight) triples.")
+            u = edges[:, 0].astype(np.int64)
+            v = edges[:, 1].astype(np.int64)
+            given = edges[:, 2].astype(np.float64) if edges.shape[1] == 3 else None
+
+        if len(u) == 0:
+            return
+        if weights is not None:
+            w = np.asarray(weights, dtype=np.float64)
+            if len(w) != len(u):
+                raise ValueError("weights must have one entry per edge.")
+        elif given is not None:
+            w = given
+        else:
+            w = np.ones(len(u), dtype=np.float64)
+
+        if np.any(u == v):
+            raise ValueError("Self-loops are not allowed.")
+        lo = np.minimum(u, v)
+        hi = np.maximum(u, v)
+
+        known = np.fromiter(self.nodes, dtype=np.int64, count=len(self.nodes))
+        if not np.all(np.isin(lo, known)) or not np.all(np.isin(hi, known)):
+            raise ValueError("Both nodes must exist before adding an edge.")
+
+        # Collapse repeated pairs, keeping the last occurrence of each
+        order = np.lexsort((hi, lo))
+        last = np.ones(len(order), dtype=bool)
+        last[:-1] = (lo[order][1:] != lo[order][:-1]) | (hi[order][1:] != hi[order][:-1])
+        if not np.all(last):
+            keep = np.sort(order[last])
+            lo, hi, w = lo[keep], hi[keep], w[keep]
+
+        lo = lo.tolist()
+        hi = hi.tolist()
+        w = w.tolist()
+
+        self._prepare_write()
+        if self._private_nodes is not None:
+            # A snapshot is alive: copy each touched entry before writing
+            for a, b in zip(lo, hi):
+                self._own_node(a)
+                self._own_node(b)
+                self._own_edge((a, b))
+
+        edges_by_key = self.edges
+        adjacency = self.adjacency
+        for a, b, weight in zip(lo, hi, w):
+            key = (a, b)
+            edge = edges_by_key.get(key)
+            if edge is None:
+                edges_by_key[key] = Edge(a, b, weight)
+            else:
+                edge.weight = weight
+            adjacency[a][b] = weight
+            adjacency[b][a] = weight
+
+        self._record_batch(EDGE_ADDED, lo, hi, w)
+
+    @_synchronized
+    def remove_edges_from(self, edges) -> list[tuple[int, int]]:
+        """
+        Remove many undirected edges, journaled under one version.
+        Pairs without an edge are ignored, as with remove_edge().
+        Returns the (min, max) keys of the edges actually removed.
+        """
+        keys = list(dict.fromkeys(self._edge_key(u, v) for u, v in edges))
+        keys = [key for key in keys if key in self.edges]
+        if not keys:
+            return keys
+
+        self._prepare_write()
+        if self._private_nodes is not None:
+            # A snapshot is alive: copy each touched entry before writing
+            for u, v in keys:
+                self._own_node(u)
+                self._own_node(v)
+                self._own_edge((u, v))
+
+        adjacency = self.adjacency
+        for u, v in keys:
+            del self.edges[(u, v)]
+            adjacency[u].pop(v, None)
+            adjacency[v].pop(u, None)
+
+        self._record_batch(EDGE_REMOVED, [u for u, _ in keys], [v for _, v in keys])
+        return keys
+
+    @_synchronized
+    def recompute_edge_weights(self, node_ids=None, formula=None) -> int:
+        """
+        Recompute edge weights from node attributes.
+
+        node_ids limits the work to edges incident to those nodes (e.g.
+        after update_node()); None recomputes every edge. A new `formula`
+        replaces self.weight_formula. Formulas with a compute() method
+        (WeightFormula) are evaluated for all edges in one NumPy pass over
+        the endpoint attribute columns; any other callable is called once
+        per edge. Returns the number of edges recomputed.
+        """
+        if formula is not None:
+            self.weight_formula = formula
+        formula = self.weight_formula
+
+        if node_ids is None:
+            keys = list(self.edges)
+        else:
+            touched = set()
+            for nid in node_ids:
+                nid = int(nid)
+                for neighbor in self.adjacency.get(nid, ()):
+                    touched.add((nid, neighbor) if nid < neighbor else (neighbor, nid))
+            keys = list(touched)
+        if not keys:
+            return 0
+
+        weights = edge_weights(
+            formula, self.nodes, [u for u, _ in keys], [v for _, v in keys]
+        ).tolist()
+
+        self._prepare_write()
+        if self._private_nodes is not None:
+            # A snapshot is alive: copy each touched entry before writing
+            for u, v in keys:
+                self._own_node(u)
+                self._own_node(v)
+                self._own_edge((u, v))
+
+        edges = self.edges
+        adjacency = self.adjacency
+        for (u, v), weight in zip(keys, weights):
+            edges[(u, v)].weight = weight
+            adjacency[u][v] = weight
+            adjacency[v][u] = weight
+
+        self._record_batch(
+            EDGE_WEIGHT_UPDATED, [u for u, _ in keys], [v for _, v in keys], weights
+        )
+        return len(keys)
 
     # ------------------------------------------------------------------
     # Query helpers
     # ------------------------------------------------------------------
 
     def get_neighbors(self, node_id: int) -> set[int]:
-        """Return the neighbor IDs of a given node."""
+        """Return a copy of the neighbor IDs of a given node."""
         return set(self.adjacency.get(int(node_id), set()))
 
+    def neighbors(self, node_id: int) -> Iterator[int]:
+        """
+        Iterate over the neighbor IDs of a given node without copying them.
+        The graph must not be mutated while the iterator is in use;
+        use get_neighbors() when an independent copy is needed.
+        """
+        return iter(self.adjacency.get(int(node_id), ()))
+
+    def degree(self, node_id: int) -> int:
+        """Return the number of neighbors of a given node (0 if unknown)."""
+        return len(self.adjacency.get(int(node_id), ()))
+
+    def weighted_neighbors(self, node_id: int) -> ItemsView[int, float]:
+        """
+        Return a read-only (neighbor ID, weight) view of a given node's edges.
+        Like neighbors(), the view is live and must not outlast a mutation.
+        """
+        return self.adjacency.get(int(node_id), {}).items()
+
     def has_edge(self, u: int, v: int) -> bool:
         """Check if there is an edge between u and v."""
         return self._edge_key(u, v) in self.edges
 
     def get_edge_weight(self, u: int, v: int) -> float | None:
         """Return the weight of edge (u, v), or None if no edge exists."""
-        key = self._edge_key(u, v)
-        edge = self.edges.get(key)
-        return edge.weight if edge is not None else None
+        u = int(u)
+        v = int(v)
+        if u == v:
+            raise ValueError("Self-loops are not allowed.")
+        adjacent = self.adjacency.get(u)
+        return adjacent.get(v) if adjacent is not None else None
 
     def get_nodes(self) -> list[Node]:
         """Return all nodes as a list."""
@@ -194,8 +651,42 @@ class Graph:
         """Return all edges as a list."""
         return list(self.edges.values())
 
+    def subgraph_view(self, node_ids) -> InducedSubgraphView:
+        """Return a lazy view of the subgraph induced by node_ids."""
+        return InducedSubgraphView(self, node_ids)
+
+    def edge_weight_view(
+        self, min_weight: float | None = None, max_weight: float | None = None
+    ) -> EdgeThresholdView:
+        """Return a lazy view keeping only edges with weight in [min_weight, max_weight]."""
+        return EdgeThresholdView(self, min_weight, max_weight)
+
+    def node_filter_view(self, predicate) -> NodePredicateView:
+        """Return a lazy view keeping only nodes for which predicate(node) is true."""
+        return NodePredicateView(self, predicate)
+
+    def freeze(self) -> FrozenGraph:
+        """
+        Return an immutable CSR snapshot of the current graph.
+        Later mutations of this graph are not reflected in the snapshot.
+        """
+        return FrozenGraph.from_graph(self)
+
+    @_synchronized
     def clear(self) -> None:
         """Remove all nodes and edges from the graph."""
-        self.nodes.clear()
-        self.edges.clear()
-        self.adjacency.clear()
+        self._prepare_write()
+        if self._private_nodes is not None:
+            # Leave the old dicts to the live snapshots, which no longer
+            # need anything handed over
+            self.nodes = {}
+            self.edges = {}
+            self.adjacency = {}
+            self._snapshots = weakref.WeakSet()
+            self._private_nodes = None
+            self._private_edges = None
+        else:
+            self.nodes.clear()
+            self.edges.clear()
+            self.adjacency.clear()
+        self._record(GRAPH_CLEARED)
@@ -1,9 +1,28 @@
 import csv
+import io
+import itertools
 import json
-import math
+import os
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable, Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from .delta import DELTA_OPERATIONS, DeltaReport
+from .frozen_graph import FrozenGraph
 from .graph import Graph
+from .journal import EDGE_ADDED, EDGE_REMOVED, NODE_ADDED, NODE_REMOVED, NODE_UPDATED
+from .json_stream import iter_json_graph, write_json_graph
+from .lazy_graph import LazyAttributeGraph, LazyNode
 from .node import Node
+from .parse_cache import ParseCache
+from .weight_formula import DEFAULT_WEIGHT_FORMULA, WeightFormula, edge_weights
+
+# Lookup table: True for the bytes bytes.split() treats as whitespace
+_WHITESPACE_BYTES = np.zeros(256, dtype=bool)
+_WHITESPACE_BYTES[list(b" \t\n\r\x0b\x0c")] = True
 
 
 class GraphLoader:
@@ -11,9 +30,14 @@ class GraphLoader:
     A generalized and extensible loader for social network graphs from multiple formats.
     
     Supports:
-    - CSV files with customizable column mappings
-    - JSON files
+    - CSV files with customizable column mappings (in memory, streamed in chunks,
+      parsed in parallel by a process pool, or topology-first with lazy attributes)
+    - Whitespace-separated edge lists (SNAP style) with a separate attribute file
+    - JSON files (streamed, optionally .gz / .xz compressed)
+    - A versioned native binary format, memory-mapped on load
+    - Delta CSV files applied in place to an existing graph
     - Custom weight calculation formulas
+    - An optional content-hashed ParseCache for CSV and JSON sources
     - Node attribute specifications
     """
 
@@ -26,12 +50,42 @@ class GraphLoader:
         "neighbors": "Komsular",
     }
 
+    # Default column mappings for delta (incremental update) CSV files
+    DEFAULT_DELTA_COLUMNS = {
+        "op": "Islem",
+        "node_id": "DugumId",
+        "target_id": "HedefId",
+        "activity": "Aktiflik",
+        "interaction": "Etkilesim",
+        "connection_count": "Baglanti",
+        "weight": "Agirlik",
+    }
+
+    # Native binary format: magic, format version, header length, JSON header,
+    # then raw little-endian arrays, each starting on an aligned offset
+    BINARY_MAGIC = b"SNAGRAPH"
+    BINARY_VERSION = 1
+    BINARY_ALIGNMENT = 64
+    BINARY_ARRAYS = {
+        "ids": "<i8",
+        "indptr": "<i8",
+        "indices": "<i8",
+        "weights": "<f8",
+        "activity": "<f8",
+        "interaction": "<i8",
+        "connection_count": "<i8",
+    }
+
     @staticmethod
     def load_from_csv(
         path: str,
         column_mapping: Optional[Dict[str, str]] = None,
         weight_formula: Optional[Callable] = None,
         encoding: str = "utf-8",
+        workers: Optional[int] = 1,
+        cache: Optional[ParseCache] = None,
+        lazy_attributes: bool = False,
+        frozen: bool = False,
     ) -> Graph:
         """
         Load nodes and edges from a CSV file with customizable column mappings.
@@ -43,88 +97,609 @@ class GraphLoader:
                            Required keys: 'node_id', 'neighbors'
                            Optional keys: 'activity', 'interaction', 'connection_count', and any custom attributes
             weight_formula: Callable(node1: Node, node2: Node) -> float
-                           If None, uses default Euclidean distance formula
+                           If None, uses default Euclidean distance formula.
+                           WeightFormula instances are evaluated for all edges
+                           in one vectorized pass; other callables once per edge.
             encoding: File encoding (default: utf-8)
+            workers: Number of processes parsing the file in parallel
+                     (1 = parse in this process, None = one per CPU core)
+            cache: ParseCache reused when the same file content was already
+                   parsed with the same mapping, encoding and WeightFormula
+                   (plain callables are never cached)
+            lazy_attributes: Parse only node IDs and neighbors now and return a
+                             LazyAttributeGraph that reads attributes (and
+                             computes weights) on first use; workers,
+                             cache and frozen do not apply in this mode
+            frozen: Return a read-only FrozenGraph instead of a Graph. With
+                    workers > 1 it is built straight from the parsed arrays,
+                    so no step of the load is bound to one core
 
         Returns:
-            Graph object with nodes and edges loaded
+            Graph object with nodes and edges loaded (FrozenGraph if frozen)
         """
         if column_mapping is None:
             column_mapping = GraphLoader.DEFAULT_CSV_COLUMNS
 
+        if lazy_attributes:
+            return GraphLoader._load_from_csv_lazy(path, column_mapping, weight_formula, encoding)
+
+        key = GraphLoader._cache_key(
+            cache, path, weight_formula, loader="csv", column_mapping=column_mapping, encoding=encoding
+        )
+        if key is not None:
+            graph = cache.get(key)
+            if graph is None:
+                graph = GraphLoader.load_from_csv(path, column_mapping, weight_formula, encoding, workers)
+                cache.put(key, graph)
+            graph.weight_formula = weight_formula or DEFAULT_WEIGHT_FORMULA
+            return graph.freeze() if frozen else graph
+
+        if workers is None or workers > 1:
+            return GraphLoader._load_from_csv_parallel(
+                path, column_mapping, weight_formula, encoding, workers or os.cpu_count() or 1, frozen
+            )
+
         graph = Graph()
+        nodes = []
         temp_neighbors = {}
 
         # ---------------------------------------------------------
         # Step 1: Load nodes
         # ---------------------------------------------------------
-        with open(path, "r", encoding=encoding) as f:
-            reader = csv.DictReader(f)
+        with open(path, "r", encoding=encoding, newline="") as f:
+            reader = csv.reader(f)
+            parse_row = GraphLoader._row_parser(next(reader, []), column_mapping)
 
             for row in reader:
-                try:
-                    node_id = int(row[column_mapping["node_id"]])
-                except (KeyError, ValueError) as e:
-                    raise ValueError(f"Failed to read node_id from row: {row}") from e
+                if not row:
+                    continue
+                node_attrs, neighbors = parse_row(row)
 
-                # Build node attributes
-                node_attrs = {"node_id": node_id}
-
-                # Read optional attributes
-                for attr_key in ["activity", "interaction", "connection_count"]:
-                    if attr_key in column_mapping:
-                        try:
-                            col_name = column_mapping[attr_key]
-                            if col_name in row and row[col_name].strip():
-                                node_attrs[attr_key] = float(row[col_name])
-                        except ValueError:
-                            pass  # Skip if conversion fails
-
-                # Read any additional custom attributes
-                for key, col_name in column_mapping.items():
-                    if key not in ["node_id", "activity", "interaction", "connection_count", "neighbors"]:
-                        if col_name in row and row[col_name].strip():
-                            try:
-                                node_attrs[key] = float(row[col_name])
-                            except ValueError:
-                                node_attrs[key] = row[col_name]  # Store as string if not numeric
-
-                # Create Node
-                node = Node(**node_attrs)
-                graph.add_node_object(node)
+                # Create Node (added to the graph in bulk below)
+                nodes.append(Node(**node_attrs))
 
                 # Store neighbors for later
                 if "neighbors" in column_mapping:
-                    neighbors_str = row[column_mapping["neighbors"]]
-                    neighbors = []
-                    if neighbors_str.strip():
-                        neighbors = [int(x) for x in neighbors_str.split(",")]
-                    temp_neighbors[node_id] = neighbors
+                    temp_neighbors[node_attrs["node_id"]] = neighbors
+
+        graph.add_nodes_from(nodes)
 
         # ---------------------------------------------------------
         # Step 2: Add edges + calculate weights
         # ---------------------------------------------------------
-        default_weight_fn = weight_formula or GraphLoader._default_weight_formula
-        
+        default_weight_fn = weight_formula or DEFAULT_WEIGHT_FORMULA
+        us = array("q")
+        vs = array("q")
+
         for u, neighbors in temp_neighbors.items():
             for v in neighbors:
                 if u < v:  # Avoid duplicate edges in undirected graph
-                    n1 = graph.nodes[u]
-                    n2 = graph.nodes[v]
-                    weight = default_weight_fn(n1, n2)
-                    graph.add_edge(u, v, weight)
+                    us.append(u)
+                    vs.append(v)
+
+        # All endpoints are known, so the weights are computed in one call
+        weights = edge_weights(default_weight_fn, graph.nodes, us, vs)
+        graph.add_edges_from(np.column_stack((us, vs)), weights=weights)
+        graph.weight_formula = default_weight_fn
+        return graph.freeze() if frozen else graph
+
+    @staticmethod
+    def _load_from_csv_parallel(
+        path: str,
+        column_mapping: Dict[str, str],
+        weight_formula: Optional[Callable],
+        encoding: str,
+        workers: int,
+        frozen: bool = False,
+    ) -> Graph:
+        """
+        Parallel mode of load_from_csv().
+
+        The file is split at row boundaries by byte offset and each range is
+        parsed in a process pool into NumPy arrays of node attributes and
+        edge endpoints. The arrays are concatenated and, with frozen=True,
+        turned into a FrozenGraph with vectorized CSR construction, so the
+        whole load scales with the number of workers.
+
+        A mutable Graph instead goes through add_nodes_from() and
+        add_edges_from(), which still create one Node and one Edge object
+        per row in this process. That merge is serial and on large files
+        takes most of the load time; use frozen=True when the result is
+        only queried. Rows must not contain embedded newlines, and only
+        the standard attribute columns are supported.
+        """
+        standard = {"node_id", "activity", "interaction", "connection_count", "neighbors"}
+        custom = sorted(set(column_mapping) - standard)
+        if custom:
+            raise ValueError(f"Custom attribute columns are not supported in parallel mode: {custom}")
+
+        with open(path, "rb") as f:
+            header_line = f.readline()
+        header = next(csv.reader([header_line.decode(encoding).lstrip("\ufeff")]), [])
+        header_end = len(header_line)
+        file_size = os.path.getsize(path)
+
+        # Several ranges per worker keep the pool busy when rows vary in length
+        parts = workers * 4
+        bounds = np.linspace(header_end, file_size, parts + 1).astype(np.int64).tolist()
+        tasks = [
+            (path, start, end, header, column_mapping, encoding)
+            for start, end in zip(bounds[:-1], bounds[1:])
+            if end > start
+        ]
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_parse_csv_range, tasks))
+
+        def merged(i: int) -> np.ndarray:
+            return np.concatenate([result[i] for result in results]) if results else np.empty(0)
+
+        ids = merged(0).astype(np.int64)
+        activity, interaction, connection_count = merged(1), merged(2), merged(3)
+        # Node stores these as int
+        interaction = interaction.astype(np.int64)
+        connection_count = connection_count.astype(np.int64)
+        src, dst = merged(4).astype(np.int64), merged(5).astype(np.int64)
+
+        if frozen:
+            order = np.argsort(ids, kind="stable")
+            ids = ids[order]
+            if len(ids) > 1 and not np.all(ids[1:] > ids[:-1]):
+                raise ValueError("Duplicate node IDs in CSV file.")
+            activity, interaction, connection_count = (
+                activity[order], interaction[order], connection_count[order]
+            )
+            # Rows listing the same neighbor twice give duplicate edges
+            keys = np.lexsort((dst, src))
+            src, dst = src[keys], dst[keys]
+            distinct = np.ones(len(src), dtype=bool)
+            distinct[1:] = (src[1:] != src[:-1]) | (dst[1:] != dst[:-1])
+            src, dst = src[distinct], dst[distinct]
+            # Attribute-only graph, used below by plain weight callables
+            graph = FrozenGraph(
+                ids, np.zeros(len(ids) + 1, dtype=np.int64), [], [],
+                activity=activity,
+                interaction=interaction,
+                connection_count=connection_count,
+            )
+        else:
+            graph = Graph()
+            graph.add_nodes_from(
+                ids,
+                activity=activity,
+                interaction=interaction,
+                connection_count=connection_count,
+            )
+
+        # ---------------------------------------------------------
+        # Edge weights
+        # ---------------------------------------------------------
+        weight_fn = weight_formula or DEFAULT_WEIGHT_FORMULA
+        if not np.all(np.isin(dst, ids)):
+            raise ValueError("Both nodes must exist before adding an edge.")
+
+        if hasattr(weight_fn, "compute"):
+            order = np.argsort(ids)
+            u_index = order[np.searchsorted(ids, src, sorter=order)]
+            v_index = order[np.searchsorted(ids, dst, sorter=order)]
+            columns = {
+                "activity": activity,
+                # Node stores these as int, so the formula sees truncated values
+                "interaction": interaction.astype(np.float64),
+                "connection_count": connection_count.astype(np.float64),
+            }
+            weights = weight_fn.compute(columns, u_index, v_index)
+        else:
+            weights = edge_weights(weight_fn, graph.nodes, src, dst)
+
+        if frozen:
+            return FrozenGraph.from_edge_arrays(
+                ids, src, dst, weights,
+                activity=activity,
+                interaction=interaction,
+                connection_count=connection_count,
+            )
+
+        graph.add_edges_from(np.column_stack((src, dst)), weights=weights)
+        graph.weight_formula = weight_fn
+        return graph
+
+    @staticmethod
+    def _load_from_csv_lazy(
+        path: str,
+        column_mapping: Dict[str, str],
+        weight_formula: Optional[Callable],
+        encoding: str,
+    ) -> LazyAttributeGraph:
+        """
+        Topology-first mode of load_from_csv().
+
+        Reads only the node ID and neighbors columns, remembering the byte
+        offset of every row so LazyAttributeGraph can re-read attributes
+        later. Rows must not contain embedded newlines.
+        """
+        with open(path, "rb") as f:
+            header_line = f.readline()
+            header = next(csv.reader([header_line.decode(encoding).lstrip("\ufeff")]), [])
+            position = {name: i for i, name in enumerate(header)}
+            for key in ("node_id", "neighbors"):
+                if column_mapping.get(key) not in position:
+                    raise ValueError(f"Missing {key} column '{column_mapping.get(key)}'.")
+            id_pos = position[column_mapping["node_id"]]
+            neighbors_pos = position[column_mapping["neighbors"]]
+
+            ids = array("q")
+            offsets: Dict[int, int] = {}
+            counts = array("q")  # number of neighbors per row
+            neighbor_lists: List[str] = []
+            offset = len(header_line)
+            for line in f:
+                start = offset
+                offset += len(line)
+                if not line.strip():
+                    continue
+                row = next(csv.reader([line.decode(encoding)]))
+                try:
+                    u = int(row[id_pos])
+                except (IndexError, ValueError) as e:
+                    raise ValueError(f"Failed to read node_id from row: {row}") from e
+                ids.append(u)
+                offsets[u] = start
+
+                neighbors_str = row[neighbors_pos].strip() if neighbors_pos < len(row) else ""
+                if neighbors_str:
+                    neighbor_lists.append(neighbors_str)
+                    counts.append(neighbors_str.count(",") + 1)
+                else:
+                    counts.append(0)
+
+        # Convert all neighbor lists at once
+        us = np.repeat(np.asarray(ids, dtype=np.int64), np.asarray(counts, dtype=np.int64))
+        vs = np.array(",".join(neighbor_lists).split(",") if neighbor_lists else [], dtype=np.int64)
+        upper = us < vs  # Avoid duplicate edges in undirected graph
+
+        graph = LazyAttributeGraph(
+            path, encoding, len(header_line), offsets, GraphLoader._row_parser(header, column_mapping)
+        )
+        graph.weight_formula = weight_formula or DEFAULT_WEIGHT_FORMULA
+        graph.add_nodes_from([LazyNode(nid, graph) for nid in ids])
+
+        # Weights stay NaN until the graph loads attributes
+        edges = np.column_stack((us[upper], vs[upper]))
+        graph.add_edges_from(edges, weights=np.full(len(edges), np.nan))
+        return graph
+
+    @staticmethod
+    def load_from_csv_streaming(
+        path: str,
+        column_mapping: Optional[Dict[str, str]] = None,
+        weight_formula: Optional[Callable] = None,
+        encoding: str = "utf-8",
+        chunk_rows: int = 50_000,
+        progress: Optional[Callable[[int, float], None]] = None,
+    ) -> Graph:
+        """
+        Load the same CSV layout as load_from_csv() in fixed-size row chunks.
+
+        Nodes and edges are added to the graph chunk by chunk instead of
+        buffering every neighbor list first. An edge is added as soon as
+        both endpoints are loaded; only edges whose larger endpoint appears
+        later in the file are kept aside (as compact int64 arrays), so peak
+        memory stays proportional to the final graph, not the raw text.
+
+        Args:
+            path, column_mapping, weight_formula, encoding: as in load_from_csv()
+            chunk_rows: Number of CSV rows parsed and inserted per chunk
+            progress: Optional callback(rows_read, rows_per_second) called after each chunk
+
+        Returns:
+            Graph object with nodes and edges loaded
+        """
+        if column_mapping is None:
+            column_mapping = GraphLoader.DEFAULT_CSV_COLUMNS
+        if chunk_rows <= 0:
+            raise ValueError("chunk_rows must be a positive integer.")
+
+        weight_fn = weight_formula or DEFAULT_WEIGHT_FORMULA
+        graph = Graph()
+        pending: Dict[int, array] = {}  # larger endpoint -> smaller endpoints waiting for it
+        rows_read = 0
+        started = time.perf_counter()
+
+        with open(path, "r", encoding=encoding, newline="") as f:
+            reader = csv.reader(f)
+            parse_row = GraphLoader._row_parser(next(reader, []), column_mapping)
+
+            while True:
+                chunk = list(itertools.islice(reader, chunk_rows))
+                if not chunk:
+                    break
+                parsed = [parse_row(row) for row in chunk if row]
+                graph.add_nodes_from([Node(**node_attrs) for node_attrs, _ in parsed])
+
+                nodes = graph.nodes
+                edges = []
+
+                # Edges from earlier rows that were waiting for these nodes
+                for node_attrs, _ in parsed:
+                    v = node_attrs["node_id"]
+                    waiting = pending.pop(v, None)
+                    if waiting is not None:
+                        edges.extend((u, v) for u in waiting)
+
+                # Edges listed by this chunk (u < v avoids duplicates)
+                for node_attrs, neighbors in parsed:
+                    u = node_attrs["node_id"]
+                    for v in neighbors:
+                        if u < v:
+                            if v in nodes:
+                                edges.append((u, v))
+                            else:
+                                pending.setdefault(v, array("q")).append(u)
+
+                if edges:
+                    us, vs = zip(*edges)
+                    graph.add_edges_from(edges, weights=edge_weights(weight_fn, nodes, us, vs))
+
+                rows_read += len(chunk)
+                if progress is not None:
+                    elapsed = time.perf_counter() - started
+                    progress(rows_read, rows_read / elapsed if elapsed > 0 else float("inf"))
+
+        if pending:
+            missing = min(pending)
+            raise ValueError(
+                f"Neighbor {missing} of node {pending[missing][0]} is not defined in {path}."
+            )
 
+        graph.weight_formula = weight_fn
         return graph
 
+    @staticmethod
+    def _row_parser(header: List[str], column_mapping: Dict[str, str]) -> Callable:
+        """
+        Return a function that turns one CSV row (a list of strings) into
+        (node_attrs, neighbors), where node_attrs holds Node keyword arguments.
+        """
+        position = {name: i for i, name in enumerate(header)}
+        standard = ["node_id", "activity", "interaction", "connection_count", "neighbors"]
+
+        id_pos = position.get(column_mapping["node_id"])
+        attr_pos = [
+            (key, position[column_mapping[key]])
+            for key in ["activity", "interaction", "connection_count"]
+            if key in column_mapping and column_mapping[key] in position
+        ]
+        custom_pos = [
+            (key, position[col_name])
+            for key, col_name in column_mapping.items()
+            if key not in standard and col_name in position
+        ]
+        neighbors_pos = None
+        if "neighbors" in column_mapping:
+            if column_mapping["neighbors"] not in position:
+                raise ValueError(f"Missing neighbors column '{column_mapping['neighbors']}'.")
+            neighbors_pos = position[column_mapping["neighbors"]]
+
+        def parse_row(row: List[str]) -> Tuple[Dict[str, Any], List[int]]:
+            try:
+                node_id = int(row[id_pos])
+            except (IndexError, TypeError, ValueError) as e:
+                raise ValueError(f"Failed to read node_id from row: {row}") from e
+
+            node_attrs: Dict[str, Any] = {"node_id": node_id}
+
+            # Read optional attributes
+            for key, i in attr_pos:
+                value = row[i] if i < len(row) else ""
+                if value.strip():
+                    try:
+                        node_attrs[key] = float(value)
+                    except ValueError:
+                        pass  # Skip if conversion fails
+
+            # Read any additional custom attributes
+            for key, i in custom_pos:
+                value = row[i] if i < len(row) else ""
+                if value.strip():
+                    try:
+                        node_attrs[key] = float(value)
+                    except ValueError:
+                        node_attrs[key] = value  # Store as string if not numeric
+
+            neighbors = []
+            if neighbors_pos is not None and neighbors_pos < len(row):
+                neighbors_str = row[neighbors_pos]
+                if neighbors_str.strip():
+                    neighbors = [int(x) for x in neighbors_str.split(",")]
+
+            return node_attrs, neighbors
+
+        return parse_row
+
+    @staticmethod
+    def load_edge_list(
+        path: str,
+        attributes_path: Optional[str] = None,
+        attribute_columns: Optional[Dict[str, str]] = None,
+        weight_formula: Optional[Callable] = None,
+        comments: str = "#",
+        block_bytes: int = 1 << 24,
+    ) -> Graph:
+        """
+        Load a whitespace-separated edge list (SNAP style), one "u v [weight]"
+        line per edge, with optional node attributes from a separate file.
+
+        The edge list is read in blocks of about `block_bytes` and each block
+        is tokenized and converted to NumPy arrays in one go; the graph is
+        then built with add_nodes_from() / add_edges_from(). Every endpoint
+        becomes a node. Lines starting with `comments` are skipped, repeated
+        pairs (e.g. both "u v" and "v u") collapse to one edge and
+        self-loops are dropped, since Graph does not allow them.
+
+        Args:
+            path: Path to the edge list
+            attributes_path: Optional columnar file (comma or whitespace
+                             separated, with a header row) of node attributes;
+                             nodes listed there but in no edge are added too
+            attribute_columns: Dict mapping 'node_id', 'activity', 'interaction'
+                               and 'connection_count' to header names of the
+                               attributes file. If None, uses DEFAULT_CSV_COLUMNS.
+            weight_formula: Used when the edge list has no weight column
+            comments: Comment line prefix
+            block_bytes: Approximate number of bytes parsed per block
+
+        Returns:
+            Graph object with nodes and edges loaded
+        """
+        us, vs, given = [], [], []
+        width = None
+        for rows in GraphLoader._numeric_blocks(path, comments, block_bytes):
+            if width is None:
+                width = rows.shape[1]
+                if width not in (2, 3):
+                    raise ValueError(f"Edge list lines must be 'u v [weight]', found {width} columns.")
+            elif rows.shape[1] != width:
+                raise ValueError(f"Edge list lines must all have {width} columns.")
+            u = rows[:, 0].astype(np.int64)
+            v = rows[:, 1].astype(np.int64)
+            keep = u != v
+            us.append(u[keep])
+            vs.append(v[keep])
+            if width == 3:
+                given.append(rows[keep, 2].astype(np.float64))
+
+        u = np.concatenate(us) if us else np.empty(0, dtype=np.int64)
+        v = np.concatenate(vs) if vs else np.empty(0, dtype=np.int64)
+
+        # ---------------------------------------------------------
+        # Nodes: attribute file rows first, then the remaining endpoints
+        # ---------------------------------------------------------
+        columns = {}
+        ids = np.empty(0, dtype=np.int64)
+        if attributes_path is not None:
+            ids, columns = GraphLoader._read_attribute_columns(
+                attributes_path, attribute_columns or GraphLoader.DEFAULT_CSV_COLUMNS, comments
+            )
+        endpoints = np.unique(np.concatenate((u, v)))
+        extra = endpoints[~np.isin(endpoints, ids)]
+        padding = np.zeros(len(extra))
+
+        graph = Graph()
+        graph.add_nodes_from(
+            np.concatenate((ids, extra)),
+            **{key: np.concatenate((values, padding)) for key, values in columns.items()},
+        )
+
+        # ---------------------------------------------------------
+        # Edges
+        # ---------------------------------------------------------
+        weight_fn = weight_formula or DEFAULT_WEIGHT_FORMULA
+        if width == 3:
+            weights = np.concatenate(given)
+        else:
+            weights = edge_weights(weight_fn, graph.nodes, u, v)
+
+        graph.add_edges_from(np.column_stack((u, v)), weights=weights)
+        graph.weight_formula = weight_fn
+        return graph
+
+    @staticmethod
+    def _numeric_blocks(path: str, comments: str, block_bytes: int, skip_header: bool = False):
+        """
+        Yield the rows of a whitespace/comma separated text file as 2-D
+        arrays of byte-string tokens, one array per block of lines.
+        """
+        comment = comments.encode() if comments else None
+        width = None  # taken from the first data line, enforced on every line
+        with open(path, "rb") as f:
+            if skip_header:
+                f.readline()
+            while True:
+                block = f.read(block_bytes)
+                if not block:
+                    break
+                block += f.readline()  # finish the last line of the block
+                if b"," in block:
+                    block = block.replace(b",", b" ")
+                if comment and comment in block:
+                    block = b"\n".join(
+                        line for line in block.split(b"\n") if not line.lstrip().startswith(comment)
+                    )
+
+                tokens = block.split()
+                if not tokens:
+                    continue
+                counts = GraphLoader._tokens_per_line(block)
+                if width is None:
+                    width = int(counts[0])
+                bad = np.flatnonzero(counts != width)
+                if len(bad):
+                    line = [line for line in block.splitlines() if line.strip()][bad[0]]
+                    raise ValueError(
+                        f"Expected {width} columns, found {counts[bad[0]]}: {line.decode().strip()}"
+                    )
+
+                yield np.array(tokens).reshape(-1, width)
+
+    @staticmethod
+    def _tokens_per_line(block: bytes) -> np.ndarray:
+        """Number of whitespace-separated tokens on each non-blank line of a block."""
+        buf = np.frombuffer(block, dtype=np.uint8)
+        space = _WHITESPACE_BYTES[buf]
+        starts = ~space
+        starts[1:] &= space[:-1]
+        # Line index of every token start, then tokens per line (blank lines drop out)
+        newlines = np.flatnonzero(buf == ord("\n"))
+        line_of_token = np.searchsorted(newlines, np.flatnonzero(starts))
+        counts = np.bincount(line_of_token)
+        return counts[counts > 0]
+
+    @staticmethod
+    def _read_attribute_columns(
+        path: str,
+        column_mapping: Dict[str, str],
+        comments: str,
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Read a columnar node attribute file (header row, then one node per
+        line) into an ID array and activity/interaction/connection_count
+        columns, as used by load_edge_list().
+        """
+        with open(path, "rb") as f:
+            header = f.readline().decode("utf-8").lstrip("\ufeff").replace(",", " ").split()
+        position = {name: i for i, name in enumerate(header)}
+        if column_mapping["node_id"] not in position:
+            raise ValueError(f"Missing node_id column '{column_mapping['node_id']}'.")
+
+        blocks = list(GraphLoader._numeric_blocks(path, comments, 1 << 24, skip_header=True))
+        rows = np.concatenate(blocks) if blocks else np.empty((0, len(header)), dtype="S1")
+        if rows.shape[1] != len(header):
+            raise ValueError(f"Expected {len(header)} columns in {path}, found {rows.shape[1]}.")
+
+        ids = rows[:, position[column_mapping["node_id"]]].astype(np.int64)
+        columns = {}
+        for key in ("activity", "interaction", "connection_count"):
+            name = column_mapping.get(key)
+            if name in position:
+                values = rows[:, position[name]].astype(np.float64)
+                columns[key] = values if key == "activity" else values.astype(np.int64)
+        return ids, columns
+
     @staticmethod
     def load_from_json(
         path: str,
         weight_formula: Optional[Callable] = None,
         encoding: str = "utf-8",
+        cache: Optional[ParseCache] = None,
     ) -> Graph:
         """
         Load nodes and edges from a JSON file.
 
+        The file is streamed: nodes and edges are decoded one element at a
+        time into compact columns, so peak memory stays close to the size
+        of the final graph. Paths ending in .gz or .xz are decompressed.
+
         JSON structure expected:
         {
             "nodes": [
@@ -136,44 +711,389 @@ class GraphLoader:
                 ...
             ]
         }
+        Nodes may use "node_id" instead of "id", and edges "u"/"v" instead
+        of "source"/"target" (the layout saved by the UI). Other node
+        fields, such as canvas positions, are ignored.
 
         Args:
             path: Path to the JSON file
             weight_formula: Custom weight calculation function (not used if weights are in JSON)
             encoding: File encoding
+            cache: Optional ParseCache, as in load_from_csv()
 
         Returns:
             Graph object with nodes and edges loaded
         """
-        with open(path, "r", encoding=encoding) as f:
-            data = json.load(f)
+        key = GraphLoader._cache_key(cache, path, weight_formula, loader="json", encoding=encoding)
+        if key is not None:
+            graph = cache.get(key)
+            if graph is None:
+                graph = GraphLoader.load_from_json(path, weight_formula, encoding)
+                cache.put(key, graph)
+            graph.weight_formula = weight_formula or DEFAULT_WEIGHT_FORMULA
+            return graph
 
-        graph = Graph()
+        # Stream both arrays into compact columns, one element at a time
+        ids = array("q")
+        activity = array("d")
+        interaction = array("d")
+        connection_count = array("d")
+        names: List[Optional[str]] = []
+        us = array("q")
+        vs = array("q")
+        weights = array("d")  # NaN where the file gives no weight
 
-        # Load nodes
-        for node_data in data.get("nodes", []):
-            node = Node(**node_data)
-            graph.add_node_object(node)
+        for section, item in iter_json_graph(path, encoding):
+            if section == "nodes":
+                ids.append(int(item["id"] if "id" in item else item["node_id"]))
+                activity.append(float(item.get("activity", 0.0)))
+                interaction.append(float(item.get("interaction", 0)))
+                connection_count.append(float(item.get("connection_count", 0)))
+                names.append(item.get("name"))
+            elif section == "edges":
+                us.append(int(item["source"] if "source" in item else item["u"]))
+                vs.append(int(item["target"] if "target" in item else item["v"]))
+                weights.append(float(item.get("weight", "nan")))
 
-        # Load edges
-        default_weight_fn = weight_formula or GraphLoader._default_weight_formula
-        
-        for edge_data in data.get("edges", []):
-            u = edge_data["source"]
-            v = edge_data["target"]
-            
-            # Use provided weight or calculate
-            if "weight" in edge_data:
-                weight = edge_data["weight"]
-            else:
-                n1 = graph.nodes[u]
-                n2 = graph.nodes[v]
-                weight = default_weight_fn(n1, n2)
-            
-            graph.add_edge(u, v, weight)
+        graph = Graph()
+        graph.add_nodes_from(
+            ids,
+            activity=activity,
+            interaction=np.asarray(interaction).astype(np.int64),
+            connection_count=np.asarray(connection_count).astype(np.int64),
+            names=names,
+        )
 
+        # Calculate missing weights (in one pass)
+        default_weight_fn = weight_formula or DEFAULT_WEIGHT_FORMULA
+        edges = np.column_stack((np.asarray(us, dtype=np.int64), np.asarray(vs, dtype=np.int64)))
+        w = np.asarray(weights, dtype=np.float64)
+        missing = np.isnan(w)
+        if missing.any():
+            w[missing] = edge_weights(
+                default_weight_fn, graph.nodes, edges[missing, 0], edges[missing, 1]
+            )
+
+        graph.add_edges_from(edges, weights=w)
+        graph.weight_formula = default_weight_fn
         return graph
 
+    @staticmethod
+    def save_to_json(
+        graph,
+        path: str,
+        node_extras: Optional[Dict[int, Dict[str, Any]]] = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        """
+        Save a graph as compact JSON in the format read by load_from_json().
+
+        Nodes and edges are written one at a time, so no intermediate
+        document is built. Paths ending in .gz or .xz are compressed.
+
+        Args:
+            graph: Graph (or anything with the same query surface) to save
+            path: Destination file path
+            node_extras: Optional node_id -> dict of extra fields to store
+                         with each node (e.g. canvas positions)
+            encoding: File encoding
+        """
+        extras = node_extras or {}
+
+        def nodes():
+            for nid, node in graph.nodes.items():
+                data = {
+                    "id": nid,
+                    "activity": node.activity,
+                    "interaction": node.interaction,
+                    "connection_count": node.connection_count,
+                }
+                if node.name != f"User {nid}":
+                    data["name"] = node.name
+                data.update(extras.get(nid, {}))
+                yield data
+
+        def edges():
+            for edge in graph.get_edges():
+                yield {"source": edge.u, "target": edge.v, "weight": edge.weight}
+
+        write_json_graph(path, nodes(), edges(), encoding)
+
+    @staticmethod
+    def apply_delta(
+        graph: Graph,
+        path: str,
+        column_mapping: Optional[Dict[str, str]] = None,
+        encoding: str = "utf-8",
+    ) -> DeltaReport:
+        """
+        Apply an incremental update CSV to an existing graph.
+
+        Each row holds one operation in the op column, named like the journal
+        change kinds: add_node, update_node, remove_node, add_edge or
+        remove_edge. Node rows use node_id and any attribute columns; edge
+        rows use node_id and target_id, plus an optional weight for add_edge
+        (computed with graph.weight_formula when empty).
+
+        The file is validated first, then applied in bulk in a fixed order:
+        edge removals, node removals, node additions, attribute updates,
+        edge additions. Only the weights of edges incident to updated nodes
+        are recomputed. Removing an edge that does not exist is ignored.
+
+        Args:
+            graph: Graph to update in place
+            path: Path to the delta CSV file
+            column_mapping: Dict mapping 'op', 'node_id', 'target_id',
+                            'activity', 'interaction', 'connection_count' and
+                            'weight' to CSV column names.
+                            If None, uses DEFAULT_DELTA_COLUMNS.
+            encoding: File encoding
+
+        Returns:
+            DeltaReport describing what changed
+        """
+        if column_mapping is None:
+            column_mapping = GraphLoader.DEFAULT_DELTA_COLUMNS
+
+        node_adds: Dict[int, Dict[str, float]] = {}
+        node_updates: Dict[int, Dict[str, float]] = {}
+        node_removes: Dict[int, None] = {}
+        edge_adds: Dict[Tuple[int, int], Optional[float]] = {}
+        edge_removes: Dict[Tuple[int, int], None] = {}
+
+        with open(path, "r", encoding=encoding, newline="") as f:
+            reader = csv.reader(f)
+            header = [name.lstrip("\ufeff") for name in next(reader, [])]
+            position = {name: i for i, name in enumerate(header)}
+            for key in ("op", "node_id"):
+                if column_mapping[key] not in position:
+                    raise ValueError(f"Missing {key} column '{column_mapping[key]}'.")
+
+            def cell(row: List[str], key: str) -> Optional[str]:
+                i = position.get(column_mapping.get(key))
+                value = row[i].strip() if i is not None and i < len(row) else ""
+                return value or None
+
+            for line, row in enumerate(reader, start=2):
+                if not row:
+                    continue
+                op = cell(row, "op")
+                if op not in DELTA_OPERATIONS:
+                    raise ValueError(f"Line {line}: unknown operation {op!r}.")
+                try:
+                    u = int(cell(row, "node_id"))
+                    v = int(cell(row, "target_id")) if op in (EDGE_ADDED, EDGE_REMOVED) else None
+                    attrs = {}
+                    for key in ("activity", "interaction", "connection_count"):
+                        value = cell(row, key)
+                        if value is not None:
+                            attrs[key] = float(value)
+                    weight = cell(row, "weight")
+                    weight = float(weight) if weight is not None else None
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"Line {line}: invalid value in row {row}") from e
+
+                if op == NODE_ADDED:
+                    node_adds[u] = attrs
+                elif op == NODE_UPDATED:
+                    node_updates.setdefault(u, {}).update(attrs)
+                elif op == NODE_REMOVED:
+                    node_removes[u] = None
+                elif op == EDGE_ADDED:
+                    edge_adds[graph._edge_key(u, v)] = weight
+                else:
+                    edge_removes[graph._edge_key(u, v)] = None
+
+        # ---------------------------------------------------------
+        # Validate everything before touching the graph
+        # ---------------------------------------------------------
+        for nid in node_removes:
+            if nid not in graph.nodes:
+                raise ValueError(f"Cannot remove node {nid}: node not found.")
+        for nid in node_adds:
+            if nid in graph.nodes and nid not in node_removes:
+                raise ValueError(f"Node with ID {nid} already exists.")
+
+        def exists_after(nid: int) -> bool:
+            return nid in node_adds or (nid in graph.nodes and nid not in node_removes)
+
+        for nid in list(node_updates):
+            if not exists_after(nid):
+                raise ValueError(f"Cannot update node {nid}: node not found.")
+            if nid in node_adds:
+                # Updating a node added by the same delta just sets its attributes
+                node_adds[nid].update(node_updates.pop(nid))
+        for u, v in edge_adds:
+            if not exists_after(u) or not exists_after(v):
+                raise ValueError(f"Cannot add edge ({u}, {v}): both nodes must exist.")
+
+        # ---------------------------------------------------------
+        # Apply
+        # ---------------------------------------------------------
+        report = DeltaReport(version_before=graph.version)
+
+        report.edges_removed = graph.remove_edges_from(edge_removes)
+        for nid in node_removes:
+            report.edges_removed.extend(
+                (nid, neighbor) if nid < neighbor else (neighbor, nid)
+                for neighbor in graph.neighbors(nid)
+            )
+            graph.remove_node(nid)
+        report.nodes_removed = list(node_removes)
+
+        if node_adds:
+            ids = list(node_adds)
+            graph.add_nodes_from(
+                ids,
+                activity=[node_adds[nid].get("activity", 0.0) for nid in ids],
+                interaction=[int(node_adds[nid].get("interaction", 0)) for nid in ids],
+                connection_count=[int(node_adds[nid].get("connection_count", 0)) for nid in ids],
+            )
+        report.nodes_added = list(node_adds)
+
+        for nid, attrs in node_updates.items():
+            graph.update_node(nid, **attrs)
+        report.nodes_updated = list(node_updates)
+        if node_updates:
+            touched = {
+                (nid, neighbor) if nid < neighbor else (neighbor, nid)
+                for nid in node_updates
+                for neighbor in graph.neighbors(nid)
+            }
+            graph.recompute_edge_weights(node_updates)
+            # Edges also added by this delta are reported in edges_added only
+            report.edges_reweighted = sorted(key for key in touched if key not in edge_adds)
+
+        if edge_adds:
+            keys = list(edge_adds)
+            weights = np.array(
+                [np.nan if weight is None else weight for weight in edge_adds.values()]
+            )
+            missing = np.isnan(weights)
+            if missing.any():
+                pending = np.array(keys, dtype=np.int64)[missing]
+                weights[missing] = edge_weights(
+                    graph.weight_formula, graph.nodes, pending[:, 0], pending[:, 1]
+                )
+            graph.add_edges_from(keys, weights=weights)
+            report.edges_added = keys
+
+        report.version_after = graph.version
+        return report
+
+    @staticmethod
+    def _cache_key(
+        cache: Optional[ParseCache],
+        path: str,
+        weight_formula: Optional[Callable],
+        **params: Any,
+    ) -> Optional[str]:
+        """
+        Return the ParseCache key for a load, or None if it must not be cached
+        (no cache given, or a weight formula that cannot be identified).
+        """
+        if cache is None:
+            return None
+        formula_key = getattr(weight_formula or DEFAULT_WEIGHT_FORMULA, "cache_key", None)
+        if formula_key is None:
+            return None
+        return cache.key(path, weight_formula=formula_key(), **params)
+
+    @staticmethod
+    def save_binary(graph, path: str) -> None:
+        """
+        Save a graph in the native binary format.
+
+        File layout:
+            8 bytes   magic (BINARY_MAGIC)
+            4 bytes   format version, little-endian uint32
+            4 bytes   header length, little-endian uint32
+            header    UTF-8 JSON: counts, custom node names and, for every
+                      array in BINARY_ARRAYS, its dtype, offset and length
+            arrays    the CSR arrays and node attribute columns of the
+                      graph's FrozenGraph, each aligned to BINARY_ALIGNMENT
+
+        Args:
+            graph: Graph, GraphSnapshot or FrozenGraph to save
+            path: Destination file path
+        """
+        frozen = graph if isinstance(graph, FrozenGraph) else graph.freeze()
+        align = GraphLoader.BINARY_ALIGNMENT
+
+        header = {
+            "num_nodes": len(frozen.ids),
+            "num_edges": frozen.num_edges,
+            "names": {str(i): name for i, name in frozen.names.items()},
+            "arrays": {},
+        }
+
+        # The header size depends on the offsets, so lay the arrays out
+        # from a first estimate and grow it until everything fits
+        data_start = align
+        while True:
+            offset = data_start
+            for name, dtype in GraphLoader.BINARY_ARRAYS.items():
+                length = len(getattr(frozen, name))
+                header["arrays"][name] = {"dtype": dtype, "offset": offset, "length": length}
+                offset += -(-length * np.dtype(dtype).itemsize // align) * align
+            header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+            if 16 + len(header_bytes) <= data_start:
+                break
+            data_start = -(-(16 + len(header_bytes)) // align) * align
+
+        with open(path, "wb") as f:
+            f.write(GraphLoader.BINARY_MAGIC)
+            f.write(np.array([GraphLoader.BINARY_VERSION, len(header_bytes)], dtype="<u4").tobytes())
+            f.write(header_bytes)
+            for name, spec in header["arrays"].items():
+                f.write(b"\0" * (spec["offset"] - f.tell()))
+                np.ascontiguousarray(getattr(frozen, name), dtype=spec["dtype"]).tofile(f)
+
+    @staticmethod
+    def load_binary(path: str, mmap: bool = True) -> FrozenGraph:
+        """
+        Open a graph saved with save_binary().
+
+        Args:
+            path: Path to the binary file
+            mmap: Memory-map the arrays (pages are read lazily on access);
+                  False reads the whole file into memory instead
+
+        Returns:
+            FrozenGraph backed by the file's arrays
+        """
+        with open(path, "rb") as f:
+            magic = f.read(len(GraphLoader.BINARY_MAGIC))
+            if magic != GraphLoader.BINARY_MAGIC:
+                raise ValueError(f"{path} is not a binary graph file.")
+            version, header_length = np.frombuffer(f.read(8), dtype="<u4").tolist()
+            if version != GraphLoader.BINARY_VERSION:
+                raise ValueError(f"Unsupported binary graph format version: {version}")
+            header = json.loads(f.read(header_length).decode("utf-8"))
+
+            arrays = {}
+            for name, spec in header["arrays"].items():
+                if spec["length"] == 0:
+                    arrays[name] = np.empty(0, dtype=spec["dtype"])
+                elif mmap:
+                    arrays[name] = np.memmap(
+                        path, dtype=spec["dtype"], mode="r",
+                        offset=spec["offset"], shape=(spec["length"],),
+                    )
+                else:
+                    f.seek(spec["offset"])
+                    arrays[name] = np.fromfile(f, dtype=spec["dtype"], count=spec["length"])
+
+        return FrozenGraph(
+            arrays["ids"], arrays["indptr"], arrays["indices"], arrays["weights"],
+            activity=arrays["activity"],
+            interaction=arrays["interaction"],
+            connection_count=arrays["connection_count"],
+            names={int(i): name for i, name in header["names"].items()},
+            # save_binary() wrote the ids of a FrozenGraph, so they are sorted
+            validate=False,
+        )
+
     @staticmethod
     def _default_weight_formula(node1: Node, node2: Node) -> float:
         """
@@ -181,12 +1101,7 @@ class GraphLoader:
         
         weight = 1 / (1 + sqrt(sum of squared differences))
         """
-        activity_diff = (node1.activity - node2.activity) ** 2
-        interaction_diff = (node1.interaction - node2.interaction) ** 2
-        connection_diff = (node1.connection_count - node2.connection_count) ** 2
-        
-        distance = math.sqrt(activity_diff + interaction_diff + connection_diff)
-        return 1.0 / (1.0 + distance)
+        return DEFAULT_WEIGHT_FORMULA(node1, node2)
 
     @staticmethod
     def create_custom_weight_formula(
@@ -201,22 +1116,56 @@ class GraphLoader:
             weights: Optional list of weights for each attribute (default: equal weights)
 
         Returns:
-            A callable weight function
+            A callable WeightFormula, which Graph.recompute_edge_weights()
+            can also evaluate over all edges at once
         """
-        if weights is None:
-            weights = [1.0] * len(attribute_names)
+        return WeightFormula(attribute_names, weights)
+
+
+def _parse_csv_range(task) -> Tuple[np.ndarray, ...]:
+    """
+    Parse the CSV rows that start inside the byte range [start, end).
+
+    Runs in a worker process of GraphLoader._load_from_csv_parallel() and
+    returns (ids, activity, interaction, connection_count, src, dst), where
+    src/dst hold the edges listed by these rows with src < dst.
+    """
+    path, start, end, header, column_mapping, encoding = task
+
+    with open(path, "rb") as f:
+        # Finish the row that straddles `start`; it belongs to the previous range
+        f.seek(start - 1)
+        f.readline()
+        data_start = f.tell()
+        block = b""
+        if data_start < end:
+            block = f.read(end - data_start)
+            if not block.endswith(b"\n"):
+                block += f.readline()
 
-        if len(weights) != len(attribute_names):
-            raise ValueError("weights and attribute_names must have the same length")
+    parse_row = GraphLoader._row_parser(header, column_mapping)
+    ids = array("q")
+    activity = array("d")
+    interaction = array("d")
+    connection_count = array("d")
+    src = array("q")
+    dst = array("q")
 
-        def custom_formula(node1: Node, node2: Node) -> float:
-            distance_sq = 0.0
-            for attr, weight in zip(attribute_names, weights):
-                val1 = getattr(node1, attr, 0.0)
-                val2 = getattr(node2, attr, 0.0)
-                distance_sq += weight * ((val1 - val2) ** 2)
-            
-            distance = math.sqrt(distance_sq)
-            return 1.0 / (1.0 + distance)
+    for row in csv.reader(io.StringIO(block.decode(encoding), newline="")):
+        if not row:
+            continue
+        node_attrs, neighbors = parse_row(row)
+        u = node_attrs["node_id"]
+        ids.append(u)
+        activity.append(node_attrs.get("activity", 0.0))
+        interaction.append(node_attrs.get("interaction", 0.0))
+        connection_count.append(node_attrs.get("connection_count", 0.0))
+        for v in neighbors:
+            if u < v:  # Avoid duplicate edges in undirected graph
+                src.append(u)
+                dst.append(v)
 
-        return custom_formula
+    return tuple(
+        np.frombuffer(values, dtype=np.int64 if values.typecode == "q" else np.float64)
+        for values in (ids, activity, interaction, connection_count, src, dst)
+    )
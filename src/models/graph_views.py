@@ -0,0 +1,155 @@
+from collections.abc import Mapping
+from typing import Callable, Iterable, Iterator
+
+from .frozen_graph import FrozenGraph
+
+
+class _FilteredNodes(Mapping):
+    """Read-only node_id -> Node mapping that hides nodes rejected by a view."""
+
+    __slots__ = ("_view",)
+
+    def __init__(self, view: "GraphView"):
+        self._view = view
+
+    def __getitem__(self, node_id):
+        if node_id not in self:
+            raise KeyError(node_id)
+        return self._view.graph.nodes[node_id]
+
+    def __contains__(self, node_id) -> bool:
+        return node_id in self._view.graph.nodes and self._view._node_ok(int(node_id))
+
+    def __iter__(self) -> Iterator[int]:
+        node_ok = self._view._node_ok
+        return (nid for nid in self._view.graph.nodes if node_ok(nid))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class GraphView:
+    """
+    Lazy, read-only filtered view over a Graph (or a snapshot, a
+    FrozenGraph or another view). Nothing is copied: every query is
+    answered from the underlying graph, so the view follows its changes.
+
+    Subclasses decide which nodes and edges are visible through
+    _node_ok(node_id) and _edge_ok(weight). Filters run on every query,
+    so len(nodes) and degree() count visible entries each time they are
+    called; freeze() the view when it is queried heavily.
+    """
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes = _FilteredNodes(self)
+
+    @property
+    def version(self) -> int | None:
+        """
+        Version of the underlying graph, so indexes built on the view notice
+        its changes. A FrozenGraph never changes and counts as version 0.
+        """
+        if isinstance(self.graph, FrozenGraph):
+            return 0
+        return getattr(self.graph, "version", None)
+
+    def _node_ok(self, node_id: int) -> bool:
+        return True
+
+    def _edge_ok(self, weight: float) -> bool:
+        return True
+
+    def weighted_neighbors(self, node_id: int) -> Iterator[tuple[int, float]]:
+        """Iterate over visible (neighbor ID, weight) pairs of a given node."""
+        if node_id not in self.nodes:
+            return iter(())
+        node_ok = self._node_ok
+        edge_ok = self._edge_ok
+        return (
+            (v, weight)
+            for v, weight in self.graph.weighted_neighbors(node_id)
+            if edge_ok(weight) and node_ok(v)
+        )
+
+    def neighbors(self, node_id: int) -> Iterator[int]:
+        """Iterate over the visible neighbor IDs of a given node."""
+        return (v for v, _ in self.weighted_neighbors(node_id))
+
+    def get_neighbors(self, node_id: int) -> set[int]:
+        """Return a copy of the visible neighbor IDs of a given node."""
+        return set(self.neighbors(node_id))
+
+    def degree(self, node_id: int) -> int:
+        """Return the number of visible neighbors of a given node."""
+        return sum(1 for _ in self.weighted_neighbors(node_id))
+
+    def get_edge_weight(self, u: int, v: int) -> float | None:
+        """Return the weight of edge (u, v), or None if it is not visible."""
+        weight = self.graph.get_edge_weight(u, v)
+        if weight is None or u not in self.nodes or v not in self.nodes:
+            return None
+        return weight if self._edge_ok(weight) else None
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """Check if there is a visible edge between u and v."""
+        return self.get_edge_weight(u, v) is not None
+
+    def get_nodes(self) -> list:
+        """Return all visible nodes as a list."""
+        return list(self.nodes.values())
+
+    def get_edges(self) -> list:
+        """Return all visible edges as a list."""
+        node_ok = self._node_ok
+        return [
+            edge for edge in self.graph.get_edges()
+            if self._edge_ok(edge.weight) and node_ok(edge.u) and node_ok(edge.v)
+        ]
+
+    def freeze(self) -> FrozenGraph:
+        """Materialise the view as a compact CSR snapshot."""
+        return FrozenGraph.from_graph(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(nodes={len(self.nodes)})"
+
+
+class InducedSubgraphView(GraphView):
+    """View of the subgraph induced by a set of node IDs."""
+
+    def __init__(self, graph, node_ids: Iterable[int]):
+        super().__init__(graph)
+        self.node_ids = frozenset(int(nid) for nid in node_ids)
+
+    def _node_ok(self, node_id: int) -> bool:
+        return node_id in self.node_ids
+
+
+class EdgeThresholdView(GraphView):
+    """
+    View that keeps only edges whose weight lies in [min_weight, max_weight].
+    Either bound may be None. All nodes stay visible.
+    """
+
+    def __init__(self, graph, min_weight: float | None = None, max_weight: float | None = None):
+        super().__init__(graph)
+        self.min_weight = float("-inf") if min_weight is None else float(min_weight)
+        self.max_weight = float("inf") if max_weight is None else float(max_weight)
+
+    def _edge_ok(self, weight: float) -> bool:
+        return self.min_weight <= weight <= self.max_weight
+
+
+class NodePredicateView(GraphView):
+    """
+    View that keeps only nodes for which predicate(node) is true,
+    e.g. NodePredicateView(graph, lambda n: n.activity > 0.5).
+    """
+
+    def __init__(self, graph, predicate: Callable[[object], bool]):
+        super().__init__(graph)
+        self.predicate = predicate
+
+    def _node_ok(self, node_id: int) -> bool:
+        return bool(self.predicate(self.graph.nodes[node_id]))
@@ -0,0 +1,79 @@
+from collections import deque
+from typing import NamedTuple
+
+
+# Change kinds recorded by Graph
+NODE_ADDED = "add_node"
+NODE_UPDATED = "update_node"
+NODE_REMOVED = "remove_node"
+EDGE_ADDED = "add_edge"
+EDGE_WEIGHT_UPDATED = "update_weight"
+EDGE_REMOVED = "remove_edge"
+GRAPH_CLEARED = "clear"
+
+
+class GraphChange(NamedTuple):
+    """
+    One mutation of a Graph.
+    - version: graph version right after the change
+    - kind: one of the change kind constants above
+    - u: node ID (first endpoint for edge changes)
+    - v: second endpoint for edge changes, otherwise None
+    - weight: new edge weight for add/update edge changes, otherwise None
+    """
+
+    version: int
+    kind: str
+    u: int | None = None
+    v: int | None = None
+    weight: float | None = None
+
+
+class ChangeJournal:
+    """
+    Bounded log of graph changes.
+
+    Only the most recent `maxlen` changes are kept. since() tells callers
+    whether the journal still covers everything after a given version, so
+    a cache built at that version can be patched or must be rebuilt.
+    """
+
+    def __init__(self, maxlen: int, start_version: int = 0):
+        if maxlen <= 0:
+            raise ValueError("maxlen must be a positive integer.")
+        self._entries: deque[GraphChange] = deque(maxlen=maxlen)
+        # Changes up to and including this version are not (or no longer) recorded
+        self._floor = start_version
+
+    def record(self, change: GraphChange) -> None:
+        """Append a change, evicting the oldest one when the journal is full."""
+        if len(self._entries) == self._entries.maxlen:
+            self._floor = self._entries[0].version
+        self._entries.append(change)
+
+    def skip(self, version: int) -> None:
+        """
+        Drop everything up to and including `version` without recording it,
+        e.g. for a bulk change with more elements than the journal keeps.
+        """
+        self._entries.clear()
+        self._floor = version
+
+    @property
+    def maxlen(self) -> int:
+        return self._entries.maxlen
+
+    def since(self, version: int) -> list[GraphChange] | None:
+        """
+        Return the changes made after `version`, oldest first.
+        Returns None if some of them were never recorded or already evicted.
+        """
+        if version < self._floor:
+            return None
+        return [change for change in self._entries if change.version > version]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self):
+        return iter(self._entries)
@@ -0,0 +1,155 @@
+import gzip
+import json
+import lzma
+from typing import IO, Any, Dict, Iterable, Iterator, Tuple
+
+
+# Size of each read from the underlying file while streaming
+READ_SIZE = 1 << 16
+
+_DECODER = json.JSONDecoder()
+_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False)
+_WHITESPACE = " \t\n\r"
+
+
+def open_text(path: str, mode: str = "r", encoding: str = "utf-8") -> IO[str]:
+    """
+    Open a text file, transparently (de)compressing .gz and .xz files.
+    mode is "r" or "w".
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding=encoding)
+    if path.endswith(".xz"):
+        return lzma.open(path, mode + "t", encoding=encoding)
+    return open(path, mode, encoding=encoding)
+
+
+class _Buffer:
+    """Sliding text window over a file, refilled on demand."""
+
+    def __init__(self, f: IO[str]):
+        self.f = f
+        self.text = ""
+        self.pos = 0
+        self.eof = False
+
+    def fill(self) -> bool:
+        """Read more text; returns False at end of file."""
+        if self.eof:
+            return False
+        chunk = self.f.read(READ_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the window stays small
+        self.text = self.text[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Return the next non-whitespace character ("" at end of file)."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return ""
+
+    def expect(self, char: str) -> None:
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Invalid graph JSON: expected {char!r}, found {found or 'end of file'!r}")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode one complete JSON value starting at the next token."""
+        self.peek()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.text, self.pos)
+            except json.JSONDecodeError:
+                if self.fill():
+                    continue
+                raise
+            # A value ending exactly at the window edge (e.g. a number)
+            # may continue in the next chunk, so decode it again with more text
+            if end == len(self.text) and self.fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_json_graph(path: str, encoding: str = "utf-8") -> Iterator[Tuple[str, Any]]:
+    """
+    Stream a graph JSON document without loading it as a whole.
+
+    The top level must be an object. For every member whose value is an
+    array (such as "nodes" and "edges") this yields one (key, element)
+    pair per element, decoding elements one at a time; any other member
+    is yielded once as (key, value). Only the element being decoded and a
+    small read window are held in memory.
+    """
+    with open_text(path, "r", encoding) as f:
+        buf = _Buffer(f)
+        buf.expect("{")
+        if buf.peek() == "}":
+            return
+        while True:
+            key = buf.value()
+            if not isinstance(key, str):
+                raise ValueError("Invalid graph JSON: object keys must be strings")
+            buf.expect(":")
+
+            if buf.peek() == "[":
+                buf.pos += 1
+                if buf.peek() == "]":
+                    buf.pos += 1
+                else:
+                    while True:
+                        yield key, buf.value()
+                        separator = buf.peek()
+                        buf.pos += 1
+                        if separator == "]":
+                            break
+                        if separator != ",":
+                            raise ValueError(f"Invalid graph JSON: expected ',' or ']' in {key!r}")
+            else:
+                yield key, buf.value()
+
+            separator = buf.peek()
+            buf.pos += 1
+            if separator == "}":
+                return
+            if separator != ",":
+                raise ValueError("Invalid graph JSON: expected ',' or '}' between members")
+
+
+def write_json_graph(
+    path: str,
+    nodes: Iterable[Dict[str, Any]],
+    edges: Iterable[Dict[str, Any]],
+    encoding: str = "utf-8",
+) -> None:
+    """
+    Write {"nodes": [...], "edges": [...]} as compact JSON, one element at
+    a time, so neither list has to exist in memory. nodes and edges may be
+    generators of plain dicts.
+    """
+    with open_text(path, "w", encoding) as f:
+        f.write('{"nodes":[')
+        _write_items(f, nodes)
+        f.write('],"edges":[')
+        _write_items(f, edges)
+        f.write("]}\n")
+
+
+def _write_items(f: IO[str], items: Iterable[Dict[str, Any]]) -> None:
+    """Write comma-separated compact JSON values."""
+    encode = _ENCODER.encode
+    first = True
+    for item in items:
+        if not first:
+            f.write(",")
+        f.write(encode(item))
+        first = False
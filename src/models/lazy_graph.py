@@ -0,0 +1,185 @@
+import csv
+import math
+import os
+from typing import Callable, Dict
+
+from .graph import Graph, _synchronized
+from .node import Node
+from .weight_formula import edge_weights
+
+
+# Node attributes that LazyNode reads from the source file on first access
+LAZY_ATTRIBUTES = ("activity", "interaction", "connection_count")
+
+
+class LazyNode(Node):
+    """
+    Node whose attributes are read from the source file on first access.
+
+    activity, interaction and connection_count start unset; reading one
+    of them asks the owning LazyAttributeGraph to load this node's row.
+    """
+
+    __slots__ = ("_graph",)
+
+    def __init__(self, node_id, graph: "LazyAttributeGraph"):
+        self.id = int(node_id)
+        self._name = None
+        self.neighbors = set()
+        self._graph = graph
+
+    def __getattr__(self, name):
+        # Only called for slots that are still unset
+        if name in LAZY_ATTRIBUTES:
+            self._graph._load_node(self.id)
+            return object.__getattribute__(self, name)
+        raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+
+def attributes_loaded(node: Node) -> bool:
+    """Return True if a node's attributes are set (always true for plain Nodes)."""
+    try:
+        Node.activity.__get__(node)
+    except AttributeError:
+        return False
+    return True
+
+
+class LazyAttributeGraph(Graph):
+    """
+    Graph loaded topology-first by GraphLoader.load_from_csv(lazy_attributes=True).
+
+    Only node IDs and neighbors are parsed up front. Until attributes are
+    loaded, edges carry NaN weights and nodes are LazyNode objects:
+    - reading an attribute of one node re-reads just that node's row,
+      found through a byte-offset index of the source file
+    - any weighted access (weighted_neighbors(), get_edge_weight(),
+      get_edges(), views, snapshot(), freeze(), recompute_edge_weights())
+      first loads every remaining attribute in one sequential re-scan and
+      computes the pending weights with weight_formula
+
+    BFS/DFS/components only use neighbors()/degree() and never trigger
+    the load. Read weights through the methods above rather than through
+    `edges` / `adjacency` directly, which hold NaN until then.
+    The source file must not change while attributes are pending.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        encoding: str,
+        header_end: int,
+        offsets: Dict[int, int],
+        parse_row: Callable,
+        journal_size: int = 0,
+    ):
+        super().__init__(journal_size)
+        self._path = path
+        self._encoding = encoding
+        self._header_end = header_end
+        self._offsets = offsets  # node ID -> byte offset of its row
+        self._parse_row = parse_row
+        stat = os.stat(path)
+        self._source_stamp = (stat.st_size, stat.st_mtime_ns)
+        self._attributes_pending = True
+
+    @property
+    def attributes_pending(self) -> bool:
+        """True until every node attribute and edge weight has been loaded."""
+        return self._attributes_pending
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _check_source(self) -> None:
+        stat = os.stat(self._path)
+        if (stat.st_size, stat.st_mtime_ns) != self._source_stamp:
+            raise ValueError(f"{self._path} changed since the graph was loaded.")
+
+    def _set_attributes(self, node: Node, node_attrs: dict) -> None:
+        node.activity = float(node_attrs.get("activity", 0.0))
+        node.interaction = int(node_attrs.get("interaction", 0))
+        node.connection_count = int(node_attrs.get("connection_count", 0))
+
+    def _load_node(self, node_id: int) -> None:
+        """Read the attributes of one node from its row in the source file."""
+        self._check_source()
+        with open(self._path, "rb") as f:
+            f.seek(self._offsets[node_id])
+            line = f.readline().decode(self._encoding)
+        node_attrs, _ = self._parse_row(next(csv.reader([line])))
+        self._set_attributes(self.nodes[node_id], node_attrs)
+
+    @_synchronized
+    def load_attributes(self) -> None:
+        """
+        Load all remaining node attributes with one sequential re-scan of
+        the source file, then compute every pending (NaN) edge weight.
+        """
+        if not self._attributes_pending:
+            return
+        self._check_source()
+
+        nodes = self.nodes
+        with open(self._path, "r", encoding=self._encoding, newline="") as f:
+            f.seek(self._header_end)
+            for row in csv.reader(f):
+                if not row:
+                    continue
+                node_attrs, _ = self._parse_row(row)
+                node = nodes.get(node_attrs["node_id"])
+                if node is not None and not attributes_loaded(node):
+                    self._set_attributes(node, node_attrs)
+
+        # Weights are filled in place: loading is not a change of the graph,
+        # so the version is not bumped and nothing is journaled
+        pending = [key for key, edge in self.edges.items() if math.isnan(edge.weight)]
+        if pending:
+            weights = edge_weights(
+                self.weight_formula, nodes, [u for u, _ in pending], [v for _, v in pending]
+            ).tolist()
+            adjacency = self.adjacency
+            for (u, v), weight in zip(pending, weights):
+                self.edges[(u, v)].weight = weight
+                adjacency[u][v] = weight
+                adjacency[v][u] = weight
+
+        self._attributes_pending = False
+        self._offsets = {}
+
+    # ------------------------------------------------------------------
+    # Weighted access loads attributes first
+    # ------------------------------------------------------------------
+
+    def weighted_neighbors(self, node_id: int):
+        if self._attributes_pending:
+            self.load_attributes()
+        return super().weighted_neighbors(node_id)
+
+    def get_edge_weight(self, u: int, v: int):
+        if self._attributes_pending:
+            self.load_attributes()
+        return super().get_edge_weight(u, v)
+
+    def get_edges(self):
+        if self._attributes_pending:
+            self.load_attributes()
+        return super().get_edges()
+
+    def recompute_edge_weights(self, node_ids=None, formula=None) -> int:
+        if self._attributes_pending:
+            self.load_attributes()
+        return super().recompute_edge_weights(node_ids, formula)
+
+    def snapshot(self):
+        if self._attributes_pending:
+            self.load_attributes()
+        return super().snapshot()
+
+    def update_node(self, node_id: int, *args, **kwargs) -> None:
+        # Load the row first so the update is not overwritten later
+        node = self.nodes.get(int(node_id))
+        if node is not None and not attributes_loaded(node):
+            self._load_node(node.id)
+        super().update_node(node_id, *args, **kwargs)
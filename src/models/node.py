@@ -3,27 +3,43 @@ class Node:
     Represents a single node (user) in the social network graph.
     Each node has:
     - id: unique identifier
-    - name: optional label (user name)
+    - name: optional label (user name), "User {id}" when not set
     - activity: numeric feature from CSV
     - interaction: numeric feature from CSV
     - connection_count: numeric feature from CSV
-    - neighbors: a set of neighbor node IDs
+    - neighbors: the neighbor node IDs
+
+    Once a node is added to a Graph, `neighbors` becomes a live read-only
+    view of the graph's adjacency entry, so each edge is stored only once.
+    Nodes use __slots__ and only store a name when one was given, which
+    keeps large graphs from paying for a __dict__ and a label per node.
     """
 
+    __slots__ = ("id", "_name", "activity", "interaction", "connection_count", "neighbors")
+
     def __init__(self, node_id, name=None, activity=0.0, interaction=0, connection_count=0):
         self.id = int(node_id)
-        self.name = name or f"User {self.id}"
+        self._name = name or None
         self.activity = float(activity)
         self.interaction = int(interaction)
         self.connection_count = int(connection_count)
-        self.neighbors = set()  # will be filled when edges are added
+        self.neighbors = set()  # replaced by a live view when added to a Graph
+
+    @property
+    def name(self) -> str:
+        """Label of the node; defaults to "User {id}"."""
+        return self._name or f"User {self.id}"
+
+    @name.setter
+    def name(self, value) -> None:
+        self._name = value or None
 
     def add_neighbor(self, neighbor_id: int) -> None:
-        """Add a neighbor ID to this node."""
+        """Add a neighbor ID to a node that is not part of a Graph."""
         self.neighbors.add(int(neighbor_id))
 
     def remove_neighbor(self, neighbor_id: int) -> None:
-        """Remove a neighbor ID from this node if present."""
+        """Remove a neighbor ID from a node that is not part of a Graph."""
         self.neighbors.discard(int(neighbor_id))
 
     def __repr__(self) -> str:
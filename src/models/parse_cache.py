@@ -0,0 +1,185 @@
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zipfile
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from .graph import Graph
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed graphs, keyed by source content.
+
+    A cache key combines the SHA-256 of the source file with everything
+    else that affects the parsed result (loader, column mapping, encoding,
+    weight formula). Each entry is one uncompressed .npz file holding the
+    node columns and the edge list in insertion order, so a cached graph
+    iterates exactly like a freshly parsed one. Entries are evicted least
+    recently used first (by file mtime, refreshed on every hit) once the
+    directory grows beyond `max_bytes`.
+    """
+
+    # Bump when the entry layout changes so stale entries are never read
+    FORMAT_VERSION = 1
+    DEFAULT_DIRECTORY = os.path.join(os.path.expanduser("~"), ".cache", "social-network-analysis")
+    DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be a positive integer.")
+        self.directory = directory or os.environ.get("SNA_CACHE_DIR") or self.DEFAULT_DIRECTORY
+        self.max_bytes = max_bytes
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def file_digest(path: str) -> str:
+        """Return the SHA-256 hex digest of a file's content."""
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def key(self, path: str, **params: Any) -> str:
+        """
+        Return the cache key of parsing `path` with the given parameters.
+        Parameters must be JSON-serialisable.
+        """
+        payload = json.dumps(
+            {"format": self.FORMAT_VERSION, "source": self.file_digest(path), "params": params},
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, key + ".npz")
+
+    # ------------------------------------------------------------------
+    # Entries
+    # ------------------------------------------------------------------
+
+    def get(self, key: str) -> Optional[Graph]:
+        """
+        Return the cached graph for a key, or None on a miss. A truncated
+        or corrupt entry counts as a miss and is deleted.
+        """
+        path = self._entry_path(key)
+        try:
+            with np.load(path, allow_pickle=False) as entry:
+                arrays = {name: entry[name] for name in entry.files}
+            graph = self._graph_from_arrays(arrays)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+            self._discard(path)
+            return None
+
+        self._touch(path)
+        return graph
+
+    @staticmethod
+    def _graph_from_arrays(arrays: Dict[str, np.ndarray]) -> Graph:
+        """Rebuild a graph from the arrays of one entry."""
+        graph = Graph()
+        names = arrays["names"].tolist()
+        graph.add_nodes_from(
+            arrays["ids"],
+            activity=arrays["activity"],
+            interaction=arrays["interaction"],
+            connection_count=arrays["connection_count"],
+            names=[name or None for name in names],
+        )
+        graph.add_edges_from(
+            np.column_stack((arrays["edge_u"], arrays["edge_v"])), weights=arrays["weights"]
+        )
+        return graph
+
+    def put(self, key: str, graph: Graph) -> None:
+        """Store a graph under a key, then evict old entries if needed."""
+        nodes = list(graph.nodes.values())
+        edges = list(graph.edges.values())
+        arrays: Dict[str, np.ndarray] = {
+            "ids": np.array([node.id for node in nodes], dtype=np.int64),
+            "activity": np.array([node.activity for node in nodes], dtype=np.float64),
+            "interaction": np.array([node.interaction for node in nodes], dtype=np.int64),
+            "connection_count": np.array([node.connection_count for node in nodes], dtype=np.int64),
+            "names": np.array(
+                [node.name if node.name != f"User {node.id}" else "" for node in nodes], dtype=str
+            ),
+            "edge_u": np.array([edge.u for edge in edges], dtype=np.int64),
+            "edge_v": np.array([edge.v for edge in edges], dtype=np.int64),
+            "weights": np.array([edge.weight for edge in edges], dtype=np.float64),
+        }
+
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temporary file first so readers never see a partial entry
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_path, self._entry_path(key))
+            self._touch(self._entry_path(key))
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self.evict()
+
+    @staticmethod
+    def _discard(path: str) -> None:
+        """Delete an unreadable entry (another process may have done so already)."""
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        """Mark an entry as recently used (explicit ns timestamps avoid ties)."""
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache fits in max_bytes."""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".npz")]
+        except FileNotFoundError:
+            return
+
+        entries = []
+        for name in names:
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, name))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        """Delete every cache entry."""
+        if not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(".npz"):
+                os.remove(os.path.join(self.directory, name))
+
+    def __repr__(self) -> str:
+        return f"ParseCache({self.directory!r}, max_bytes={self.max_bytes})"
@@ -0,0 +1,120 @@
+from collections.abc import Mapping
+from typing import ItemsView, Iterator
+
+from .edge import Edge
+from .frozen_graph import FrozenGraph
+from .node import Node
+
+# Saved for keys a snapshot did not contain when it was taken
+_MISSING = object()
+
+
+class _SnapshotMapping(Mapping):
+    """
+    Read-only view of one of the graph's dicts (nodes, edges or adjacency)
+    as it was when the snapshot was taken. Entries the graph has changed
+    since are served from `saved`, all others from the live dict.
+    """
+
+    __slots__ = ("_live", "_saved", "_lock")
+
+    def __init__(self, live: dict, saved: dict, lock):
+        self._live = live
+        self._saved = saved
+        self._lock = lock
+
+    def __getitem__(self, key):
+        with self._lock:
+            if key not in self._saved:
+                return self._live[key]
+            value = self._saved[key]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key) -> bool:
+        with self._lock:
+            if key in self._saved:
+                return self._saved[key] is not _MISSING
+            return key in self._live
+
+    def __iter__(self) -> Iterator:
+        with self._lock:
+            live, saved = self._live, self._saved
+            keys = [key for key in live if saved.get(key) is not _MISSING]
+            keys.extend(key for key, value in saved.items() if value is not _MISSING and key not in live)
+        return iter(keys)
+
+    def __len__(self) -> int:
+        with self._lock:
+            live = self._live
+            added = sum(1 for key, value in self._saved.items() if value is _MISSING and key in live)
+            removed = sum(1 for key, value in self._saved.items() if value is not _MISSING and key not in live)
+            return len(live) - added + removed
+
+
+class GraphSnapshot:
+    """
+    Read-only, point-in-time view of a Graph, returned by Graph.snapshot().
+
+    The snapshot reads the graph's own dicts. Before the graph first
+    changes a node, adjacency entry or edge, it hands the old entry to
+    every live snapshot, so a snapshot costs nothing to take and each
+    write copies only what it touches. Lookups hold the graph's lock
+    just long enough to pick the right entry, so readers never observe
+    a half-applied change. Entries removed after the snapshot was taken
+    iterate last. Nodes and edges handed out by a snapshot must be
+    treated as read-only.
+    """
+
+    def __init__(self, nodes, edges, adjacency, version: int, lock):
+        # table name -> key -> entry before the graph's first change (or _MISSING)
+        self._saved: dict[str, dict] = {"nodes": {}, "edges": {}, "adjacency": {}}
+        self.nodes = _SnapshotMapping(nodes, self._saved["nodes"], lock)
+        self.edges = _SnapshotMapping(edges, self._saved["edges"], lock)
+        self.adjacency = _SnapshotMapping(adjacency, self._saved["adjacency"], lock)
+        self.version = version
+
+    def get_neighbors(self, node_id: int) -> set[int]:
+        """Return a copy of the neighbor IDs of a given node."""
+        return set(self.adjacency.get(int(node_id), ()))
+
+    def neighbors(self, node_id: int) -> Iterator[int]:
+        """Iterate over the neighbor IDs of a given node without copying them."""
+        return iter(self.adjacency.get(int(node_id), ()))
+
+    def weighted_neighbors(self, node_id: int) -> ItemsView[int, float]:
+        """Return a read-only (neighbor ID, weight) view of a given node's edges."""
+        return self.adjacency.get(int(node_id), {}).items()
+
+    def degree(self, node_id: int) -> int:
+        """Return the number of neighbors of a given node (0 if unknown)."""
+        return len(self.adjacency.get(int(node_id), ()))
+
+    def has_edge(self, u: int, v: int) -> bool:
+        """Check if there is an edge between u and v."""
+        return self.get_edge_weight(u, v) is not None
+
+    def get_edge_weight(self, u: int, v: int) -> float | None:
+        """Return the weight of edge (u, v), or None if no edge exists."""
+        u = int(u)
+        v = int(v)
+        if u == v:
+            raise ValueError("Self-loops are not allowed.")
+        adjacent = self.adjacency.get(u)
+        return adjacent.get(v) if adjacent is not None else None
+
+    def get_nodes(self) -> list[Node]:
+        """Return all nodes as a list."""
+        return list(self.nodes.values())
+
+    def get_edges(self) -> list[Edge]:
+        """Return all edges as a list."""
+        return list(self.edges.values())
+
+    def freeze(self) -> FrozenGraph:
+        """Return a CSR copy of this snapshot."""
+        return FrozenGraph.from_graph(self)
+
+    def __repr__(self) -> str:
+        return f"GraphSnapshot(version={self.version}, nodes={len(self.nodes)}, edges={len(self.edges)})"
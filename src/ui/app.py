@@ -3,7 +3,6 @@ import sys
 import math
 import tkinter as tk
 import customtkinter as ctk
-import json
 from tkinter import filedialog, messagebox
 import time
 from matplotlib.figure import Figure
@@ -43,14 +42,24 @@ if SRC_DIR not in sys.path:
 
 from models.graph import Graph
 from models.graph_loader import GraphLoader
+from models.parse_cache import ParseCache
+from models.json_stream import iter_json_graph
 from algorithms.bfs import bfs
 from algorithms.dfs import dfs
-from algorithms.dijkstra import dijkstra, reconstruct_path
+from algorithms.dijkstra import dijkstra, dijkstra_to, reconstruct_path
 from algorithms.astar import astar
+from algorithms.landmarks import LandmarkIndex
 from algorithms.connected_components import connected_components
 from algorithms.degree_centrality import degree_centrality
 from algorithms.welsh_powell import welsh_powell
 
+# Nodes / edges buffered from the JSON stream before each bulk insert
+JSON_LOAD_CHUNK = 10_000
+
+# A* queries on a graph before its landmark index is built; a build
+# costs several full Dijkstra passes, so one-off queries run plain A*
+LANDMARK_BUILD_AFTER = 3
+
 
 class SocialNetworkUI:
 
@@ -59,6 +68,10 @@ class SocialNetworkUI:
 
         # ----- core graph -----
         self.graph = Graph()
+        self.parse_cache = ParseCache()  # reused across sample reloads
+        self.landmark_index: LandmarkIndex | None = None  # A* heuristic, rebuilt on edge changes
+        self.astar_queries = 0        # A* queries counted towards building landmark_index
+        self.astar_graph = None       # graph those queries ran on
         self.node_radius = 22
         self.node_positions: dict[int, tuple[float, float]] = {}
         self.node_items: dict[int, tuple[int, int]] = {}  # {id: (circle_item, text_item)}
@@ -420,7 +433,7 @@ class SocialNetworkUI:
             self.canvas.coords(text, new_x, new_y)
             
             # Update edges connected to this node
-            for neighbor in self.graph.get_neighbors(self.dragging_node):
+            for neighbor in self.graph.neighbors(self.dragging_node):
                 key = frozenset({self.dragging_node, neighbor})
                 if key in self.edge_items:
                     line_id = self.edge_items[key]
@@ -501,8 +514,7 @@ class SocialNetworkUI:
             return
         
         node = self.graph.nodes[nid]
-        neighbors = list(self.graph.get_neighbors(nid))
-        degree = len(neighbors)
+        degree = self.graph.degree(nid)
         category = self.node_categories.get(nid, "default")
         
         tooltip_text = f"ID: {nid}\n"
@@ -783,7 +795,7 @@ class SocialNetworkUI:
             # Create adjacency list text
             lines = []
             for nid in sorted(self.graph.nodes.keys()):
-                neighbors = sorted(self.graph.get_neighbors(nid))
+                neighbors = sorted(self.graph.neighbors(nid))
                 line = f"{nid}: {', '.join(map(str, neighbors)) or 'None'}"
                 lines.append(line)
 
@@ -957,8 +969,11 @@ class SocialNetworkUI:
             # Dijkstra
             (_, _prev), results["Dijkstra"] = self.measure_time(dijkstra, self.graph, start_node)
 
-            # A*
-            (_, _prev, _), results["A*"] = self.measure_time(astar, self.graph, start_node, end_node)
+            # A* (fetching or building the landmark index is reported on its own line)
+            landmarks, results["A* landmark index"] = self.measure_time(self.get_landmark_index)
+            (_, _prev, _), results["A*"] = self.measure_time(
+                astar, self.graph, start_node, end_node, landmarks
+            )
 
             # Connected Components
             _, results["Connected Components"] = self.measure_time(connected_components, self.graph)
@@ -1268,7 +1283,7 @@ class SocialNetworkUI:
                 return
 
             node = self.graph.nodes[nid]
-            neighbors = sorted(self.graph.get_neighbors(nid))
+            neighbors = sorted(self.graph.neighbors(nid))
             degree = len(neighbors)
 
             popup = ctk.CTkToplevel(self.root)
@@ -1353,9 +1368,7 @@ class SocialNetworkUI:
                 )
 
                 # Recompute weights for edges connected to the node
-                for nbr in list(self.graph.get_neighbors(nid)):
-                    if self.graph.has_edge(nid, nbr):
-                        self.recompute_edge_weight(nid, nbr)
+                self.graph.recompute_edge_weights([nid])
 
                 popup.destroy()
                 self.status_label.configure(text=f"Person {nid} updated successfully.")
@@ -1547,15 +1560,6 @@ class SocialNetworkUI:
         
         return f"#{r:02x}{g:02x}{b:02x}"
 
-    def recompute_edge_weight(self, u, v):
-        """Recompute and update edge weight when node attributes change."""
-        if self.graph.has_edge(u, v):
-            n1 = self.graph.nodes[u]
-            n2 = self.graph.nodes[v]
-            new_weight = self._calculate_edge_weight(n1, n2)
-            self.graph.update_edge_weight(u, v, new_weight)
-
-
     # =================================================================
     # Graph reset / load
     # =================================================================
@@ -1598,38 +1602,19 @@ class SocialNetworkUI:
 
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json")],
+            filetypes=[("JSON files", "*.json"), ("Compressed JSON", "*.json.gz *.json.xz")],
             title="Save graph as JSON"
         )
         if not file_path:
             return
 
         try:
-            data = {"nodes": [], "edges": []}
-
-            # Serialize nodes with positions
-            for nid, node in self.graph.nodes.items():
-                x, y = self.node_positions.get(nid, (0.0, 0.0))
-                data["nodes"].append({
-                    "id": nid,
-                    "name": node.name,
-                    "activity": node.activity,
-                    "interaction": node.interaction,
-                    "connection_count": node.connection_count,
-                    "x": x,
-                    "y": y,
-                })
-
-            # Serialize edges
-            for edge in self.graph.get_edges():
-                data["edges"].append({
-                    "u": edge.u,
-                    "v": edge.v,
-                    "weight": edge.weight,
-                })
-
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=4)
+            # Nodes are written with their canvas positions, streamed to disk
+            positions = {
+                nid: dict(zip(("x", "y"), self.node_positions.get(nid, (0.0, 0.0))))
+                for nid in self.graph.nodes
+            }
+            GraphLoader.save_to_json(self.graph, file_path, node_extras=positions)
             self.show_notification(f"Saved to {os.path.basename(file_path)}", "success", 2000)
             logger.info(f"Graph saved to {file_path}")
         except Exception as e:
@@ -1639,20 +1624,12 @@ class SocialNetworkUI:
         """Load graph from a JSON file."""
         file_path = filedialog.askopenfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json")],
+            filetypes=[("JSON files", "*.json"), ("Compressed JSON", "*.json.gz *.json.xz")],
             title="Load graph from JSON"
         )
         if not file_path:
             return
 
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except Exception as e:
-            logger.error(f"Failed to read JSON: {e}")
-            self.show_notification(f"Failed to read JSON: {str(e)[:50]}", "error", 3000)
-            return
-
         try:
             # Reset current graph and visuals
             self.canvas.delete("all")
@@ -1662,60 +1639,25 @@ class SocialNetworkUI:
             self.edge_items.clear()
             self.selected_node = None
 
-            # Rebuild nodes
-            for node_data in data.get("nodes", []):
-                nid = int(node_data["id"])
-                name = node_data.get("name")
-                activity = float(node_data.get("activity", 0.0))
-                interaction = float(node_data.get("interaction", 0.0))
-                connection_count = float(node_data.get("connection_count", 0.0))
-
-                # Add to backend graph
-                self.graph.add_node(
-                    nid,
-                    name=name,
-                    activity=activity,
-                    interaction=interaction,
-                    connection_count=connection_count,
-                )
-
-                # Draw on canvas
-                x = float(node_data.get("x", 0.0))
-                y = float(node_data.get("y", 0.0))
-
-                circle = self.canvas.create_oval(
-                    x - self.node_radius, y - self.node_radius,
-                    x + self.node_radius, y + self.node_radius,
-                    fill="#3A5166",
-                    outline="#ffffff",
-                    width=1
-                )
-                text = self.canvas.create_text(
-                    x, y, text=str(nid),
-                    fill="#e5e7eb",
-                    font=("Segoe UI", 12, "bold")
-                )
-
-                self.node_positions[nid] = (x, y)
-                self.node_items[nid] = (circle, text)
-
-            # Rebuild edges
-            for e_data in data.get("edges", []):
-                u = int(e_data.get("u"))
-                v = int(e_data.get("v"))
-                weight = float(e_data.get("weight", 1.0))
-
-                if u not in self.graph.nodes or v not in self.graph.nodes:
-                    continue
-
-                # Backend edge
-                self.graph.add_edge(u, v, weight)
-
-                # Visual edge
-                x1, y1 = self.node_positions[u]
-                x2, y2 = self.node_positions[v]
-                line_id = self.canvas.create_line(x1, y1, x2, y2, fill="#9CA3AF", width=2)
-                self.edge_items[frozenset({u, v})] = line_id
+            # Stream the file element by element (accepts "u"/"v" and "source"/"target"
+            # edges) and insert it in bounded chunks, so the document is never held whole
+            nodes_data = []
+            edges_data = []
+            for section, item in iter_json_graph(file_path):
+                if section == "nodes":
+                    nodes_data.append(item)
+                    if len(nodes_data) >= JSON_LOAD_CHUNK:
+                        self._add_json_nodes(nodes_data)
+                        nodes_data.clear()
+                elif section == "edges":
+                    edges_data.append(item)
+                    if len(edges_data) >= JSON_LOAD_CHUNK:
+                        self._add_json_nodes(nodes_data)
+                        nodes_data.clear()
+                        self._add_json_edges(edges_data)
+                        edges_data.clear()
+            self._add_json_nodes(nodes_data)
+            self._add_json_edges(edges_data)
 
             # Update next_node_id for adding new nodes later
             if self.graph.nodes:
@@ -1729,9 +1671,74 @@ class SocialNetworkUI:
         except Exception as e:
             logger.error(f"Error loading graph: {e}")
             self.show_notification(f"Load failed: {str(e)[:50]}", "error", 3000)
+            self.canvas.delete("all")
+            self.node_positions.clear()
+            self.node_items.clear()
+            self.edge_items.clear()
             self.graph = Graph()  # Reset to empty graph on error
 
 
+    def _add_json_nodes(self, nodes_data):
+        """Insert one chunk of JSON node dicts into the graph and draw them."""
+        if not nodes_data:
+            return
+        node_ids = [int(node_data.get("id", node_data.get("node_id"))) for node_data in nodes_data]
+        self.graph.add_nodes_from(
+            node_ids,
+            names=[node_data.get("name") for node_data in nodes_data],
+            activity=[float(node_data.get("activity", 0.0)) for node_data in nodes_data],
+            interaction=[float(node_data.get("interaction", 0.0)) for node_data in nodes_data],
+            connection_count=[float(node_data.get("connection_count", 0.0)) for node_data in nodes_data],
+        )
+
+        for nid, node_data in zip(node_ids, nodes_data):
+
+            # Draw on canvas
+            x = float(node_data.get("x", 0.0))
+            y = float(node_data.get("y", 0.0))
+
+            circle = self.canvas.create_oval(
+                x - self.node_radius, y - self.node_radius,
+                x + self.node_radius, y + self.node_radius,
+                fill="#3A5166",
+                outline="#ffffff",
+                width=1
+            )
+            text = self.canvas.create_text(
+                x, y, text=str(nid),
+                fill="#e5e7eb",
+                font=("Segoe UI", 12, "bold")
+            )
+
+            self.node_positions[nid] = (x, y)
+            self.node_items[nid] = (circle, text)
+
+
+    def _add_json_edges(self, edges_data):
+        """Insert one chunk of JSON edge dicts into the graph and draw them."""
+        edges = []
+        for e_data in edges_data:
+            u = int(e_data.get("u", e_data.get("source")))
+            v = int(e_data.get("v", e_data.get("target")))
+            weight = float(e_data.get("weight", 1.0))
+
+            if u not in self.graph.nodes or v not in self.graph.nodes:
+                continue
+            edges.append((u, v, weight))
+        if not edges:
+            return
+
+        # Backend edges in one bulk insert per chunk
+        self.graph.add_edges_from(edges)
+
+        for u, v, _ in edges:
+            # Visual edge
+            x1, y1 = self.node_positions[u]
+            x2, y2 = self.node_positions[v]
+            line_id = self.canvas.create_line(x1, y1, x2, y2, fill="#9CA3AF", width=2)
+            self.edge_items[frozenset({u, v})] = line_id
+
+
     
     # =================================================================
     # Animation helpers
@@ -1744,6 +1751,30 @@ class SocialNetworkUI:
             self.canvas.itemconfig(line_id, fill="#9CA3AF", width=2)
 
 
+    def get_landmark_index(self) -> LandmarkIndex | None:
+        """
+        Return the A* landmark index for the current graph, or None (plain
+        A*) until LANDMARK_BUILD_AFTER queries ran on this graph. Loading
+        another graph or an edge change that makes the index stale starts
+        the count over.
+        """
+        if self.landmark_index is not None:
+            if self.landmark_index.is_valid(self.graph):
+                return self.landmark_index
+            self.landmark_index = None
+            self.astar_queries = 0
+
+        if self.astar_graph is not self.graph:
+            self.astar_graph = self.graph
+            self.astar_queries = 0
+        self.astar_queries += 1
+        if self.astar_queries < LANDMARK_BUILD_AFTER:
+            return None
+
+        self.landmark_index = LandmarkIndex.build(self.graph)
+        return self.landmark_index
+
+
     def get_start_node(self):
         txt = self.start_entry.get().strip()
         if not txt:
@@ -1847,7 +1878,7 @@ class SocialNetworkUI:
             self.canvas_scale = 1.0
 
             # Load Backend Graph using enhanced loader
-            self.graph = GraphLoader.load_from_csv(csv_path)
+            self.graph = GraphLoader.load_from_csv(csv_path, cache=self.parse_cache)
 
             # Layout nodes in a circle
             width = self.canvas.winfo_width() or 900
@@ -1979,7 +2010,8 @@ class SocialNetworkUI:
 
         try:
             target = max(self.graph.nodes.keys())
-            dist, prev = dijkstra(self.graph, start)
+            # Stops once the target is settled; dist only holds reached nodes
+            dist, prev = dijkstra_to(self.graph, start, target)
             path = reconstruct_path(prev, start, target)
 
             if not path:
@@ -1992,7 +2024,7 @@ class SocialNetworkUI:
             self.show_notification(f"Dijkstra {start}→{target}: {distance:.4f}", "success", 2000)
             
             # Apply gradient coloring based on distance from start
-            gradient_values = {nid: min(dist[nid] / (distance if distance > 0 else 1), 1.0) for nid in self.graph.nodes}
+            gradient_values = {nid: min(dist.get(nid, float('inf')) / (distance if distance > 0 else 1), 1.0) for nid in self.graph.nodes}
             self.apply_gradient_coloring(gradient_values)
             
             self.animate_traversal(path, node_color="#22c55e", edge_color="#22c55e", 
@@ -2016,7 +2048,7 @@ class SocialNetworkUI:
 
         try:
             target = max(self.graph.nodes.keys())
-            dist, prev, path = astar(self.graph, start, target)
+            dist, prev, path = astar(self.graph, start, target, heuristic=self.get_landmark_index())
             
             if not path:
                 self.show_notification(f"No A* path {start}→{target}", "warning", 2000)
@@ -2082,7 +2114,7 @@ class SocialNetworkUI:
             self.reset_visual_style()
             
             # Apply gradient coloring to all nodes based on degree
-            all_degrees = {nid: len(self.graph.get_neighbors(nid)) for nid in self.graph.nodes}
+            all_degrees = {nid: self.graph.degree(nid) for nid in self.graph.nodes}
             max_degree = max(all_degrees.values()) if all_degrees else 1
             normalized_degrees = {nid: deg / max_degree for nid, deg in all_degrees.items()}
             self.apply_gradient_coloring(normalized_degrees)
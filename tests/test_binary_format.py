@@ -0,0 +1,32 @@
+import sys, os, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from models.frozen_graph import FrozenGraph
+from models.graph_loader import GraphLoader
+from algorithms.dijkstra import dijkstra
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+graph.update_node(3, name="Alice")
+
+path = os.path.join(tempfile.mkdtemp(), "sample_medium.sna")
+GraphLoader.save_binary(graph, path)
+print("Binary file size:", os.path.getsize(path), "bytes")
+
+for mmap in (True, False):
+    loaded = GraphLoader.load_binary(path, mmap=mmap)
+    print("Loaded (mmap=%s):" % mmap, loaded)
+    assert set(loaded.nodes) == set(graph.nodes)
+    assert loaded.nodes[3].name == "Alice" and loaded.nodes[4].name == "User 4"
+    assert loaded.nodes[7].activity == graph.nodes[7].activity
+    for (u, v), edge in graph.edges.items():
+        assert loaded.get_edge_weight(u, v) == edge.weight
+    assert dijkstra(loaded, 1) == dijkstra(graph, 1)
+
+# load_binary() trusts the sorted ids save_binary() wrote; only other
+# callers pay for the O(V) sortedness scan
+try:
+    FrozenGraph([2, 1], [0, 0, 0], [], [])
+    raise AssertionError("unsorted ids accepted")
+except ValueError:
+    pass
+assert len(FrozenGraph([2, 1], [0, 0, 0], [], [], validate=False).ids) == 2
@@ -0,0 +1,62 @@
+import sys, os, random
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.contraction_hierarchies import ContractionHierarchy
+from algorithms.dijkstra import dijkstra, reconstruct_path
+from models.generators import node_attributes, to_graph, watts_strogatz
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+graph.add_node(1000)  # isolated, unreachable from everything else
+# A ring-like small world has long paths, so the hierarchy gets deep
+edges = watts_strogatz(800, 4, 0.05, seed=11)
+generated = to_graph(800, edges, node_attributes(800, edges, seed=11))
+# Zero-weight edges tie witness paths with shortcuts
+zeroed = GraphLoader.load_from_csv("data/sample_medium.csv")
+for u, v in list(zeroed.edges)[::10]:
+    zeroed.update_edge_weight(u, v, 0.0)
+
+for g in (graph, generated, zeroed):
+    hierarchy = ContractionHierarchy.build(g)
+    print(hierarchy)
+    assert len(hierarchy.rank) == len(g.nodes)
+
+    rng = random.Random(4)
+    nodes = sorted(g.nodes)
+    for start in rng.sample(nodes, 5):
+        distances, previous = dijkstra(g, start)
+        for target in rng.sample(nodes, 20):
+            distance, path = hierarchy.query(start, target)
+            assert abs(distance - distances[target]) < 1e-9
+            if g is not zeroed:
+                # Shortcuts unpack to the same node sequence plain Dijkstra finds
+                assert path == reconstruct_path(previous, start, target)
+            else:
+                # Ties allow other shortest paths; each must be a real one
+                assert path[0] == start and path[-1] == target
+                assert abs(sum(g.get_edge_weight(u, v) for u, v in zip(path, path[1:])) - distance) < 1e-9
+
+distance, path = ContractionHierarchy.build(graph).query(1, 64)
+print(f"1 -> 64: {distance:.4f} via {path}")
+
+hierarchy = ContractionHierarchy.build(graph)
+assert hierarchy.query(1, 1000) == (float("inf"), [])
+assert hierarchy.query(5, 5) == (0.0, [5])
+
+# Node additions keep the hierarchy; edge changes invalidate it
+graph.add_node(1001)
+assert hierarchy.is_valid(graph)
+assert hierarchy.query(1, 1001) == (float("inf"), [])
+graph.add_edge(1, 1000, 0.5)
+assert not hierarchy.is_valid(graph)
+
+# A hierarchy built on a view goes stale when the graph under the view changes
+view = generated.subgraph_view(range(1, 201))
+view_hierarchy = ContractionHierarchy.build(view)
+distances, _ = dijkstra(view, 1)
+target = max((nid for nid, d in distances.items() if d < float("inf")), key=distances.get)
+assert abs(view_hierarchy.distance(1, target) - distances[target]) < 1e-9
+for u, v in list(generated.edges):
+    generated.update_edge_weight(u, v, generated.get_edge_weight(u, v) * 0.01)
+assert not view_hierarchy.is_valid(view)
+assert ContractionHierarchy.build(view).distance(1, target) < distances[target]
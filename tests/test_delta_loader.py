@@ -0,0 +1,47 @@
+import sys, os, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+neighbors_of_5 = graph.degree(5)
+weight_2_3 = graph.get_edge_weight(2, 3)
+neighbor_of_5 = min(graph.neighbors(5))
+
+path = os.path.join(tempfile.mkdtemp(), "delta.csv")
+with open(path, "w", encoding="utf-8") as f:
+    f.write("Islem,DugumId,HedefId,Aktiflik,Etkilesim,Baglanti,Agirlik\n")
+    f.write("add_node,500,,0.4,10,2,\n")
+    f.write("add_edge,500,1,,,,\n")
+    f.write("add_edge,2,3,,,,0.75\n")
+    f.write("remove_edge,1,2,,,,\n")
+    f.write("remove_node,100,,,,,\n")
+    f.write("update_node,5,,0.1,,,\n")
+    f.write(f"add_edge,5,{neighbor_of_5},,,,\n")
+
+report = GraphLoader.apply_delta(graph, path)
+print(report)
+
+assert report.nodes_added == [500] and report.nodes_removed == [100]
+assert (1, 2) in report.edges_removed and 100 not in graph.nodes and not graph.has_edge(1, 2)
+assert graph.get_edge_weight(2, 3) == 0.75 != weight_2_3
+assert graph.get_edge_weight(1, 500) == graph.weight_formula(graph.nodes[1], graph.nodes[500])
+
+# Only edges around the updated node were recomputed, and an edge the
+# delta also adds is reported once, in edges_added
+assert len(report.edges_reweighted) == neighbors_of_5 - 1
+assert not set(report.edges_reweighted) & set(report.edges_added)
+for u, v in report.edges_reweighted:
+    assert graph.get_edge_weight(u, v) == graph.weight_formula(graph.nodes[u], graph.nodes[v])
+assert report.changed and {5, 100, 500}.issubset(report.affected_nodes)
+
+# Invalid deltas are rejected before anything is applied
+with open(path, "w", encoding="utf-8") as f:
+    f.write("Islem,DugumId,HedefId\nremove_edge,1,3\nupdate_node,12345,\n")
+version = graph.version
+try:
+    GraphLoader.apply_delta(graph, path)
+    raise AssertionError("expected ValueError")
+except ValueError as e:
+    print("Rejected:", e)
+assert graph.version == version and graph.has_edge(1, 3)
@@ -0,0 +1,38 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.dijkstra import bidirectional_dijkstra, dijkstra, dijkstra_to, reconstruct_path
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+# A second component whose shortest path runs over zero-weight edges
+graph.add_nodes_from([1000, 1001, 1002, 1003])
+graph.add_edges_from([(1000, 1001, 0.0), (1001, 1002, 0.0), (1000, 1002, 0.5), (1002, 1003, 0.25)])
+
+distances, previous = dijkstra(graph, 1)
+for target in (2, 37, 64, 100):
+    full_path = reconstruct_path(previous, 1, target)
+
+    # Early exit: same answer, but only reached nodes are stored
+    sparse_distances, sparse_previous = dijkstra_to(graph, 1, target)
+    assert sparse_distances[target] == distances[target]
+    assert reconstruct_path(sparse_previous, 1, target) == full_path
+    assert len(sparse_distances) <= len(graph.nodes)
+
+    distance, path = bidirectional_dijkstra(graph, 1, target)
+    print(f"1 -> {target}: {distance:.4f} via {path} (dijkstra_to reached {len(sparse_distances)} nodes)")
+    assert abs(distance - distances[target]) < 1e-12
+    assert path[0] == 1 and path[-1] == target
+    assert abs(sum(graph.get_edge_weight(u, v) for u, v in zip(path, path[1:])) - distance) < 1e-12
+
+assert bidirectional_dijkstra(graph, 1, 1000) == (float("inf"), [])
+sparse_distances, sparse_previous = dijkstra_to(graph, 1, 1000)
+assert 1000 not in sparse_distances and reconstruct_path(sparse_previous, 1, 1000) == []
+
+# Zero-weight edges are followed like any other
+assert bidirectional_dijkstra(graph, 1000, 1003) == (0.25, [1000, 1001, 1002, 1003])
+assert bidirectional_dijkstra(graph, 1003, 1000) == (0.25, [1003, 1002, 1001, 1000])
+assert bidirectional_dijkstra(graph, 1000, 1002) == (0.0, [1000, 1001, 1002])
+sparse_distances, sparse_previous = dijkstra_to(graph, 1000, 1003)
+assert sparse_distances[1003] == 0.25
+assert reconstruct_path(sparse_previous, 1000, 1003) == [1000, 1001, 1002, 1003]
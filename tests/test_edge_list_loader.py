@@ -0,0 +1,42 @@
+import sys, os, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+
+# Write data/sample_medium.csv as a SNAP-style edge list plus an attribute file
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+directory = tempfile.mkdtemp()
+edges_path = os.path.join(directory, "edges.txt")
+attributes_path = os.path.join(directory, "attributes.csv")
+
+with open(edges_path, "w") as f:
+    f.write("# FromNodeId\tToNodeId\n")
+    for (u, v) in graph.edges:
+        f.write(f"{u}\t{v}\n{v}\t{u}\n")  # both directions, as SNAP lists them
+with open(attributes_path, "w") as f:
+    f.write("DugumId,Aktiflik,Etkilesim,Baglanti\n")
+    for node in graph.nodes.values():
+        f.write(f"{node.id},{node.activity},{node.interaction},{node.connection_count}\n")
+
+loaded = GraphLoader.load_edge_list(edges_path, attributes_path, block_bytes=256)
+print("Nodes:", len(loaded.nodes), "Edges:", len(loaded.edges))
+assert set(loaded.nodes) == set(graph.nodes)
+assert {k: e.weight for k, e in loaded.edges.items()} == {k: e.weight for k, e in graph.edges.items()}
+
+# Explicit weights, self-loops dropped, endpoints become nodes
+with open(edges_path, "w") as f:
+    f.write("1 2 0.5\n2 3 0.25\n3 3 9.0\n")
+loaded = GraphLoader.load_edge_list(edges_path)
+print(loaded.edges)
+assert set(loaded.nodes) == {1, 2, 3} and len(loaded.edges) == 2
+assert loaded.get_edge_weight(2, 3) == 0.25
+
+# Uneven lines are rejected, even when the token total happens to fit
+for ragged in ("1 2 3\n4\n", "1 2\n3 4\n5\n", "1 2\n3 4 5\n"):
+    with open(edges_path, "w") as f:
+        f.write(ragged)
+    try:
+        GraphLoader.load_edge_list(edges_path)
+        raise AssertionError(f"ragged file accepted: {ragged!r}")
+    except ValueError as e:
+        print("Rejected:", e)
@@ -0,0 +1,38 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.bfs import bfs
+from algorithms.dfs import dfs
+from algorithms.dijkstra import dijkstra, reconstruct_path
+from algorithms.astar import astar
+from algorithms.connected_components import connected_components
+from algorithms.welsh_powell import welsh_powell
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+frozen = graph.freeze()
+
+print(frozen)
+print("Row offsets:", frozen.indptr[:10])
+
+# Every algorithm must give the same answer on the snapshot
+assert bfs(frozen, 1) == bfs(graph, 1)
+assert dfs(frozen, 1) == dfs(graph, 1)
+assert dijkstra(frozen, 1) == dijkstra(graph, 1)
+assert astar(frozen, 1, 50) == astar(graph, 1, 50)
+assert connected_components(frozen) == connected_components(graph)
+assert welsh_powell(frozen) == welsh_powell(graph)
+
+distances, previous = dijkstra(frozen, 1)
+print("Shortest path from 1 to 50 on snapshot:", reconstruct_path(previous, 1, 50))
+
+# The snapshot does not follow later mutations
+graph.remove_edge(1, 2)
+print("Edge 1-2 in graph:", graph.has_edge(1, 2), "| in snapshot:", frozen.has_edge(1, 2))
+
+# Nodes and edges are proxies over the attribute columns
+node = frozen.nodes[1]
+print(node, "activity =", node.activity, "degree =", frozen.degree(1))
+print("First edges:", frozen.get_edges()[:3])
+assert node.activity == graph.nodes[1].activity
+assert len(frozen.get_edges()) == frozen.num_edges
@@ -30,6 +30,10 @@ print("\nAdjacency list:", g.adjacency)
 
 # Test neighbor retrieval
 print("\nNeighbors of 2:", g.get_neighbors(2))
+print("Neighbors of 2 (no copy):", sorted(g.neighbors(2)))
+print("Degree of 2:", g.degree(2))
+print("Weighted neighbors of 2:", sorted(g.weighted_neighbors(2)))
+print("Node 2 neighbors (live view):", sorted(g.nodes[2].neighbors))
 
 # Test updating node
 g.update_node(3, name="Charlie Updated", activity=0.9)
@@ -38,12 +42,52 @@ print("\nUpdated node 3:", g.nodes[3])
 # Test edge weight update
 g.update_edge_weight(1, 2, 9.99)
 print("\nUpdated edge weight (1-2):", g.get_edge_weight(1, 2))
+print("Adjacency weight (2 -> 1):", g.adjacency[2][1])
 
 # Remove edge
 g.remove_edge(2, 3)
 print("\nEdges after removing (2-3):", g.get_edges())
+print("Node 2 neighbors after removing (2-3):", sorted(g.nodes[2].neighbors))
 
 # Remove node
 g.remove_node(1)
 print("\nNodes after removing 1:", g.get_nodes())
 print("Adjacency after removing 1:", g.adjacency)
+
+# Version counter and change journal
+j = Graph(journal_size=3)
+j.add_node(1)
+j.add_node(2)
+start = j.version
+j.add_edge(1, 2, weight=0.5)
+j.update_edge_weight(1, 2, 0.7)
+print("\nVersion:", j.version, "| changes since", start, ":", j.changes_since(start))
+j.remove_node(2)
+print("Changes since", start, "after eviction:", j.changes_since(start))
+
+# A bulk change longer than the journal is not journaled element by element
+j.add_nodes_from([10, 11, 12, 13])
+assert len(j.journal) == 0 and j.changes_since(j.version - 1) is None
+assert j.changes_since(j.version) == []
+j.add_nodes_from([20, 21])
+assert [change.u for change in j.changes_since(j.version - 1)] == [20, 21]
+
+# Bulk insertion
+b = Graph()
+b.add_nodes_from([1, 2, 3, 4], activity=[0.1, 0.2, 0.3, 0.4])
+b.add_edges_from([(1, 2, 0.5), (3, 2, 0.25), (2, 3, 0.75), (3, 4, 1.0)])
+print("\nBulk nodes:", b.get_nodes())
+print("Bulk edges:", b.get_edges())
+print("Bulk adjacency:", b.adjacency)
+
+# Ragged bulk input is rejected instead of silently dropping data
+for bad_call in (
+    lambda: Graph().add_nodes_from([1, 2, 3], names=["a"]),
+    lambda: b.add_edges_from([(1, 2), (2, 3, 0.5)]),
+    lambda: b.add_edges_from([(1, 2, 0.5), (2, 3)]),
+):
+    try:
+        bad_call()
+        raise AssertionError("ragged bulk input accepted")
+    except ValueError as e:
+        print("Rejected:", e)
@@ -0,0 +1,35 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.bfs import bfs
+from algorithms.connected_components import connected_components
+from algorithms.degree_centrality import degree_centrality
+from algorithms.dijkstra import dijkstra, reconstruct_path
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+
+# Induced subgraph on the first 30 users
+region = graph.subgraph_view(range(1, 31))
+print(region)
+print("BFS from 1 inside region:", bfs(region, 1))
+assert set(bfs(region, 1)) <= set(range(1, 31))
+
+# Only strong ties
+strong = graph.edge_weight_view(min_weight=0.1)
+print("Components with weight >= 0.1:", len(connected_components(strong)))
+assert all(edge.weight >= 0.1 for edge in strong.get_edges())
+
+# Active users only
+active = graph.node_filter_view(lambda node: node.activity > 0.8)
+print("Active users:", len(active.nodes), "of", len(graph.nodes))
+print("Top central active users:", degree_centrality(active, top_n=3))
+distances, previous = dijkstra(active, 1)
+print("Path 1 -> 9 among active users:", reconstruct_path(previous, 1, 9))
+
+# Views are lazy: they follow later changes of the graph
+graph.remove_edge(1, 2)
+assert 2 not in region.get_neighbors(1)
+
+# and can be materialised into a compact snapshot
+print(region.freeze())
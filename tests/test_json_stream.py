@@ -0,0 +1,32 @@
+import sys, os, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+from models import json_stream
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+graph.update_node(3, name="Alice")
+directory = tempfile.mkdtemp()
+
+for name in ("graph.json", "graph.json.gz", "graph.json.xz"):
+    path = os.path.join(directory, name)
+    GraphLoader.save_to_json(graph, path, node_extras={1: {"x": 10.0, "y": 20.0}})
+    print(name, os.path.getsize(path), "bytes")
+
+    loaded = GraphLoader.load_from_json(path)
+    assert list(loaded.nodes) == list(graph.nodes)
+    assert list(loaded.edges) == list(graph.edges)
+    assert all(loaded.edges[key].weight == edge.weight for key, edge in graph.edges.items())
+    assert loaded.nodes[3].name == "Alice" and loaded.nodes[4].name == "User 4"
+
+# Elements split across read boundaries; UI-style "u"/"v" edges without weights
+path = os.path.join(directory, "ui.json")
+with open(path, "w", encoding="utf-8") as f:
+    f.write('{\n  "nodes": [\n    {"id": 1, "activity": 0.5, "x": 1},\n'
+            '    {"id": 20, "activity": 0.25}\n  ],\n  "edges": [{"u": 1, "v": 20}],\n  "count": 12345\n}\n')
+json_stream.READ_SIZE = 4
+items = list(json_stream.iter_json_graph(path))
+print(items)
+assert items[-1] == ("count", 12345)
+loaded = GraphLoader.load_from_json(path)
+assert loaded.get_edge_weight(1, 20) == loaded.weight_formula(loaded.nodes[1], loaded.nodes[20])
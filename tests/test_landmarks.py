@@ -0,0 +1,112 @@
+import sys, os, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.astar import astar
+from algorithms.dijkstra import dijkstra
+from algorithms.landmarks import LandmarkIndex, load_or_build_landmarks
+from models.generators import barabasi_albert, node_attributes, to_graph
+from models.graph_loader import GraphLoader
+from models.graph_views import InducedSubgraphView
+
+
+class CountingGraph:
+    """Wraps a graph and counts how many nodes a search expands."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.nodes = graph.nodes
+        self.expanded = 0
+
+    def weighted_neighbors(self, node_id):
+        self.expanded += 1
+        return self.graph.weighted_neighbors(node_id)
+
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+graph.add_nodes_from([1000, 1001])  # a second component
+graph.add_edge(1000, 1001, 0.3)
+
+# Built on the graph and on its CSR form alike
+for g in (graph, graph.freeze()):
+    for method in ("farthest", "degree"):
+        index = LandmarkIndex.build(g, k=4, method=method)
+        print(method, index)
+        assert len(index.landmarks) == 4
+
+        distances, _ = dijkstra(g, 1)
+        for target in (2, 37, 64, 100):
+            # Admissible: never above the true distance
+            assert index.lower_bound(1, target) <= distances[target] + 1e-12
+            dist, _, path = astar(g, 1, target, heuristic=index)
+            assert abs(dist[target] - distances[target]) < 1e-12
+            assert path[0] == 1 and path[-1] == target
+
+# Farthest-point selection puts a landmark in the second component, which
+# proves it unreachable; inside it the bound is exact
+index = LandmarkIndex.build(graph, k=4)
+assert {1000, 1001} & set(index.landmarks)
+assert index.lower_bound(1, 1000) == float("inf")
+assert astar(graph, 1, 1000, heuristic=index)[2] == []
+assert index.lower_bound(1000, 1001) == 0.3
+
+# The landmark heuristic prunes the search on a larger graph
+big_edges = barabasi_albert(3000, 2, seed=7)
+big = to_graph(3000, big_edges, node_attributes(3000, big_edges, seed=7))
+big_index = LandmarkIndex.build(big, k=8)
+plain, alt = CountingGraph(big), CountingGraph(big)
+for target in (1500, 2999):
+    expected = astar(plain, 1, target)[0][target]
+    assert abs(astar(alt, 1, target, heuristic=big_index.heuristic)[0][target] - expected) < 1e-9
+print(f"Nodes expanded: zero heuristic {plain.expanded}, landmarks {alt.expanded}")
+assert alt.expanded < plain.expanded
+
+# Node additions and attribute updates keep the index; edge changes invalidate it
+assert index.is_valid(graph)
+graph.add_node(1002)
+assert index.is_valid(graph)  # no journal: falls back to the edge fingerprint
+graph.enable_journal(100)
+graph.add_node(1003)
+graph.update_node(1, activity=0.5)
+assert index.is_valid(graph)
+u, v = next(iter(graph.edges))
+graph.remove_edge(u, v)
+assert not index.is_valid(graph)
+try:
+    astar(graph, 1, 2, heuristic=index)
+    raise AssertionError("stale index accepted")
+except ValueError:
+    pass
+
+# Saved next to the graph file, reloaded when it still matches
+with tempfile.TemporaryDirectory() as tmp:
+    graph_path = os.path.join(tmp, "graph.csv")
+    saved = load_or_build_landmarks(graph, graph_path, k=4)
+    loaded = LandmarkIndex.load(graph_path + ".landmarks.npz")
+    assert loaded.landmarks == saved.landmarks and loaded.is_valid(graph)
+    assert loaded.lower_bound(1, 64) == saved.lower_bound(1, 64)
+    assert not loaded.is_valid(GraphLoader.load_from_csv("data/sample_medium.csv"))
+    assert load_or_build_landmarks(graph, graph_path, k=4).landmarks == saved.landmarks
+
+# An index built on a view follows the graph underneath it
+base = GraphLoader.load_from_csv("data/sample_medium.csv")
+view = base.subgraph_view(range(1, 51))
+view_index = LandmarkIndex.build(view, k=4)
+assert view_index.is_valid(view)
+base.update_node(1, activity=0.5)  # node change only
+outside = max(base.edges)
+assert outside[0] > 50
+base.remove_edge(*outside)  # edge outside the view
+assert view_index.is_valid(view)
+for u, v in list(base.edges):
+    base.update_edge_weight(u, v, base.get_edge_weight(u, v) * 0.01)
+assert not view_index.is_valid(view)
+try:
+    astar(view, 1, 2, heuristic=view_index)
+    raise AssertionError("stale view index accepted")
+except ValueError:
+    pass
+
+# Views over a FrozenGraph never change
+frozen_view = InducedSubgraphView(base.freeze(), range(1, 51))
+frozen_index = LandmarkIndex.build(frozen_view, k=4)
+assert frozen_view.version == 0 and frozen_index.is_valid(frozen_view)
@@ -0,0 +1,27 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+from algorithms.bfs import bfs
+from algorithms.connected_components import connected_components
+from algorithms.dijkstra import dijkstra
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+lazy = GraphLoader.load_from_csv("data/sample_medium.csv", lazy_attributes=True)
+print(type(lazy).__name__, "nodes:", len(lazy.nodes), "edges:", len(lazy.edges))
+
+# Traversals only need the topology and leave attributes unloaded
+assert bfs(lazy, 1) == bfs(graph, 1)
+assert connected_components(lazy) == connected_components(graph)
+assert lazy.attributes_pending
+
+# Reading one attribute loads just that node's row
+assert lazy.nodes[7].activity == graph.nodes[7].activity
+assert lazy.nodes[7].interaction == graph.nodes[7].interaction
+assert lazy.attributes_pending
+
+# Weighted algorithms load everything and compute the weights first
+assert dijkstra(lazy, 1) == dijkstra(graph, 1)
+assert not lazy.attributes_pending
+assert {k: e.weight for k, e in lazy.edges.items()} == {k: e.weight for k, e in graph.edges.items()}
+assert lazy.nodes[50].connection_count == graph.nodes[50].connection_count
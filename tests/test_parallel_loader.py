@@ -0,0 +1,30 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+
+if __name__ == "__main__":
+    print("Parsing data/sample_medium.csv with 3 worker processes:")
+    parallel = GraphLoader.load_from_csv("data/sample_medium.csv", workers=3)
+    graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+
+    print("Nodes:", len(parallel.nodes), "Edges:", len(parallel.edges))
+    assert set(parallel.nodes) == set(graph.nodes)
+    assert {k: e.weight for k, e in parallel.edges.items()} == {k: e.weight for k, e in graph.edges.items()}
+    for nid, node in graph.nodes.items():
+        other = parallel.nodes[nid]
+        assert (node.activity, node.interaction, node.connection_count) == (
+            other.activity, other.interaction, other.connection_count
+        )
+
+    print("Building a FrozenGraph straight from the parsed arrays:")
+    frozen = GraphLoader.load_from_csv("data/sample_medium.csv", workers=3, frozen=True)
+    expected = graph.freeze()
+    print(frozen)
+    for name in ("ids", "indptr", "indices", "weights", "activity", "interaction", "connection_count"):
+        assert (getattr(frozen, name) == getattr(expected, name)).all(), name
+    plain = GraphLoader.load_from_csv(
+        "data/sample_medium.csv", workers=3, frozen=True, weight_formula=lambda a, b: a.activity + b.activity
+    )
+    u, v, w = plain.edge_arrays()
+    assert all(wi == graph.nodes[ui].activity + graph.nodes[vi].activity for ui, vi, wi in zip(u, v, w))
@@ -0,0 +1,45 @@
+import sys, os, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+from models.parse_cache import ParseCache
+
+cache = ParseCache(tempfile.mkdtemp())
+
+parsed = GraphLoader.load_from_csv("data/sample_medium.csv", cache=cache)
+cached = GraphLoader.load_from_csv("data/sample_medium.csv", cache=cache)
+print("Cache entries:", os.listdir(cache.directory))
+assert len(os.listdir(cache.directory)) == 1
+
+# A cached graph iterates exactly like the parsed one
+assert list(cached.nodes) == list(parsed.nodes)
+assert list(cached.edges) == list(parsed.edges)
+for nid, neighbors in parsed.adjacency.items():
+    assert list(cached.adjacency[nid].items()) == list(neighbors.items())
+    assert cached.nodes[nid].interaction == parsed.nodes[nid].interaction
+
+# A different formula is a different entry; plain callables are not cached
+formula = GraphLoader.create_custom_weight_formula(["activity"])
+GraphLoader.load_from_csv("data/sample_medium.csv", weight_formula=formula, cache=cache)
+GraphLoader.load_from_csv("data/sample_medium.csv", weight_formula=lambda n1, n2: 1.0, cache=cache)
+assert len(os.listdir(cache.directory)) == 2
+
+# Shrinking the budget evicts the least recently used entry first
+GraphLoader.load_from_csv("data/sample_medium.csv", cache=cache)
+sizes = [os.path.getsize(os.path.join(cache.directory, name)) for name in os.listdir(cache.directory)]
+ParseCache(cache.directory, max_bytes=max(sizes)).evict()
+print("After eviction:", os.listdir(cache.directory))
+assert len(os.listdir(cache.directory)) == 1
+assert GraphLoader.load_from_csv("data/sample_medium.csv", cache=cache) is not None
+
+# A truncated or corrupt entry is a miss: it is deleted and reparsed
+(entry,) = os.listdir(cache.directory)
+entry_path = os.path.join(cache.directory, entry)
+for damage in (lambda data: data[: len(data) // 2], lambda data: b"garbage"):
+    with open(entry_path, "rb") as f:
+        data = f.read()
+    with open(entry_path, "wb") as f:
+        f.write(damage(data))
+    assert cache.get(entry[:-len(".npz")]) is None and not os.path.exists(entry_path)
+    reloaded = GraphLoader.load_from_csv("data/sample_medium.csv", cache=cache)
+    assert list(reloaded.edges) == list(parsed.edges) and os.path.exists(entry_path)
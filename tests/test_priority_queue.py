@@ -0,0 +1,57 @@
+import sys, os, random
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.dijkstra import dijkstra, dijkstra_to
+from algorithms.priority_queue import BucketQueue, IndexedHeap, min_edge_weight
+from models.generators import erdos_renyi, node_attributes, to_graph
+from models.graph_loader import GraphLoader
+
+# Decrease-key keeps one entry per item and pops in priority order
+rng = random.Random(3)
+heap = IndexedHeap()
+expected = {}
+for _ in range(2000):
+    item, priority = rng.randrange(300), rng.random()
+    changed = heap.push(item, priority)
+    assert changed == (item not in expected or priority < expected[item])
+    if changed:
+        expected[item] = priority
+assert len(heap) == len(expected)
+assert heap.peek() == min((p, i) for i, p in expected.items())
+popped = [heap.pop() for _ in range(len(heap))]
+assert [p for p, _ in popped] == sorted(expected.values())
+assert {i: p for p, i in popped} == expected and not heap
+print(f"IndexedHeap: {len(popped)} unique items popped in order")
+
+# Bucket queue: exact Dijkstra when the width does not exceed the smallest weight
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+edges = erdos_renyi(2000, 8000, seed=5)
+generated = to_graph(2000, edges, node_attributes(2000, edges, seed=5))
+for g in (graph, generated):
+    width = min_edge_weight(g)
+    assert 0 < width <= 1
+    distances, _ = dijkstra(g, 1)
+    bucket_distances, bucket_previous = dijkstra(g, 1, bucket_width=width)
+    assert all(abs(bucket_distances[n] - distances[n]) < 1e-12 for n in g.nodes)
+    for target in (2, 64, 100):
+        sparse, _ = dijkstra_to(g, 1, target, bucket_width=width)
+        assert abs(sparse[target] - distances[target]) < 1e-12
+    # Paths follow real edges and add up to the distance
+    node = 100
+    while bucket_previous[node] is not None:
+        parent = bucket_previous[node]
+        assert abs(bucket_distances[parent] + g.get_edge_weight(parent, node) - bucket_distances[node]) < 1e-12
+        node = parent
+    print(f"BucketQueue (width {width:.4f}) matches IndexedHeap on {len(g.nodes)} nodes")
+
+queue = BucketQueue(0.5)
+for item, priority in ((1, 0.7), (2, 0.2), (3, 1.4), (1, 0.3)):
+    queue.push(item, priority)
+assert len(queue) == 3 and queue.priority(1) == 0.3
+assert sorted([queue.pop(), queue.pop()]) == [(0.2, 2), (0.3, 1)]
+assert queue.pop() == (1.4, 3) and not queue
+try:
+    BucketQueue(0.0)
+    raise AssertionError("zero bucket width accepted")
+except ValueError:
+    pass
@@ -0,0 +1,88 @@
+import sys, os, random, tempfile
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.bfs import bfs
+from algorithms.dijkstra import dijkstra, reconstruct_path
+from algorithms.pruned_landmark_labeling import PrunedLandmarkLabeling
+from models.generators import node_attributes, stochastic_block, to_graph
+from models.graph_loader import GraphLoader
+
+
+def hop_distances(graph, start):
+    """Unweighted distances by BFS layers."""
+    distances = {start: 0}
+    frontier = [start]
+    while frontier:
+        next_frontier = []
+        for u in frontier:
+            for v in graph.neighbors(u):
+                if v not in distances:
+                    distances[v] = distances[u] + 1
+                    next_frontier.append(v)
+        frontier = next_frontier
+    return distances
+
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+# Three communities with no edges between them: most pairs are unreachable
+edges = stochastic_block([300, 300, 300], 0.03, 0.0, seed=9)
+communities = to_graph(900, edges, node_attributes(900, edges, seed=9))
+
+# Labels are built from any graph surface, here the CSR form
+for g in (graph.freeze(), communities):
+    weighted = PrunedLandmarkLabeling.build(g, weighted=True)
+    unweighted = PrunedLandmarkLabeling.build(g)
+    print(weighted)
+    print(unweighted)
+
+    rng = random.Random(2)
+    nodes = sorted(g.nodes)
+    for start in rng.sample(nodes, 5):
+        distances, previous = dijkstra(g, start)
+        hops = hop_distances(g, start)
+        assert set(hops) == set(bfs(g, start))
+        for target in rng.sample(nodes, 30):
+            distance = weighted.distance(start, target)
+            assert distance == distances[target] or abs(distance - distances[target]) < 1e-9
+            assert weighted.path(start, target) == reconstruct_path(previous, start, target)
+
+            assert unweighted.distance(start, target) == hops.get(target, float("inf"))
+            path = unweighted.path(start, target)
+            if target in hops:
+                assert len(path) - 1 == hops[target] and path[0] == start and path[-1] == target
+                assert all(v in g.neighbors(u) for u, v in zip(path, path[1:]))
+            else:
+                assert path == []
+
+print("1 -> 64:", PrunedLandmarkLabeling.build(graph).distance(1, 64), "hops")
+assert unweighted.distance(1, 301) == float("inf") and unweighted.path(1, 301) == []
+assert weighted.distance(5, 5) == 0.0 and weighted.path(5, 5) == [5]
+
+# Built once per snapshot, saved and loaded without the graph
+snapshot = graph.snapshot()
+index = PrunedLandmarkLabeling.build(snapshot, weighted=True)
+with tempfile.TemporaryDirectory() as tmp:
+    path = os.path.join(tmp, "labels.npz")
+    index.save(path)
+    loaded = PrunedLandmarkLabeling.load(path)
+assert loaded.weighted and loaded.is_valid(snapshot)
+assert loaded.distance(1, 64) == index.distance(1, 64)
+assert loaded.path(1, 64) == index.path(1, 64)
+try:
+    loaded.distance(1, 5000)
+    raise AssertionError("unknown node accepted")
+except ValueError:
+    pass
+
+graph.remove_edge(*next(iter(graph.edges)))
+assert not loaded.is_valid(graph)
+
+# Labels built on a view go stale when the graph under the view changes
+view = communities.subgraph_view(range(1, 301))
+labels = PrunedLandmarkLabeling.build(view, weighted=True)
+assert labels.is_valid(view)
+communities.add_node(5000)
+assert labels.is_valid(view)
+for u, v in list(communities.edges):
+    communities.update_edge_weight(u, v, communities.get_edge_weight(u, v) * 0.01)
+assert not labels.is_valid(view)
@@ -0,0 +1,101 @@
+import sys, os
+import threading
+sys.path.append(os.path.abspath("src"))
+
+from algorithms.dijkstra import dijkstra
+from algorithms.welsh_powell import welsh_powell
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+expected_dist, _ = dijkstra(graph, 1)
+expected_edges = set(graph.edges)
+
+snap = graph.snapshot()
+print(snap)
+
+# Mutate the live graph while a reader works on the snapshot
+def writer():
+    for u, v in list(graph.edges)[:100]:
+        graph.update_edge_weight(u, v, 5.0)
+    for nid in range(1, 21):
+        graph.update_node(nid, activity=0.0)
+    graph.remove_node(2)
+    graph.add_node(1000)
+    graph.add_edge(1, 1000, 0.01)
+
+results = {}
+def reader():
+    results["dist"] = dijkstra(snap, 1)[0]
+    results["colors"] = welsh_powell(snap)
+
+threads = [threading.Thread(target=writer), threading.Thread(target=reader)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+
+assert results["dist"] == expected_dist
+# Node 2 is removed meanwhile, so it iterates last in the snapshot
+assert results["colors"] == welsh_powell(snap)
+assert set(snap.edges) == expected_edges
+assert all(results["colors"][u] != results["colors"][v] for u, v in expected_edges)
+assert dijkstra(snap, 1)[0] == expected_dist
+assert 2 in snap.nodes and 2 not in graph.nodes
+assert 1000 not in snap.nodes and graph.has_edge(1, 1000)
+assert snap.nodes[1].activity == 0.92 and graph.nodes[1].activity == 0.0
+assert sorted(snap.nodes[1].neighbors) != sorted(graph.nodes[1].neighbors)
+
+print("Snapshot version:", snap.version, "| graph version:", graph.version)
+print("Neighbors of 1 in snapshot:", sorted(snap.neighbors(1)))
+print("Neighbors of 1 in graph:   ", sorted(graph.neighbors(1)))
+
+# Snapshots taken from another thread while edges are being added never
+# see an edge in only one direction
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+stop = threading.Event()
+
+def edge_writer():
+    for i in range(2000):
+        graph.add_node(2000 + i)
+        graph.add_edge(1 + i % 100, 2000 + i, 0.5)
+    stop.set()
+
+torn = []
+def snapshot_reader():
+    while not stop.is_set():
+        snap = graph.snapshot()
+        for u, adjacent in snap.adjacency.items():
+            for v, weight in adjacent.items():
+                if snap.adjacency.get(v, {}).get(u) != weight or (min(u, v), max(u, v)) not in snap.edges:
+                    torn.append((u, v))
+
+threads = [threading.Thread(target=edge_writer), threading.Thread(target=snapshot_reader)]
+for t in threads:
+    t.start()
+for t in threads:
+    t.join()
+assert not torn, torn[:5]
+print("Concurrent snapshots: no torn edges")
+
+# Edits after a snapshot copy only the entries they touch, and every
+# live snapshot keeps the state it was taken at
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+nodes, edges, adjacency = graph.nodes, graph.edges, graph.adjacency
+original = graph.get_edge_weight(1, 3)
+older = graph.snapshot()
+graph.update_edge_weight(1, 3, 9.0)
+newer = graph.snapshot()
+graph.update_edge_weight(1, 3, 7.0)
+graph.remove_edge(1, 3)
+graph.add_node(999)
+assert graph.nodes is nodes and graph.edges is edges and graph.adjacency is adjacency
+assert older.get_edge_weight(1, 3) == original and older.edges[(1, 3)].weight == original
+assert newer.get_edge_weight(1, 3) == 9.0 and not graph.has_edge(1, 3)
+assert len(older.nodes) == len(newer.nodes) == 100 and 999 not in newer.nodes
+assert len(older.edges) == len(newer.edges) == len(graph.edges) + 1
+assert set(older.adjacency[1]) == set(newer.nodes[1].neighbors) == set(graph.neighbors(1)) | {3}
+
+graph.clear()
+assert len(graph.nodes) == 0 and len(older.nodes) == 100 and newer.has_edge(1, 3)
+graph.add_node(1)
+assert older.nodes[1].activity == 0.92 and len(newer.nodes) == 100
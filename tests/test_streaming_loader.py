@@ -0,0 +1,15 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+
+def report(rows, rate):
+    print(f"  {rows} rows read ({rate:,.0f} rows/sec)")
+
+print("Streaming data/sample_medium.csv in chunks of 25 rows:")
+streamed = GraphLoader.load_from_csv_streaming("data/sample_medium.csv", chunk_rows=25, progress=report)
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+
+print("Nodes:", len(streamed.nodes), "Edges:", len(streamed.edges))
+assert set(streamed.nodes) == set(graph.nodes)
+assert {k: e.weight for k, e in streamed.edges.items()} == {k: e.weight for k, e in graph.edges.items()}
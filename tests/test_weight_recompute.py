@@ -0,0 +1,36 @@
+import sys, os
+sys.path.append(os.path.abspath("src"))
+
+from models.graph_loader import GraphLoader
+
+graph = GraphLoader.load_from_csv("data/sample_medium.csv")
+original = {key: edge.weight for key, edge in graph.edges.items()}
+
+# Recomputing with the loader's formula changes nothing
+graph.recompute_edge_weights()
+assert all(graph.edges[key].weight == w for key, w in original.items())
+
+# Only edges around an updated node are touched
+graph.update_node(1, activity=0.1, interaction=3)
+count = graph.recompute_edge_weights([1])
+print("Edges recomputed after updating node 1:", count)
+print("New weight 1-2:", graph.get_edge_weight(1, 2), "(was", original[(1, 2)], ")")
+assert count == graph.degree(1)
+assert graph.get_edge_weight(2, 3) == original[(2, 3)]
+
+# Switch the whole graph to a new formula in one pass
+formula = GraphLoader.create_custom_weight_formula(["activity", "interaction"], [10.0, 0.5])
+graph.recompute_edge_weights(formula=formula)
+n1, n2 = graph.nodes[2], graph.nodes[3]
+print("Weight 2-3 under the new formula:", graph.get_edge_weight(2, 3))
+assert abs(graph.get_edge_weight(2, 3) - formula(n1, n2)) < 1e-12
+assert graph.adjacency[3][2] == graph.get_edge_weight(2, 3)
+
+# Loaders compute weights in one vectorized pass; plain callables still work
+loaded = GraphLoader.load_from_csv("data/sample_medium.csv")
+for (u, v), edge in loaded.edges.items():
+    assert abs(edge.weight - loaded.weight_formula(loaded.nodes[u], loaded.nodes[v])) < 1e-12
+custom = GraphLoader.load_from_csv(
+    "data/sample_medium.csv", weight_formula=lambda n1, n2: n1.activity + n2.activity
+)
+assert custom.get_edge_weight(1, 2) == custom.nodes[1].activity + custom.nodes[2].activity